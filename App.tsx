@@ -1,9 +1,13 @@
+// Imported first so startup marks are timed from the start of the bundle.
+import { markStartup } from './src/utils/startupTiming';
+import { exportTrace, setTracingEnabled } from './src/utils/trace';
 import React, { useCallback, useEffect, useState } from 'react';
-import { View, StyleSheet, StatusBar } from 'react-native';
+import { View, StyleSheet, StatusBar, InteractionManager, AppState } from 'react-native';
 import { NavigationContainer, DefaultTheme, DarkTheme } from '@react-navigation/native';
 import { SafeAreaProvider } from 'react-native-safe-area-context';
 import * as SplashScreen from 'expo-splash-screen';
 import * as Font from 'expo-font';
+import * as FileSystem from 'expo-file-system';
 import AppNavigator from './src/navigation/AppNavigator';
 import { useThemeStore } from './src/store/useThemeStore';
 import { useSubscriptionStore } from './src/store/useSubscriptionStore';
@@ -17,6 +21,18 @@ import {
 // Prevent splash screen from auto-hiding
 SplashScreen.preventAutoHideAsync();
 
+// Hot-path tracing (utils/trace): EXPO_PUBLIC_TRACING=1 records Gemini
+// calls, store mutations and screen renders, and writes the buffer (with
+// the startup phase marks) to trace.json in the document directory
+// whenever the app is backgrounded.
+const TRACING = process.env.EXPO_PUBLIC_TRACING === '1';
+const TRACE_PATH = `${FileSystem.documentDirectory}trace.json`;
+if (TRACING) setTracingEnabled(true);
+
+// Development tools (load test, parser checks) live in the dev menu. The
+// __DEV__ guard lets Metro drop the module from release bundles.
+if (__DEV__) require('./src/dev/devMenu');
+
 const CulinaDarkTheme = {
   ...DarkTheme,
   colors: {
@@ -51,26 +67,17 @@ export default function App() {
   );
   const setLoading = useSubscriptionStore((s) => s.setLoading);
 
+  // Only fonts gate the splash; everything else waits for first paint.
   useEffect(() => {
+    markStartup('app-mounted');
     async function prepare() {
       try {
-        // Load fonts
         await Font.loadAsync({
           'Inter-Regular': require('./assets/fonts/Inter-Regular.ttf'),
           'Inter-SemiBold': require('./assets/fonts/Inter-SemiBold.ttf'),
           'Inter-Bold': require('./assets/fonts/Inter-Bold.ttf'),
         });
-
-        // Configure RevenueCat
-        await configureRevenueCat();
-
-        // Fetch initial customer info
-        try {
-          const info = await getCustomerInfo();
-          updateFromCustomerInfo(info);
-        } catch {
-          setLoading(false);
-        }
+        markStartup('fonts-loaded');
       } catch (e) {
         console.warn('App prepare error:', e);
       } finally {
@@ -81,17 +88,50 @@ export default function App() {
     prepare();
   }, []);
 
-  // Listen for real-time subscription changes
+  // Subscription status: screens read the cached entitlement from the
+  // store straight away; RevenueCat is configured and revalidated once the
+  // first screen has settled, and kept in sync from then on.
+  useEffect(() => {
+    if (!appIsReady) return;
+    let cancelled = false;
+    let unsubscribe = () => {};
+    const task = InteractionManager.runAfterInteractions(async () => {
+      await configureRevenueCat();
+      if (cancelled) return;
+      markStartup('revenuecat-configured');
+      unsubscribe = onCustomerInfoUpdated((info) => {
+        updateFromCustomerInfo(info);
+      });
+      try {
+        updateFromCustomerInfo(await getCustomerInfo());
+        markStartup('entitlement-revalidated');
+      } catch {
+        setLoading(false);
+      }
+    });
+    return () => {
+      cancelled = true;
+      task.cancel();
+      unsubscribe();
+    };
+  }, [appIsReady]);
+
   useEffect(() => {
-    const unsubscribe = onCustomerInfoUpdated((info) => {
-      updateFromCustomerInfo(info);
+    if (!TRACING) return;
+    const subscription = AppState.addEventListener('change', (status) => {
+      if (status === 'active') return;
+      FileSystem.writeAsStringAsync(TRACE_PATH, exportTrace())
+        .then(() => console.log('Trace written to', TRACE_PATH))
+        .catch((e) => console.warn('Failed to write trace:', e));
     });
-    return unsubscribe;
+    return () => subscription.remove();
   }, []);
 
   const onLayoutRootView = useCallback(async () => {
     if (appIsReady) {
+      markStartup('first-layout');
       await SplashScreen.hideAsync();
+      markStartup('splash-hidden');
     }
   }, [appIsReady]);
 
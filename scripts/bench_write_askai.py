@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Benchmark the screen generator (write_askai.py) and emit JSON.
+
+Cases:
+  cold_import    interpreter startup vs. importing the generator, in fresh
+                 subprocesses
+  single_screen  compiling AskAIScreen with a cold and a warm template
+                 cache, and rendering it to memory
+  scaling        generating 1/10/100 synthetic screens into an empty output
+                 directory, serially (--jobs 1) and in parallel
+  noop           re-running the same N-screen build against the unchanged
+                 tree, which should write nothing
+
+Everything runs in a temporary directory with its own manifest and
+template cache, so the repo's src/screens/ and caches are never touched.
+Each timing is reported as min/median over --repeat runs.
+
+    python scripts/bench_write_askai.py --repeat 5 -o bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import tsx_template
+import write_askai
+
+SCREEN_COUNTS = (1, 10, 100)
+
+
+def summarize(samples):
+    return {
+        'min_ms': round(min(samples) * 1000, 3),
+        'median_ms': round(statistics.median(samples) * 1000, 3),
+        'runs': len(samples),
+    }
+
+
+def timed(fn, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def bench_cold_import(repeat):
+    def run(code):
+        subprocess.run([sys.executable, '-c', code], cwd=write_askai.SCRIPTS_DIR, check=True)
+
+    startup = timed(lambda: run('pass'), repeat)
+    total = timed(lambda: run('import write_askai'), repeat)
+    return {
+        'interpreter_startup': startup,
+        'startup_plus_import': total,
+        'import_only_median_ms': round(total['median_ms'] - startup['median_ms'], 3),
+    }
+
+
+def bench_single_screen(workdir, repeat):
+    template = os.path.join(write_askai.DEFAULT_TEMPLATES_DIR, 'AskAIScreen.tsx.tmpl')
+    cache_dir = os.path.join(workdir, 'single-cache')
+    params = write_askai.load_params(write_askai.DEFAULT_TEMPLATES_DIR)
+
+    compile_cold = timed(
+        lambda: tsx_template.load(template, cache_dir),
+        repeat,
+        setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True),
+    )
+    tsx_template.load(template, cache_dir)
+    load_warm = timed(lambda: tsx_template.load(template, cache_dir), repeat)
+    compiled = tsx_template.load(template, cache_dir)
+    render = timed(lambda: tsx_template.render(compiled.segments, params), repeat)
+    return {'compile_cold_cache': compile_cold, 'load_warm_cache': load_warm, 'render': render}
+
+
+def make_synthetic_templates(directory, count):
+    """Copy AskAIScreen.tsx.tmpl `count` times, each with distinct output."""
+    os.makedirs(directory)
+    src_dir = write_askai.DEFAULT_TEMPLATES_DIR
+    for name in os.listdir(src_dir):
+        if name.startswith('_') or name == write_askai.PARAMS_FILE:
+            shutil.copy(os.path.join(src_dir, name), directory)
+    with open(os.path.join(src_dir, 'AskAIScreen.tsx.tmpl'), encoding='utf-8') as f:
+        source = f.read()
+    for i in range(count):
+        with open(os.path.join(directory, f'Synthetic{i:03d}Screen.tsx.tmpl'), 'w', encoding='utf-8') as f:
+            f.write(f'// synthetic screen {i}\n' + source)
+    return write_askai.discover_templates(directory)
+
+
+def bench_scaling(workdir, repeat, jobs):
+    results = {}
+    for count in SCREEN_COUNTS:
+        base = os.path.join(workdir, f'n{count}')
+        templates = make_synthetic_templates(os.path.join(base, 'templates'), count)
+        out_dir = os.path.join(base, 'out')
+        manifest = os.path.join(base, 'manifest.json')
+        cache_dir = os.path.join(base, 'cache')
+
+        def reset():
+            for path in (out_dir, cache_dir):
+                shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(out_dir)
+            if os.path.exists(manifest):
+                os.unlink(manifest)
+
+        def build(n_jobs):
+            return lambda: write_askai.generate_all(
+                templates, out_dir, jobs=n_jobs, manifest_path=manifest, cache_dir=cache_dir
+            )
+
+        entry = {
+            'serial': timed(build(1), repeat, setup=reset),
+            'parallel': timed(build(jobs), repeat, setup=reset),
+        }
+        # The tree is now fully generated; rebuilding should be a no-op.
+        noop_written = sum(r['written'] for r in build(jobs)())
+        entry['noop_serial'] = timed(build(1), repeat)
+        entry['noop_parallel'] = timed(build(jobs), repeat)
+        entry['noop_files_written'] = noop_written
+        results[str(count)] = entry
+    return results
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=write_askai.REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case (default: 3)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='workers for parallel cases')
+    parser.add_argument('-o', '--output', help='write JSON here instead of stdout')
+    parser.add_argument('--skip', action='append', default=[], choices=['cold_import', 'single_screen', 'scaling'])
+    args = parser.parse_args(argv)
+
+    report = {
+        'revision': git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'jobs': args.jobs,
+        'repeat': args.repeat,
+    }
+    with tempfile.TemporaryDirectory(prefix='bench-write-askai-') as workdir:
+        if 'cold_import' not in args.skip:
+            report['cold_import'] = bench_cold_import(args.repeat)
+        if 'single_screen' not in args.skip:
+            report['single_screen'] = bench_single_screen(workdir, args.repeat)
+        if 'scaling' not in args.skip:
+            report['scaling'] = bench_scaling(workdir, args.repeat, args.jobs)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Minimal directory watcher for the screen generator's --watch mode.
+
+Uses Linux inotify through ctypes when it is available and falls back to
+polling (mtime + size) everywhere else, e.g. on macOS dev boxes. Both
+watchers expose the same interface:
+
+    watcher.wait(timeout) -> set of changed file paths (empty on timeout)
+    watcher.close()
+
+`debounced()` folds a burst of events -- an editor's save-as-rename, a
+`git checkout` touching several templates -- into one batch.
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Watch directories with inotify(7); only available on Linux."""
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(err, f'inotify_add_watch failed for {directory}')
+            self._dirs[wd] = directory
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buf):
+                wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+                offset += EVENT_HEADER.size
+                name = buf[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if wd in self._dirs and name:
+                    changed.add(os.path.join(self._dirs[wd], os.fsdecode(name)))
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback: rescan the directories and compare (mtime, size)."""
+
+    def __init__(self, directories, interval=0.5):
+        self._dirs = list(directories)
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self._dirs:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            previous, self._snapshot = self._snapshot, current
+            changed = {p for p in current.keys() | previous.keys() if current.get(p) != previous.get(p)}
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self._interval, remaining))
+
+    def close(self):
+        pass
+
+
+def open_watcher(directories, polling=False, interval=0.5):
+    """Return an inotify watcher if possible, otherwise a polling one."""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories, interval=interval)
+
+
+def debounced(watcher, quiet=0.2):
+    """Yield batches of changed paths, each closed after `quiet` idle seconds."""
+    while True:
+        batch = watcher.wait(3600)
+        if not batch:
+            continue
+        while True:
+            more = watcher.wait(quiet)
+            if not more:
+                break
+            batch |= more
+        yield batch
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Local, deterministic stand-in for the Gemini generateContent API.
+
+Speaks enough of the REST surface used by @google/genai for the app's
+service layer (src/services/gemini.ts) to run against it:
+
+  POST /v1beta/models/<model>:generateContent
+  POST /v1beta/models/<model>:streamGenerateContent?alt=sse
+  GET  /stats     request counts, errors and bytes served, per payload kind
+  POST /reset     zero the counters
+
+The payload is chosen from the prompt -- recipe search, cookbook matches,
+URL extraction, nutrition insights, quick ideas,
+image generation, transcription or chat -- and is derived from a hash of
+the request, so the same request always gets the same answer. Latency,
+error rate and payload size come from a profile and can be overridden:
+
+    python scripts/mock_gemini_server.py --profile typical --port 8765
+    EXPO_PUBLIC_GEMINI_BASE_URL=http://<host>:8765 npx expo start
+
+Pair it with src/dev/geminiLoadTest.ts to load-test the service layer.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+PROFILES = {
+    # latency_ms: mean time to a full response; jitter_ms: +/- uniform spread
+    'instant': {'latency_ms': 0, 'jitter_ms': 0, 'error_rate': 0.0, 'scale': 1, 'image_kb': 16},
+    'fast': {'latency_ms': 150, 'jitter_ms': 50, 'error_rate': 0.0, 'scale': 1, 'image_kb': 64},
+    'typical': {'latency_ms': 1200, 'jitter_ms': 600, 'error_rate': 0.01, 'scale': 1, 'image_kb': 400},
+    'slow': {'latency_ms': 4000, 'jitter_ms': 2000, 'error_rate': 0.02, 'scale': 1, 'image_kb': 900},
+    'flaky': {'latency_ms': 1200, 'jitter_ms': 1000, 'error_rate': 0.15, 'scale': 1, 'image_kb': 400},
+    'large': {'latency_ms': 1500, 'jitter_ms': 500, 'error_rate': 0.0, 'scale': 4, 'image_kb': 1500},
+}
+
+STREAM_CHUNKS = 8
+CATEGORIES = ['Produce', 'Meat & Seafood', 'Dairy & Eggs', 'Bakery', 'Pantry Staples',
+              'Spices & Seasonings', 'Frozen', 'Beverages', 'Other']
+CUISINES = ['Italian', 'Indian', 'Mexican', 'Asian', 'Mediterranean', 'American']
+DISHES = ['Risotto', 'Curry', 'Tacos', 'Stir Fry', 'Grain Bowl', 'Pasta Bake', 'Soup', 'Salad']
+INGREDIENTS = ['onion', 'garlic', 'tomato', 'rice', 'chicken thigh', 'spinach', 'chickpeas',
+               'olive oil', 'lemon', 'basil', 'parmesan', 'cumin', 'bell pepper', 'tofu']
+
+
+# ─── Payloads ─────────────────────────────────────────────────────────
+
+def recipe(rng, scale, i):
+    n_ing = 6 * scale
+    return {
+        'title': f'{rng.choice(CUISINES)} {rng.choice(DISHES)} #{i + 1}',
+        'description': 'A deterministic mock recipe. ' * scale,
+        'cuisine': rng.choice(CUISINES),
+        'estimatedTime': f'{rng.randrange(10, 90, 5)} min',
+        'difficulty': rng.choice(['Easy', 'Medium', 'Hard']),
+        'servings': rng.randint(1, 6),
+        'ingredients': [
+            {'name': rng.choice(INGREDIENTS), 'quantity': f'{rng.randint(1, 4)} cups',
+             'category': rng.choice(CATEGORIES)}
+            for _ in range(n_ing)
+        ],
+        'instructions': [f'Step {s + 1}: do the mock thing.' for s in range(5 * scale)],
+        'nutritionEstimate': {'calories': rng.randint(200, 900), 'protein': rng.randint(5, 60),
+                              'carbs': rng.randint(10, 120), 'fat': rng.randint(5, 50)},
+        'tags': rng.sample(['quick', 'healthy', 'one-pot', 'vegetarian', 'spicy'], 2),
+        'matchScore': 95 - i * 5,
+    }
+
+
+def grocery_item(rng):
+    return {'name': rng.choice(INGREDIENTS), 'quantity': f'{rng.randint(1, 3)} lbs',
+            'category': rng.choice(CATEGORIES)}
+
+
+def text_payload(kind, rng, scale):
+    if kind == 'recipes':
+        return json.dumps([recipe(rng, scale, i) for i in range(5)])
+    if kind == 'cookbook':
+        return json.dumps([{
+            'title': f'{rng.choice(DISHES)} {i + 1}', 'cookbookTitle': 'Mock Kitchen',
+            'cookbookAuthor': 'A. Cook', 'matchedIngredients': rng.sample(INGREDIENTS, 3),
+            'missingIngredients': rng.sample(INGREDIENTS, 1), 'matchPercentage': 90 - i * 7,
+            'description': 'Mock cookbook match.', 'estimatedTime': '30 min', 'pageNumber': f'p. {10 + i}',
+        } for i in range(6)])
+    if kind == 'extract':
+        r = recipe(rng, scale, 0)
+        return json.dumps({
+            'recipe': {**r, 'sourceUrl': 'https://example.com/mock', 'sourceTitle': 'Mock Blog',
+                       'prepTime': '15 min', 'cookTime': '30 min', 'totalTime': '45 min', 'tips': ['Mock tip']},
+            'groceryList': [grocery_item(rng) for _ in range(8 * scale)],
+            'totalEstimatedCost': '$20-30',
+        })
+    if kind == 'nutrition':
+        return json.dumps({
+            'summary': 'Balanced mock intake.', 'tips': ['Eat more greens.'] * 3, 'warnings': [],
+            'dailyScore': rng.randint(50, 95),
+            'macroBreakdown': {'protein': 25, 'carbs': 50, 'fat': 20, 'fiber': 5},
+            'recommendations': ['Try lentils.'] * scale,
+        })
+    if kind == 'quick':
+        return json.dumps([{'title': f'Quick {rng.choice(DISHES)}', 'description': 'Mock idea.',
+                            'time': '15 min', 'ingredients': rng.sample(INGREDIENTS, 3)} for _ in range(3)])
+    if kind == 'transcribe':
+        return 'how do I make a quick tomato soup'
+    # chat
+    return ' '.join(['Here is a mock answer about cooking.'] * (4 * scale))
+
+
+def png_bytes(seed, target_bytes):
+    """A valid PNG of roughly target_bytes (random pixels don't compress)."""
+    side = max(8, int((target_bytes / 3) ** 0.5))
+    rng = random.Random(seed)
+    rows = b''.join(b'\x00' + rng.randbytes(side * 3) for _ in range(side))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    header = struct.pack('>IIBBBBB', side, side, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(rows, 1)) + chunk(b'IEND', b''))
+
+
+def classify(model, body):
+    if 'image' in model:
+        return 'image'
+    text = ' '.join(
+        part.get('text', '')
+        for content in body.get('contents', [])
+        for part in (content.get('parts', []) if isinstance(content, dict) else [])
+    )
+    if body.get('systemInstruction'):
+        return 'chat'
+    for marker, kind in (
+        ('recipe recommender', 'recipes'),
+        ('cookbook encyclopedist', 'cookbook'),
+        ('recipe analyst', 'extract'),
+        ('nutritionist', 'nutrition'),
+        ('creative home chef', 'quick'),
+        ('Transcribe this audio', 'transcribe'),
+    ):
+        if marker in text:
+            return kind
+    return 'chat'
+
+
+def response_json(parts):
+    return {
+        'candidates': [{'content': {'role': 'model', 'parts': parts}, 'finishReason': 'STOP', 'index': 0}],
+        'usageMetadata': {'promptTokenCount': 0, 'candidatesTokenCount': 0, 'totalTokenCount': 0},
+        'modelVersion': 'mock',
+    }
+
+
+# ─── Server ───────────────────────────────────────────────────────────
+
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.by_kind = {}
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.by_kind = {}
+
+    def record(self, kind, status, nbytes):
+        with self.lock:
+            entry = self.by_kind.setdefault(kind, {'requests': 0, 'errors': 0, 'bytes': 0})
+            entry['requests'] += 1
+            entry['bytes'] += nbytes
+            if status != 200:
+                entry['errors'] += 1
+
+    def snapshot(self):
+        with self.lock:
+            total = sum(e['requests'] for e in self.by_kind.values())
+            return {'uptime_s': round(time.time() - self.started, 3), 'requests': total,
+                    'by_kind': json.loads(json.dumps(self.by_kind))}
+
+
+def make_handler(settings, stats):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, fmt, *args):
+            if settings['verbose']:
+                sys.stderr.write('%s - %s\n' % (self.address_string(), fmt % args))
+
+        def send_json(self, status, obj):
+            data = json.dumps(obj).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return len(data)
+
+        def do_GET(self):
+            if urlparse(self.path).path == '/stats':
+                self.send_json(200, stats.snapshot())
+            else:
+                self.send_json(404, {'error': {'code': 404, 'message': 'not found', 'status': 'NOT_FOUND'}})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length)
+            if url.path == '/reset':
+                stats.reset()
+                self.send_json(200, {'ok': True})
+                return
+
+            tail = url.path.rsplit('/models/', 1)[-1]
+            model, _, method = tail.partition(':')
+            if method not in ('generateContent', 'streamGenerateContent'):
+                self.send_json(404, {'error': {'code': 404, 'message': f'unknown method {method!r}',
+                                               'status': 'NOT_FOUND'}})
+                return
+            try:
+                body = json.loads(raw or b'{}')
+            except ValueError:
+                self.send_json(400, {'error': {'code': 400, 'message': 'invalid JSON', 'status': 'INVALID_ARGUMENT'}})
+                return
+
+            kind = classify(model, body)
+            digest = hashlib.sha256(model.encode() + raw).digest()
+            seed = int.from_bytes(digest[:8], 'big') ^ settings['seed']
+            rng = random.Random(seed)
+            # Timing and failures draw from a per-request stream so they vary
+            # between identical requests while payloads stay fixed.
+            with settings['lock']:
+                settings['counter'] += 1
+                timing = random.Random(settings['seed'] * 1_000_003 + settings['counter'])
+
+            delay = max(0.0, settings['latency_ms'] + timing.uniform(-1, 1) * settings['jitter_ms']) / 1000
+            if timing.random() < settings['error_rate']:
+                time.sleep(delay / 2)
+                status, error = timing.choice([(429, 'RESOURCE_EXHAUSTED'), (503, 'UNAVAILABLE')])
+                n = self.send_json(status, {'error': {'code': status, 'message': 'mock failure', 'status': error}})
+                stats.record(kind, status, n)
+                return
+
+            if kind == 'image':
+                data = base64.b64encode(png_bytes(seed, settings['image_kb'] * 1024)).decode()
+                parts = [{'inlineData': {'mimeType': 'image/png', 'data': data}}]
+            else:
+                parts = [{'text': text_payload(kind, rng, settings['scale'])}]
+
+            if method == 'generateContent':
+                time.sleep(delay)
+                stats.record(kind, 200, self.send_json(200, response_json(parts)))
+            else:
+                stats.record(kind, 200, self.stream(parts, delay))
+
+        def stream(self, parts, delay):
+            """Server-sent events, the text split over STREAM_CHUNKS chunks."""
+            if 'text' in parts[0]:
+                text = parts[0]['text']
+                step = max(1, -(-len(text) // STREAM_CHUNKS))
+                pieces = [[{'text': text[i:i + step]}] for i in range(0, len(text), step)]
+            else:
+                pieces = [parts]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            sent = 0
+            for piece in pieces:
+                time.sleep(delay / len(pieces))
+                event = f'data: {json.dumps(response_json(piece))}\n\n'.encode()
+                self.wfile.write(f'{len(event):x}\r\n'.encode() + event + b'\r\n')
+                self.wfile.flush()
+                sent += len(event)
+            self.wfile.write(b'0\r\n\r\n')
+            return sent
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0', help='bind address (default: all interfaces)')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='typical')
+    parser.add_argument('--latency', type=float, dest='latency_ms', help='mean latency in ms')
+    parser.add_argument('--jitter', type=float, dest='jitter_ms', help='latency spread in ms (+/-)')
+    parser.add_argument('--error-rate', type=float, help='fraction of requests that fail (429/503)')
+    parser.add_argument('--scale', type=int, help='payload size multiplier for text responses')
+    parser.add_argument('--image-kb', type=int, help='approximate size of generated images')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-v', '--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    settings = dict(PROFILES[args.profile])
+    for key in ('latency_ms', 'jitter_ms', 'error_rate', 'scale', 'image_kb'):
+        if getattr(args, key) is not None:
+            settings[key] = getattr(args, key)
+    settings.update(seed=args.seed, verbose=args.verbose, counter=0, lock=threading.Lock())
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(settings, Stats()))
+    server.daemon_threads = True
+    shown = {k: settings[k] for k in ('latency_ms', 'jitter_ms', 'error_rate', 'scale', 'image_kb')}
+    print(f'mock Gemini on http://{args.host}:{args.port} ({args.profile}: {shown})', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""Tiny template layer for the generated screens.
+
+Syntax (chosen so it can never collide with TSX/JSX braces):
+
+    {% name %}                  substitute a parameter (dotted paths allowed)
+    {% name | ts %}             ...rendered as a TS literal ('str', [..], true)
+    {% include frag a="x" b=y %} expand a fragment; quoted args are literal
+                                text, bare args refer to parameters
+    {% fragment frag(a, b="default") %} ... {% endfragment %}
+                                define a fragment (in `_*.tmpl` libraries)
+
+A template is compiled once into a flat list of segments -- literal strings
+and parameter references -- with every include already inlined. The compiled
+form is cached on disk under a key derived from the template and fragment
+sources, so rendering is just a walk over the segments, which iter_render()
+exposes as a stream of chunks.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import namedtuple
+
+ENGINE_VERSION = '2'
+
+TAG_RE = re.compile(r'\{%\s*(.*?)\s*%\}')
+FRAGMENT_RE = re.compile(r'fragment\s+(\w+)\s*\((.*?)\)$')
+ARG_RE = re.compile(r'''(\w+)\s*=\s*("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[\w.-]+)''')
+PARAM_RE = re.compile(r'([\w.]+)(?:\s*\|\s*(\w+))?$')
+
+
+class TemplateError(Exception):
+    pass
+
+
+# `libraries` lists the fragment libraries the template actually includes
+# from, so callers (e.g. watch mode) know which edits affect it.
+Compiled = namedtuple('Compiled', 'segments libraries')
+
+
+class Literal(str):
+    """A fragment argument given as quoted text rather than a parameter name."""
+
+
+def _unquote(value):
+    if value[:1] in ('"', "'"):
+        return Literal(re.sub(r'\\(.)', r'\1', value[1:-1]))
+    if re.fullmatch(r'-?\d+(\.\d+)?', value):
+        return Literal(value)
+    return value
+
+
+def parse_fragments(text, origin='<fragments>'):
+    """Return {name: (params, defaults, body)} for every fragment in `text`."""
+    fragments = {}
+    pos = 0
+    for m in TAG_RE.finditer(text):
+        if m.start() < pos:
+            continue
+        header = FRAGMENT_RE.match(m.group(1))
+        if not header:
+            continue
+        name, signature = header.groups()
+        end = text.find('{% endfragment %}', m.end())
+        if end == -1:
+            raise TemplateError(f'{origin}: fragment {name!r} is never closed')
+        body = text[m.end():end]
+        # Drop the newline after the opening tag and the indentation before
+        # the closing tag so fragments can be laid out as normal blocks.
+        if body.startswith('\n'):
+            body = body[1:]
+        last_nl = body.rfind('\n')
+        if last_nl != -1 and not body[last_nl + 1:].strip():
+            body = body[:last_nl]
+        params, defaults = [], {}
+        for part in filter(None, (p.strip() for p in signature.split(','))):
+            key, _, default = part.partition('=')
+            params.append(key.strip())
+            if default:
+                defaults[key.strip()] = _unquote(default.strip())
+        fragments[name] = (params, defaults, body)
+        pos = end + len('{% endfragment %}')
+    return fragments
+
+
+def _expand(text, bindings, fragments, stack, indent, out, used):
+    pos = 0
+    for m in TAG_RE.finditer(text):
+        _emit(out, text[pos:m.start()], indent)
+        pos = m.end()
+        tag = m.group(1)
+        if tag.startswith('include '):
+            name, _, rest = tag[len('include '):].strip().partition(' ')
+            if name not in fragments:
+                raise TemplateError(f'unknown fragment {name!r}')
+            if name in stack:
+                raise TemplateError(f'recursive include: {" -> ".join(stack + [name])}')
+            params, defaults, body = fragments[name]
+            used.add(name)
+            args = {k: _unquote(v) for k, v in ARG_RE.findall(rest)}
+            unknown = set(args) - set(params)
+            if unknown:
+                raise TemplateError(f'fragment {name!r} got unexpected args {sorted(unknown)}')
+            inner = {}
+            for p in params:
+                value = args.get(p, defaults.get(p))
+                if value is None:
+                    raise TemplateError(f'fragment {name!r} missing arg {p!r}')
+                # A bare name inside an include resolves through the caller's
+                # bindings first, so fragments can forward their own args.
+                inner[p] = value if isinstance(value, Literal) else bindings.get(value, value)
+            line_start = text.rfind('\n', 0, m.start()) + 1
+            prefix = text[line_start:m.start()]
+            child_indent = indent + prefix if prefix.strip() == '' else indent
+            _expand(body, inner, fragments, stack + [name], child_indent, out, used)
+            continue
+        pm = PARAM_RE.match(tag)
+        if not pm:
+            raise TemplateError(f'cannot parse tag {{% {tag} %}}')
+        name, filt = pm.groups()
+        bound = bindings.get(name)
+        if isinstance(bound, Literal):
+            if filt:
+                raise TemplateError(f'filter {filt!r} applied to literal arg {name!r}')
+            _emit(out, bound, indent)
+        else:
+            out.append([bound or name, filt])
+    _emit(out, text[pos:], indent)
+
+
+def _emit(out, literal, indent):
+    if not literal:
+        return
+    if indent:
+        literal = literal.replace('\n', '\n' + indent)
+    if out and isinstance(out[-1], str):
+        out[-1] += literal
+    else:
+        out.append(literal)
+
+
+def compile_template(source, fragments):
+    """Compile template `source`.
+
+    Returns (segments, used) -- the literal/param segments and the names of
+    every fragment that was included.
+    """
+    out, used = [], set()
+    _expand(source, {}, fragments, [], '', out, used)
+    return out, used
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def fragment_libraries(templates_dir):
+    """Paths of the `_*.tmpl` fragment libraries next to the templates."""
+    return sorted(
+        os.path.join(templates_dir, name)
+        for name in os.listdir(templates_dir)
+        if name.startswith('_') and name.endswith('.tmpl')
+    )
+
+
+def load(template_path, cache_dir):
+    """Return the Compiled form of `template_path`, using the disk cache.
+
+    The cache key hashes the template, every fragment library and the engine
+    version, so editing any of them invalidates the compiled form.
+    """
+    libraries = fragment_libraries(os.path.dirname(os.path.abspath(template_path)))
+    sources = [_read(template_path)] + [_read(p) for p in libraries]
+    digest = hashlib.sha256()
+    digest.update(ENGINE_VERSION.encode())
+    for s in sources:
+        digest.update(b'\0' + s.encode('utf-8'))
+    base = os.path.basename(template_path)
+    cache_path = os.path.join(cache_dir, f'{base}.{digest.hexdigest()[:16]}.json')
+    try:
+        with open(cache_path) as f:
+            return Compiled(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        pass
+
+    fragments, owner = {}, {}
+    for path, text in zip(libraries, sources[1:]):
+        parsed = parse_fragments(text, origin=path)
+        fragments.update(parsed)
+        owner.update(dict.fromkeys(parsed, path))
+    try:
+        segments, used = compile_template(sources[0], fragments)
+    except TemplateError as e:
+        raise TemplateError(f'{template_path}: {e}') from None
+    compiled = Compiled(segments, sorted({owner[name] for name in used}))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale in os.listdir(cache_dir):
+        if stale.startswith(base + '.') and stale.endswith('.json'):
+            try:
+                os.unlink(os.path.join(cache_dir, stale))
+            except OSError:
+                pass
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(compiled._asdict(), f)
+    os.replace(tmp, cache_path)
+    return compiled
+
+
+def _lookup(params, name):
+    value = params
+    for key in name.split('.'):
+        try:
+            value = value[key]
+        except (KeyError, TypeError):
+            raise TemplateError(f'undefined parameter {name!r}') from None
+    return value
+
+
+def to_ts(value):
+    """Render a JSON-ish Python value as a TypeScript literal."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, str):
+        return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(to_ts(v) for v in value) + ']'
+    if isinstance(value, dict):
+        return '{ ' + ', '.join(f'{k}: {to_ts(v)}' for k, v in value.items()) + ' }'
+    return str(value)
+
+
+FILTERS = {
+    'ts': to_ts,
+    'json': json.dumps,
+}
+
+
+def render(segments, params):
+    """Substitute `params` into compiled `segments` and return the text."""
+    return ''.join(iter_render(segments, params))
+
+
+def iter_render(segments, params):
+    """Yield the rendered text chunk by chunk, one per segment."""
+    for seg in segments:
+        if isinstance(seg, str):
+            yield seg
+            continue
+        name, filt = seg
+        value = _lookup(params, name)
+        if filt:
+            if filt not in FILTERS:
+                raise TemplateError(f'unknown filter {filt!r}')
+            yield FILTERS[filt](value)
+        else:
+            yield str(value)
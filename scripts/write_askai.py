@@ -1,671 +1,376 @@
 #!/usr/bin/env python3
+"""Generate screens under src/screens/ from the templates in scripts/templates/.
+
+Every `<Name>.tsx.tmpl` in the templates directory is rendered to
+`<out>/<Name>.tsx` (default: src/screens/, resolved relative to the repo).
+Templates are rendered in parallel across a process pool (`--jobs`), and a
+per-file timing report is printed at the end.
+
+Templates are compiled by tsx_template.py: shared fragments live in
+`_*.tmpl` libraries and parameters (theme tokens, cuisine list, accent
+colours) in `params.json`, both next to the templates. The compiled form is
+cached in scripts/.template_cache/ keyed by the template sources' hash.
+
+Runs incrementally: the generated output is hashed and compared with the
+file on disk (and a small manifest of previously written hashes), and the
+target is only rewritten when the content actually changed. That keeps the
+file's mtime stable so Metro does not re-bundle on a no-op run. Writes that
+do happen go through a temp file + rename so the bundler never sees a
+half-written screen.
+
+Output is never held in memory as a whole: templates render to a stream of
+chunks that is hashed in one pass and, only if it differs from disk,
+streamed again through a buffered writer into the temp file. The report
+includes byte/line counts per file and the peak RSS of the run.
+
+`--watch` keeps running after the first build and regenerates only the
+screens whose inputs (template, fragment libraries it includes, params.json)
+changed. It uses inotify on Linux and mtime+size polling elsewhere; bursts
+of saves are debounced into a single rebuild.
+"""
+import argparse
+import hashlib
+import json
 import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import fswatch
+import tsx_template
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_TEMPLATES_DIR = os.path.join(SCRIPTS_DIR, 'templates')
+DEFAULT_OUT_DIR = os.path.join(REPO_ROOT, 'src', 'screens')
+MANIFEST_PATH = os.path.join(SCRIPTS_DIR, '.write_askai_manifest.json')
+TEMPLATE_CACHE_DIR = os.path.join(SCRIPTS_DIR, '.template_cache')
+PARAMS_FILE = 'params.json'
+TEMPLATE_SUFFIX = '.tmpl'
+WRITE_BUFFER_SIZE = 64 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class StreamStats:
+    """Running sha256, byte and line count over a stream of byte chunks."""
+
+    __slots__ = ('_hash', 'bytes', 'lines')
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self.bytes = 0
+        self.lines = 0
+
+    def feed(self, chunk):
+        self._hash.update(chunk)
+        self.bytes += len(chunk)
+        self.lines += chunk.count(b'\n')
+
+    @property
+    def sha256(self):
+        return self._hash.hexdigest()
+
+
+def digest_stream(chunks):
+    """Consume `chunks` without writing anything; return their StreamStats."""
+    stats = StreamStats()
+    for chunk in chunks:
+        stats.feed(chunk)
+    return stats
 
-content = r'''import React, { useState, useRef, useCallback, useEffect } from 'react';
-import {
-  View,
-  Text,
-  StyleSheet,
-  ScrollView,
-  TextInput,
-  TouchableOpacity,
-  ActivityIndicator,
-  Alert,
-  Animated,
-  Image,
-  Dimensions,
-} from 'react-native';
-import { LinearGradient } from 'expo-linear-gradient';
-import * as Speech from 'expo-speech';
-import {
-  Search,
-  Sparkles,
-  Clock,
-  Users,
-  ShoppingCart,
-  ChevronDown,
-  ChevronUp,
-  Flame,
-  Star,
-  CheckCircle,
-  Volume2,
-  VolumeX,
-  Mic,
-  MicOff,
-  History,
-  ChefHat,
-  ImageIcon,
-  Trash2,
-  X,
-} from 'lucide-react-native';
-import { colors } from '../theme/colors';
-import { typography } from '../theme/typography';
-import { spacing, borderRadius } from '../theme/spacing';
-import { useThemeStore } from '../store/useThemeStore';
-import { usePantryStore } from '../store/usePantryStore';
-import { useCartStore } from '../store/useCartStore';
-import { useHistoryStore, HistoryRecipe } from '../store/useHistoryStore';
-import {
-  generateRecipesFromQuery,
-  generateRecipeImage,
-  AIRecipeSuggestion,
-} from '../services/gemini';
-import AppHeader from '../components/AppHeader';
-
-const { width: SCREEN_WIDTH } = Dimensions.get('window');
-const CUISINES = ['All', 'Indian', 'Italian', 'Asian', 'Mexican', 'Mediterranean', 'American'];
-type Tab = 'search' | 'history' | 'cooked';
-
-const AskAIScreen: React.FC = () => {
-  const isDark = useThemeStore((s) => s.isDarkMode);
-  const pantryIngredients = usePantryStore((s) => s.ingredients);
-  const addItemsForRecipe = useCartStore((s) => s.addItemsForRecipe);
-
-  const {
-    searchHistory, cookedItems,
-    addSearchEntry, removeSearchEntry, clearSearchHistory,
-    markAsCooked, clearCookedItems, isCooked,
-  } = useHistoryStore();
-
-  const [query, setQuery] = useState('');
-  const [cuisine, setCuisine] = useState('All');
-  const [loading, setLoading] = useState(false);
-  const [recipes, setRecipes] = useState<AIRecipeSuggestion[]>([]);
-  const [expandedRecipe, setExpandedRecipe] = useState<string | null>(null);
-  const [addedRecipes, setAddedRecipes] = useState<Set<string>>(new Set());
-  const [searched, setSearched] = useState(false);
-  const [activeTab, setActiveTab] = useState<Tab>('search');
-  const [speakingRecipeId, setSpeakingRecipeId] = useState<string | null>(null);
-  const [isListening, setIsListening] = useState(false);
-  const [imageStates, setImageStates] = useState<Record<string, { loading: boolean; base64?: string }>>({});
-
-  const pulseAnim = useRef(new Animated.Value(1)).current;
-
-  const bg = isDark ? colors.backgroundDark : colors.backgroundLight;
-  const cardBg = isDark ? colors.cardDark : colors.cardLight;
-  const textColor = isDark ? colors.textPrimary : colors.textDark;
-  const subtextColor = isDark ? colors.textSecondary : colors.textMuted;
-  const inputBg = isDark ? colors.cardDarkElevated : '#F1F5F9';
-  const accentPurple = '#8B5CF6';
-  const accentPurpleDark = '#6D28D9';
-
-  useEffect(() => {
-    if (isListening) {
-      const anim = Animated.loop(
-        Animated.sequence([
-          Animated.timing(pulseAnim, { toValue: 1.3, duration: 500, useNativeDriver: true }),
-          Animated.timing(pulseAnim, { toValue: 1, duration: 500, useNativeDriver: true }),
-        ]),
-      );
-      anim.start();
-      return () => anim.stop();
-    } else {
-      pulseAnim.setValue(1);
-    }
-  }, [isListening]);
 
-  const speakRecipe = useCallback((recipe: AIRecipeSuggestion) => {
-    if (speakingRecipeId === recipe.id) {
-      Speech.stop();
-      setSpeakingRecipeId(null);
-      return;
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def peak_rss_bytes(who='self'):
+    """Peak resident set size of this process (or its reaped children)."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    atomic_write(path, [json.dumps(manifest, indent=2, sort_keys=True).encode(), b'\n'])
+
+
+def atomic_write(path, chunks):
+    """Stream byte `chunks` into a temp file next to `path`, then rename it into place.
+
+    Returns the StreamStats of what was written.
+    """
+    stats = StreamStats()
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        # mkstemp creates 0600 files; keep the permissions a plain open() would give.
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp, mode)
+        with open(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                stats.feed(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return stats
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def is_up_to_date(path, digest, manifest):
+    """True when the file at `path` already holds content hashing to `digest`.
+
+    If the manifest entry matches the file's current size and mtime we trust
+    the recorded hash and skip reading the file entirely; otherwise the file
+    is read and hashed once, in fixed-size blocks.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    entry = manifest.get(os.path.abspath(path))
+    if entry and entry.get('size') == st.st_size and entry.get('mtime_ns') == st.st_mtime_ns:
+        return entry.get('sha256') == digest
+    return file_sha256(path) == digest
+
+
+def write_if_changed(path, render_chunks, manifest, force=False):
+    """Write the output of `render_chunks()` to `path` unless it is already there.
+
+    `render_chunks` is called once to hash the output and, only when the
+    target differs, a second time to stream it to disk -- re-rendering is
+    cheaper than buffering the whole file. Returns (written, stats).
+    """
+    stats = digest_stream(render_chunks())
+    changed = force or not is_up_to_date(path, stats.sha256, manifest)
+    if changed:
+        written = atomic_write(path, render_chunks())
+        if written.sha256 != stats.sha256:
+            raise RuntimeError(f'{path}: template output is not deterministic')
+    st = os.stat(path)
+    manifest[os.path.abspath(path)] = {
+        'sha256': stats.sha256,
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
     }
-    Speech.stop();
-    const ingredientsList = recipe.ingredients.map((ing) => ing.quantity + ' ' + ing.name).join(', ');
-    const stepsList = recipe.instructions.map((step, i) => 'Step ' + (i + 1) + ': ' + step).join('. ');
-    const text = recipe.title + '. ' + recipe.description +
-      '. Cuisine: ' + recipe.cuisine + '. Time: ' + recipe.estimatedTime +
-      '. Difficulty: ' + recipe.difficulty + '. Serves ' + recipe.servings +
-      '. Ingredients: ' + ingredientsList +
-      '. Instructions: ' + stepsList +
-      '. Nutrition: ' + recipe.nutritionEstimate.calories + ' calories, ' +
-      recipe.nutritionEstimate.protein + ' grams protein, ' +
-      recipe.nutritionEstimate.carbs + ' grams carbs, ' +
-      recipe.nutritionEstimate.fat + ' grams fat.';
-
-    setSpeakingRecipeId(recipe.id);
-    Speech.speak(text, {
-      language: 'en',
-      rate: 0.9,
-      pitch: 1.0,
-      onDone: () => setSpeakingRecipeId(null),
-      onStopped: () => setSpeakingRecipeId(null),
-      onError: () => setSpeakingRecipeId(null),
-    });
-  }, [speakingRecipeId]);
-
-  useEffect(() => { return () => { Speech.stop(); }; }, []);
-
-  const toggleListening = useCallback(() => {
-    if (isListening) { setIsListening(false); return; }
-    setIsListening(true);
-    Alert.alert(
-      '\uD83C\uDFA4 Voice Input',
-      'Voice recognition requires a native module.\nTry quick suggestions:',
-      [
-        { text: 'Cancel', onPress: () => setIsListening(false) },
-        { text: '"Butter Chicken"', onPress: () => { setQuery('Butter Chicken'); setIsListening(false); } },
-        { text: '"Quick Pasta"', onPress: () => { setQuery('Quick Pasta'); setIsListening(false); } },
-      ],
-    );
-    setTimeout(() => setIsListening(false), 5000);
-  }, [isListening]);
-
-  const handleSearch = async () => {
-    if (!query.trim()) return;
-    setLoading(true); setSearched(true); setExpandedRecipe(null); setImageStates({});
-    try {
-      const pantryNames = pantryIngredients.map((i) => i.name);
-      const results = await generateRecipesFromQuery(query.trim(), cuisine, pantryNames);
-      setRecipes(results);
-      const historyRecipes: HistoryRecipe[] = results.map((r) => ({
-        id: r.id, title: r.title, description: r.description,
-        cuisine: r.cuisine, estimatedTime: r.estimatedTime,
-        difficulty: r.difficulty, servings: r.servings, matchScore: r.matchScore,
-      }));
-      addSearchEntry({ query: query.trim(), cuisine, recipes: historyRecipes });
-      results.slice(0, 3).forEach((r) => generateImageForRecipe(r.id, r.title, r.description));
-    } catch (err: any) {
-      Alert.alert('Error', err.message || 'Failed to search recipes');
-    } finally { setLoading(false); }
-  };
-
-  const generateImageForRecipe = async (recipeId: string, title: string, description?: string) => {
-    setImageStates((prev) => ({ ...prev, [recipeId]: { loading: true } }));
-    try {
-      const base64 = await generateRecipeImage(title, description);
-      setImageStates((prev) => ({ ...prev, [recipeId]: { loading: false, base64: base64 || undefined } }));
-    } catch {
-      setImageStates((prev) => ({ ...prev, [recipeId]: { loading: false } }));
+    return changed, stats
+
+
+def discover_templates(templates_dir):
+    """Return sorted template paths in `templates_dir`."""
+    return sorted(
+        os.path.join(templates_dir, name)
+        for name in os.listdir(templates_dir)
+        if name.endswith(TEMPLATE_SUFFIX) and not name.startswith(('.', '_'))
+    )
+
+
+def output_path(template_path, out_dir):
+    return os.path.join(out_dir, os.path.basename(template_path)[: -len(TEMPLATE_SUFFIX)])
+
+
+def load_params(templates_dir):
+    try:
+        with open(os.path.join(templates_dir, PARAMS_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def renderer(template_path, cache_dir=TEMPLATE_CACHE_DIR):
+    """Return a zero-arg callable yielding the template's output as byte chunks."""
+    compiled = tsx_template.load(template_path, cache_dir)
+    params = load_params(os.path.dirname(os.path.abspath(template_path)))
+
+    def render_chunks():
+        for chunk in tsx_template.iter_render(compiled.segments, params):
+            yield chunk.encode('utf-8')
+
+    return render_chunks
+
+
+def template_inputs(template_path):
+    """Absolute paths of every file whose edits change `template_path`'s output."""
+    compiled = tsx_template.load(template_path, TEMPLATE_CACHE_DIR)
+    templates_dir = os.path.dirname(os.path.abspath(template_path))
+    return {
+        os.path.abspath(template_path),
+        os.path.join(templates_dir, PARAMS_FILE),
+        *(os.path.abspath(p) for p in compiled.libraries),
     }
-  };
-
-  const handleAddToCart = (recipe: AIRecipeSuggestion) => {
-    const items = recipe.ingredients.map((ing, idx) => ({
-      id: 'ai-cart-' + Date.now() + '-' + idx,
-      name: ing.name, quantity: ing.quantity, category: ing.category,
-      estimatedPrice: 3.0, notes: undefined,
-    }));
-    addItemsForRecipe(recipe.id, recipe.title, items);
-    setAddedRecipes((prev) => new Set(prev).add(recipe.id));
-    Alert.alert('Added!', recipe.title + ' ingredients added to cart.');
-  };
-
-  const handleMarkCooked = (recipe: AIRecipeSuggestion) => {
-    const img = imageStates[recipe.id]?.base64;
-    markAsCooked({ recipeId: recipe.id, recipeTitle: recipe.title, cuisine: recipe.cuisine, imageBase64: img });
-    Alert.alert('\uD83C\uDF89 Marked as Cooked!', '"' + recipe.title + '" added to your cooked history.');
-  };
-
-  const getDifficultyColor = (diff: string) => {
-    switch (diff) {
-      case 'Easy': return colors.secondary;
-      case 'Medium': return colors.warning;
-      case 'Hard': return colors.danger;
-      default: return colors.textSecondary;
+
+
+def generate(job):
+    """Render one template and write it if changed.
+
+    Runs inside a pool worker, so it takes and returns plain data: the
+    worker gets a read-only copy of the manifest and hands back the updated
+    entry for the parent to merge.
+    """
+    template_path, target, manifest, force, cache_dir = job
+    started = time.perf_counter()
+    render_chunks = renderer(template_path, cache_dir)
+    loaded = time.perf_counter()
+    written, stats = write_if_changed(target, render_chunks, manifest, force=force)
+    finished = time.perf_counter()
+    key = os.path.abspath(target)
+    return {
+        'template': template_path,
+        'target': target,
+        'written': written,
+        'bytes': stats.bytes,
+        'lines': stats.lines,
+        'pid': os.getpid(),
+        'load_ms': (loaded - started) * 1000,
+        'total_ms': (finished - started) * 1000,
+        'manifest_entry': manifest[key],
     }
-  };
-
-  const formatTimestamp = (ts: number) => {
-    const diff = Date.now() - ts;
-    const mins = Math.floor(diff / 60000);
-    if (mins < 1) return 'Just now';
-    if (mins < 60) return mins + 'm ago';
-    const hrs = Math.floor(mins / 60);
-    if (hrs < 24) return hrs + 'h ago';
-    const days = Math.floor(hrs / 24);
-    if (days < 7) return days + 'd ago';
-    return new Date(ts).toLocaleDateString();
-  };
-
-  const renderSearchTab = () => (
-    <>
-      <View style={[styles.searchCard, { backgroundColor: cardBg }]}>
-        <View style={styles.searchInputRow}>
-          <View style={[styles.searchRow, { backgroundColor: inputBg, flex: 1 }]}>
-            <Search size={18} color={subtextColor} />
-            <TextInput
-              style={[styles.searchInput, { color: textColor }]}
-              placeholder="What do you want to cook?"
-              placeholderTextColor={subtextColor}
-              value={query} onChangeText={setQuery}
-              onSubmitEditing={handleSearch} returnKeyType="search"
-            />
-          </View>
-          <Animated.View style={{ transform: [{ scale: pulseAnim }] }}>
-            <TouchableOpacity
-              onPress={toggleListening}
-              style={[styles.micBtn, { backgroundColor: isListening ? colors.danger : accentPurple }]}
-            >
-              {isListening ? <MicOff size={20} color={colors.white} /> : <Mic size={20} color={colors.white} />}
-            </TouchableOpacity>
-          </Animated.View>
-        </View>
-        <ScrollView horizontal showsHorizontalScrollIndicator={false} style={{ marginTop: spacing.sm }}>
-          {CUISINES.map((c) => (
-            <TouchableOpacity key={c} onPress={() => setCuisine(c)}
-              style={[styles.cuisineChip, {
-                backgroundColor: cuisine === c ? accentPurple : accentPurple + '15',
-                borderWidth: cuisine === c ? 0 : 1, borderColor: accentPurple + '30',
-              }]}>
-              <Text style={[typography.caption, {
-                color: cuisine === c ? colors.white : accentPurple,
-                fontFamily: cuisine === c ? 'Inter-SemiBold' : 'Inter-Regular',
-              }]}>{c}</Text>
-            </TouchableOpacity>
-          ))}
-        </ScrollView>
-        <TouchableOpacity onPress={handleSearch} disabled={loading || !query.trim()}>
-          <LinearGradient
-            colors={loading ? ['#94A3B8', '#64748B'] : [accentPurple, accentPurpleDark]}
-            start={{ x: 0, y: 0 }} end={{ x: 1, y: 0 }} style={styles.searchBtn}>
-            {loading ? (
-              <View style={styles.btnContent}>
-                <ActivityIndicator color={colors.white} size="small" />
-                <Text style={[typography.body, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>Gemini is cooking...</Text>
-              </View>
-            ) : (
-              <View style={styles.btnContent}>
-                <Sparkles size={20} color={colors.white} />
-                <Text style={[typography.body, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>Search with AI</Text>
-              </View>
-            )}
-          </LinearGradient>
-        </TouchableOpacity>
-      </View>
-
-      {searched && !loading && recipes.length > 0 && (
-        <View style={styles.aiBadge}>
-          <LinearGradient colors={[accentPurple + '20', colors.primary + '15']}
-            start={{ x: 0, y: 0 }} end={{ x: 1, y: 0 }} style={styles.aiBadgeGradient}>
-            <Sparkles size={14} color={accentPurple} />
-            <Text style={[typography.caption, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>
-              {recipes.length} recipes found by Gemini AI
-            </Text>
-          </LinearGradient>
-        </View>
-      )}
-
-      {recipes.map((r) => {
-        const isExpanded = expandedRecipe === r.id;
-        const isAdded = addedRecipes.has(r.id);
-        const isSpeaking = speakingRecipeId === r.id;
-        const recipeCooked = isCooked(r.id);
-        const imgState = imageStates[r.id];
-        return (
-          <View key={r.id} style={[styles.recipeCard, { backgroundColor: cardBg }]}>
-            {imgState?.base64 ? (
-              <Image source={{ uri: imgState.base64 }} style={styles.recipeImage} resizeMode="cover" />
-            ) : imgState?.loading ? (
-              <View style={[styles.recipeImagePlaceholder, { backgroundColor: inputBg }]}>
-                <ActivityIndicator size="small" color={accentPurple} />
-                <Text style={[typography.caption, { color: subtextColor, marginTop: 4 }]}>AI generating image...</Text>
-              </View>
-            ) : null}
-            <TouchableOpacity onPress={() => setExpandedRecipe(isExpanded ? null : r.id)} activeOpacity={0.7} style={{ padding: spacing.md }}>
-              <View style={styles.recipeTop}>
-                <View style={{ flex: 1 }}>
-                  <Text style={[typography.subtitle, { color: textColor }]}>{r.title}</Text>
-                  <Text style={[typography.caption, { color: subtextColor, marginTop: 2 }]}>{r.cuisine} cuisine</Text>
-                </View>
-                <View style={{ flexDirection: 'row', alignItems: 'center', gap: 8 }}>
-                  <TouchableOpacity onPress={() => speakRecipe(r)}
-                    style={[styles.iconBtn, { backgroundColor: isSpeaking ? colors.danger + '20' : accentPurple + '15' }]}>
-                    {isSpeaking ? <VolumeX size={16} color={colors.danger} /> : <Volume2 size={16} color={accentPurple} />}
-                  </TouchableOpacity>
-                  <View style={[styles.scoreBadge, { backgroundColor: colors.primary + '20' }]}>
-                    <Star size={12} color={colors.primary} />
-                    <Text style={[typography.caption, { color: colors.primary, fontFamily: 'Inter-Bold' }]}>{r.matchScore}%</Text>
-                  </View>
-                </View>
-              </View>
-              <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>{r.description}</Text>
-              <View style={styles.recipeMeta}>
-                <View style={styles.metaItem}><Clock size={14} color={subtextColor} /><Text style={[typography.caption, { color: subtextColor }]}>{r.estimatedTime}</Text></View>
-                <View style={styles.metaItem}><Users size={14} color={subtextColor} /><Text style={[typography.caption, { color: subtextColor }]}>{r.servings} servings</Text></View>
-                <View style={styles.metaItem}><Flame size={14} color={subtextColor} /><Text style={[typography.caption, { color: subtextColor }]}>{r.nutritionEstimate.calories} cal</Text></View>
-                <View style={[styles.diffBadge, { backgroundColor: getDifficultyColor(r.difficulty) + '20' }]}>
-                  <Text style={[typography.caption, { color: getDifficultyColor(r.difficulty), fontFamily: 'Inter-SemiBold' }]}>{r.difficulty}</Text>
-                </View>
-              </View>
-              <View style={{ alignItems: 'center', marginTop: spacing.xs }}>
-                {isExpanded ? <ChevronUp size={18} color={subtextColor} /> : <ChevronDown size={18} color={subtextColor} />}
-              </View>
-            </TouchableOpacity>
-            {isExpanded && (
-              <View style={[styles.expandedContent, { paddingHorizontal: spacing.md, paddingBottom: spacing.md }]}>
-                {!imgState?.base64 && !imgState?.loading && (
-                  <TouchableOpacity onPress={() => generateImageForRecipe(r.id, r.title, r.description)}
-                    style={[styles.generateImgBtn, { backgroundColor: accentPurple + '15' }]}>
-                    <ImageIcon size={16} color={accentPurple} />
-                    <Text style={[typography.bodySmall, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>Generate AI Image</Text>
-                  </TouchableOpacity>
-                )}
-                <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.sm }]}>
-                  Ingredients ({r.ingredients.length})
-                </Text>
-                {r.ingredients.map((ing, i) => (
-                  <View key={i} style={styles.ingredientRow}>
-                    <View style={[styles.dot, { backgroundColor: accentPurple }]} />
-                    <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{ing.name}</Text>
-                    <Text style={[typography.caption, { color: subtextColor }]}>{ing.quantity}</Text>
-                  </View>
-                ))}
-                <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.md }]}>
-                  Instructions
-                </Text>
-                {r.instructions.map((step, i) => (
-                  <View key={i} style={styles.stepRow}>
-                    <LinearGradient colors={[accentPurple, accentPurpleDark]} style={styles.stepNum}>
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-Bold' }]}>{i + 1}</Text>
-                    </LinearGradient>
-                    <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{step}</Text>
-                  </View>
-                ))}
-                <View style={[styles.nutritionRow, { backgroundColor: inputBg }]}>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>Calories</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>{r.nutritionEstimate.calories}</Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>Protein</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>{r.nutritionEstimate.protein}g</Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>Carbs</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>{r.nutritionEstimate.carbs}g</Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>Fat</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>{r.nutritionEstimate.fat}g</Text>
-                  </View>
-                </View>
-                <View style={styles.actionRow}>
-                  <TouchableOpacity onPress={() => handleAddToCart(r)} disabled={isAdded} style={{ flex: 1 }}>
-                    <LinearGradient colors={isAdded ? ['#22C55E', '#16A34A'] : [colors.primary, colors.primaryDark]} style={styles.actionBtn}>
-                      {isAdded ? <CheckCircle size={16} color={colors.white} /> : <ShoppingCart size={16} color={colors.white} />}
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
-                        {isAdded ? 'In Cart' : 'Add to Cart'}
-                      </Text>
-                    </LinearGradient>
-                  </TouchableOpacity>
-                  <TouchableOpacity onPress={() => handleMarkCooked(r)} disabled={recipeCooked} style={{ flex: 1 }}>
-                    <LinearGradient colors={recipeCooked ? ['#22C55E', '#16A34A'] : [accentPurple, accentPurpleDark]} style={styles.actionBtn}>
-                      {recipeCooked ? <CheckCircle size={16} color={colors.white} /> : <ChefHat size={16} color={colors.white} />}
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
-                        {recipeCooked ? 'Cooked!' : 'Mark Cooked'}
-                      </Text>
-                    </LinearGradient>
-                  </TouchableOpacity>
-                </View>
-                <TouchableOpacity onPress={() => speakRecipe(r)}
-                  style={[styles.ttsFullBtn, { backgroundColor: isSpeaking ? colors.danger + '15' : accentPurple + '10' }]}>
-                  {isSpeaking ? <VolumeX size={16} color={colors.danger} /> : <Volume2 size={16} color={accentPurple} />}
-                  <Text style={[typography.caption, {
-                    color: isSpeaking ? colors.danger : accentPurple, fontFamily: 'Inter-SemiBold',
-                  }]}>{isSpeaking ? 'Stop Reading' : 'Read Recipe Aloud'}</Text>
-                </TouchableOpacity>
-              </View>
-            )}
-          </View>
-        );
-      })}
-
-      {!searched && !loading && (
-        <View style={styles.emptyState}>
-          <LinearGradient colors={[accentPurple + '20', colors.primary + '10']} style={styles.emptyGradient}>
-            <Sparkles size={48} color={accentPurple} />
-            <Text style={[typography.subtitle, { color: textColor, marginTop: spacing.md, textAlign: 'center' }]}>
-              Ask AI Chef Anything
-            </Text>
-            <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs, textAlign: 'center' }]}>
-              {'Search for recipes, get personalized suggestions,\nand discover new dishes powered by Gemini AI'}
-            </Text>
-            <View style={styles.suggestionPills}>
-              {['Butter Chicken', 'Quick Pasta', 'Healthy Salad', 'Desserts'].map((s) => (
-                <TouchableOpacity key={s} onPress={() => setQuery(s)}
-                  style={[styles.suggestionPill, { backgroundColor: accentPurple + '15' }]}>
-                  <Text style={[typography.caption, { color: accentPurple }]}>{s}</Text>
-                </TouchableOpacity>
-              ))}
-            </View>
-          </LinearGradient>
-        </View>
-      )}
-
-      {searched && !loading && recipes.length === 0 && (
-        <View style={styles.emptyState}>
-          <Search size={48} color={subtextColor} />
-          <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>No recipes found. Try a different search!</Text>
-        </View>
-      )}
-    </>
-  );
-
-  const renderHistoryTab = () => (
-    <>
-      {searchHistory.length > 0 && (
-        <TouchableOpacity onPress={() => Alert.alert('Clear History', 'Remove all search history?', [
-          { text: 'Cancel', style: 'cancel' },
-          { text: 'Clear', style: 'destructive', onPress: clearSearchHistory },
-        ])} style={[styles.clearBtn, { backgroundColor: colors.danger + '15' }]}>
-          <Trash2 size={14} color={colors.danger} />
-          <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>Clear All History</Text>
-        </TouchableOpacity>
-      )}
-      {searchHistory.length === 0 && (
-        <View style={styles.emptyState}>
-          <History size={48} color={subtextColor} />
-          <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>No search history yet</Text>
-          <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>Your recipe searches will appear here</Text>
-        </View>
-      )}
-      {searchHistory.map((entry) => (
-        <View key={entry.id} style={[styles.historyCard, { backgroundColor: cardBg }]}>
-          <View style={styles.historyHeader}>
-            <View style={{ flex: 1 }}>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6 }}>
-                <Search size={14} color={accentPurple} />
-                <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>{'"' + entry.query + '"'}</Text>
-              </View>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6, marginTop: 2 }}>
-                <Clock size={12} color={subtextColor} />
-                <Text style={[typography.caption, { color: subtextColor }]}>{formatTimestamp(entry.timestamp)}</Text>
-                {entry.cuisine !== 'All' && (
-                  <View style={[styles.cuisineTag, { backgroundColor: accentPurple + '15' }]}>
-                    <Text style={[typography.caption, { color: accentPurple }]}>{entry.cuisine}</Text>
-                  </View>
-                )}
-              </View>
-            </View>
-            <TouchableOpacity onPress={() => removeSearchEntry(entry.id)} style={{ padding: 4 }}>
-              <X size={16} color={subtextColor} />
-            </TouchableOpacity>
-          </View>
-          <ScrollView horizontal showsHorizontalScrollIndicator={false} style={{ marginTop: spacing.sm }}>
-            {entry.recipes.map((recipe) => (
-              <View key={recipe.id} style={[styles.historyRecipeChip, { backgroundColor: inputBg }]}>
-                <View style={[styles.historyRecipeImgPlaceholder, { backgroundColor: accentPurple + '20' }]}>
-                  <Sparkles size={12} color={accentPurple} />
-                </View>
-                <View style={{ flex: 1 }}>
-                  <Text numberOfLines={1} style={[typography.caption, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>{recipe.title}</Text>
-                  <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>{recipe.cuisine} {recipe.estimatedTime}</Text>
-                </View>
-                <View style={[styles.miniScoreBadge, { backgroundColor: colors.primary + '20' }]}>
-                  <Text style={{ color: colors.primary, fontSize: 10, fontFamily: 'Inter-Bold' }}>{recipe.matchScore}%</Text>
-                </View>
-              </View>
-            ))}
-          </ScrollView>
-          <TouchableOpacity onPress={() => { setQuery(entry.query); setCuisine(entry.cuisine); setActiveTab('search'); }}
-            style={[styles.reSearchBtn, { backgroundColor: accentPurple + '10' }]}>
-            <Search size={14} color={accentPurple} />
-            <Text style={[typography.caption, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>Search Again</Text>
-          </TouchableOpacity>
-        </View>
-      ))}
-    </>
-  );
-
-  const renderCookedTab = () => (
-    <>
-      {cookedItems.length > 0 && (
-        <View style={[styles.cookedStats, { backgroundColor: cardBg }]}>
-          <LinearGradient colors={[colors.secondary + '20', colors.secondary + '05']} style={styles.cookedStatsGradient}>
-            <ChefHat size={24} color={colors.secondary} />
-            <View style={{ marginLeft: spacing.sm }}>
-              <Text style={[typography.h3, { color: textColor }]}>{cookedItems.length}</Text>
-              <Text style={[typography.caption, { color: subtextColor }]}>Recipes Cooked</Text>
-            </View>
-          </LinearGradient>
-        </View>
-      )}
-      {cookedItems.length > 0 && (
-        <TouchableOpacity onPress={() => Alert.alert('Clear Cooked', 'Remove all cooked history?', [
-          { text: 'Cancel', style: 'cancel' },
-          { text: 'Clear', style: 'destructive', onPress: clearCookedItems },
-        ])} style={[styles.clearBtn, { backgroundColor: colors.danger + '15' }]}>
-          <Trash2 size={14} color={colors.danger} />
-          <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>Clear Cooked History</Text>
-        </TouchableOpacity>
-      )}
-      {cookedItems.length === 0 && (
-        <View style={styles.emptyState}>
-          <ChefHat size={48} color={subtextColor} />
-          <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>Nothing cooked yet</Text>
-          <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>Mark recipes as cooked to track your journey</Text>
-        </View>
-      )}
-      <View style={styles.cookedGrid}>
-        {cookedItems.map((item) => (
-          <View key={item.id} style={[styles.cookedCard, { backgroundColor: cardBg }]}>
-            {item.imageBase64 ? (
-              <Image source={{ uri: item.imageBase64 }} style={styles.cookedImage} resizeMode="cover" />
-            ) : (
-              <LinearGradient colors={[accentPurple + '30', colors.primary + '20']} style={styles.cookedImagePlaceholder}>
-                <ChefHat size={28} color={accentPurple} />
-              </LinearGradient>
-            )}
-            <View style={{ padding: spacing.sm }}>
-              <Text numberOfLines={2} style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>{item.recipeTitle}</Text>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 4, marginTop: 4 }}>
-                <Clock size={10} color={subtextColor} />
-                <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>{formatTimestamp(item.cookedAt)}</Text>
-              </View>
-              <View style={[styles.cuisineTag, { backgroundColor: accentPurple + '15', marginTop: 4, alignSelf: 'flex-start' }]}>
-                <Text style={{ color: accentPurple, fontSize: 10, fontFamily: 'Inter-SemiBold' }}>{item.cuisine}</Text>
-              </View>
-            </View>
-          </View>
-        ))}
-      </View>
-    </>
-  );
-
-  return (
-    <View style={[styles.container, { backgroundColor: bg }]}>
-      <AppHeader title="Ask AI Chef" subtitle="Powered by Gemini" />
-      <View style={[styles.tabBar, { backgroundColor: cardBg }]}>
-        {([
-          { key: 'search' as Tab, label: 'Search', icon: Search, count: undefined },
-          { key: 'history' as Tab, label: 'History', icon: History, count: searchHistory.length || undefined },
-          { key: 'cooked' as Tab, label: 'Cooked', icon: ChefHat, count: cookedItems.length || undefined },
-        ]).map((tab) => {
-          const isActive = activeTab === tab.key;
-          const Icon = tab.icon;
-          return (
-            <TouchableOpacity key={tab.key} onPress={() => setActiveTab(tab.key)}
-              style={[styles.tabItem, isActive && { borderBottomColor: accentPurple, borderBottomWidth: 2 }]}>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6 }}>
-                <Icon size={16} color={isActive ? accentPurple : subtextColor} />
-                <Text style={[typography.bodySmall, {
-                  color: isActive ? accentPurple : subtextColor,
-                  fontFamily: isActive ? 'Inter-SemiBold' : 'Inter-Regular',
-                }]}>{tab.label}</Text>
-                {tab.count !== undefined && tab.count > 0 && (
-                  <View style={[styles.tabBadge, { backgroundColor: accentPurple }]}>
-                    <Text style={{ color: colors.white, fontSize: 10, fontFamily: 'Inter-Bold' }}>
-                      {tab.count > 99 ? '99+' : tab.count}
-                    </Text>
-                  </View>
-                )}
-              </View>
-            </TouchableOpacity>
-          );
-        })}
-      </View>
-      <ScrollView showsVerticalScrollIndicator={false}
-        contentContainerStyle={{ padding: spacing.md, paddingBottom: 120 }}>
-        {activeTab === 'search' && renderSearchTab()}
-        {activeTab === 'history' && renderHistoryTab()}
-        {activeTab === 'cooked' && renderCookedTab()}
-      </ScrollView>
-    </View>
-  );
-};
-
-const styles = StyleSheet.create({
-  container: { flex: 1 },
-  tabBar: { flexDirection: 'row', paddingHorizontal: spacing.md, borderBottomWidth: 1, borderBottomColor: colors.border + '30' },
-  tabItem: { flex: 1, paddingVertical: spacing.sm + 2, alignItems: 'center', justifyContent: 'center' },
-  tabBadge: { minWidth: 18, height: 18, borderRadius: 9, alignItems: 'center', justifyContent: 'center', paddingHorizontal: 4 },
-  searchCard: { padding: spacing.md, borderRadius: borderRadius.xl, gap: spacing.sm },
-  searchInputRow: { flexDirection: 'row', alignItems: 'center', gap: spacing.sm },
-  searchRow: { flexDirection: 'row', alignItems: 'center', borderRadius: borderRadius.lg, paddingHorizontal: spacing.sm, gap: spacing.sm, height: 48 },
-  searchInput: { flex: 1, fontSize: 15, fontFamily: 'Inter-Regular' },
-  micBtn: { width: 48, height: 48, borderRadius: borderRadius.lg, alignItems: 'center', justifyContent: 'center' },
-  cuisineChip: { paddingHorizontal: spacing.md, paddingVertical: spacing.xs + 2, borderRadius: borderRadius.full, marginRight: spacing.xs },
-  searchBtn: { borderRadius: borderRadius.lg, paddingVertical: 14, alignItems: 'center', justifyContent: 'center' },
-  btnContent: { flexDirection: 'row', alignItems: 'center', gap: 8 },
-  aiBadge: { marginTop: spacing.md, marginBottom: spacing.xs },
-  aiBadgeGradient: { flexDirection: 'row', alignItems: 'center', gap: 6, paddingVertical: spacing.xs + 2, paddingHorizontal: spacing.sm, borderRadius: borderRadius.full },
-  recipeCard: { borderRadius: borderRadius.xl, marginTop: spacing.sm, overflow: 'hidden' },
-  recipeImage: { width: '100%', height: 180 },
-  recipeImagePlaceholder: { width: '100%', height: 120, alignItems: 'center', justifyContent: 'center' },
-  recipeTop: { flexDirection: 'row', justifyContent: 'space-between', alignItems: 'flex-start' },
-  scoreBadge: { flexDirection: 'row', alignItems: 'center', gap: 4, paddingHorizontal: 8, paddingVertical: 4, borderRadius: borderRadius.full },
-  iconBtn: { width: 32, height: 32, borderRadius: borderRadius.full, alignItems: 'center', justifyContent: 'center' },
-  recipeMeta: { flexDirection: 'row', gap: spacing.sm, marginTop: spacing.sm, flexWrap: 'wrap', alignItems: 'center' },
-  metaItem: { flexDirection: 'row', alignItems: 'center', gap: 4 },
-  diffBadge: { paddingHorizontal: 8, paddingVertical: 2, borderRadius: borderRadius.full },
-  expandedContent: { borderTopWidth: 1, borderTopColor: colors.border + '30' },
-  generateImgBtn: { flexDirection: 'row', alignItems: 'center', justifyContent: 'center', gap: 8, paddingVertical: 10, borderRadius: borderRadius.md, marginTop: spacing.sm },
-  ingredientRow: { flexDirection: 'row', alignItems: 'center', gap: spacing.sm, paddingVertical: 3 },
-  dot: { width: 6, height: 6, borderRadius: 3 },
-  stepRow: { flexDirection: 'row', gap: spacing.sm, marginTop: spacing.xs, alignItems: 'flex-start' },
-  stepNum: { width: 22, height: 22, borderRadius: 11, alignItems: 'center', justifyContent: 'center' },
-  nutritionRow: { flexDirection: 'row', justifyContent: 'space-around', padding: spacing.md, borderRadius: borderRadius.lg, marginTop: spacing.md },
-  nutritionItem: { alignItems: 'center', gap: 2 },
-  actionRow: { flexDirection: 'row', gap: spacing.sm, marginTop: spacing.md },
-  actionBtn: { flexDirection: 'row', alignItems: 'center', justifyContent: 'center', gap: 6, paddingVertical: 11, borderRadius: borderRadius.md },
-  ttsFullBtn: { flexDirection: 'row', alignItems: 'center', justifyContent: 'center', gap: 8, paddingVertical: 10, borderRadius: borderRadius.md, marginTop: spacing.sm },
-  historyCard: { padding: spacing.md, borderRadius: borderRadius.xl, marginTop: spacing.sm },
-  historyHeader: { flexDirection: 'row', justifyContent: 'space-between', alignItems: 'flex-start' },
-  historyRecipeChip: { flexDirection: 'row', alignItems: 'center', gap: 8, padding: spacing.xs, borderRadius: borderRadius.md, marginRight: spacing.sm, width: 200 },
-  historyRecipeImgPlaceholder: { width: 36, height: 36, borderRadius: borderRadius.sm, alignItems: 'center', justifyContent: 'center' },
-  miniScoreBadge: { paddingHorizontal: 4, paddingVertical: 2, borderRadius: borderRadius.full },
-  cuisineTag: { paddingHorizontal: 6, paddingVertical: 2, borderRadius: borderRadius.full },
-  reSearchBtn: { flexDirection: 'row', alignItems: 'center', justifyContent: 'center', gap: 6, paddingVertical: 8, borderRadius: borderRadius.md, marginTop: spacing.sm },
-  clearBtn: { flexDirection: 'row', alignItems: 'center', justifyContent: 'center', gap: 6, paddingVertical: 8, borderRadius: borderRadius.md, alignSelf: 'flex-end' },
-  cookedStats: { borderRadius: borderRadius.xl, overflow: 'hidden' },
-  cookedStatsGradient: { flexDirection: 'row', alignItems: 'center', padding: spacing.md },
-  cookedGrid: { flexDirection: 'row', flexWrap: 'wrap', gap: spacing.sm, marginTop: spacing.sm },
-  cookedCard: { width: (SCREEN_WIDTH - spacing.md * 2 - spacing.sm) / 2, borderRadius: borderRadius.lg, overflow: 'hidden' },
-  cookedImage: { width: '100%', height: 120 },
-  cookedImagePlaceholder: { width: '100%', height: 120, alignItems: 'center', justifyContent: 'center' },
-  emptyState: { alignItems: 'center', marginTop: spacing.xxl, padding: spacing.xl },
-  emptyGradient: { alignItems: 'center', padding: spacing.xl, borderRadius: borderRadius.xxl, width: '100%' },
-  suggestionPills: { flexDirection: 'row', flexWrap: 'wrap', justifyContent: 'center', gap: spacing.xs, marginTop: spacing.md },
-  suggestionPill: { paddingHorizontal: spacing.md, paddingVertical: spacing.xs + 2, borderRadius: borderRadius.full },
-});
-
-export default AskAIScreen;
-'''
-
-target = os.path.join(os.path.dirname(__file__), '..', 'src', 'screens', 'AskAIScreen.tsx')
-target = '/Users/debasish/Desktop/MOBILEAPP/CulinaMind-AI/src/screens/AskAIScreen.tsx'
-with open(target, 'w') as f:
-    f.write(content)
-
-print(f'Written {len(content)} bytes to {target}')
+
+
+def generate_all(templates, out_dir, jobs=None, force=False,
+                 manifest_path=MANIFEST_PATH, cache_dir=TEMPLATE_CACHE_DIR):
+    """Generate every template into `out_dir`; returns one result per template."""
+    manifest = load_manifest(manifest_path)
+    work = [(t, output_path(t, out_dir), manifest, force, cache_dir) for t in templates]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) <= 1:
+        results = [generate(job) for job in work]
+    else:
+        # Forked workers inherit unflushed stdout; flush so nothing prints twice.
+        sys.stdout.flush()
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            results = list(pool.map(generate, work))
+    for result in results:
+        manifest[os.path.abspath(result['target'])] = result.pop('manifest_entry')
+    save_manifest(manifest, manifest_path)
+    return results
+
+
+def _mib(n):
+    return 'n/a' if n is None else f'{n / (1024 * 1024):.1f} MiB'
+
+
+def print_report(results, elapsed):
+    for r in results:
+        status = 'written' if r['written'] else 'unchanged'
+        target = os.path.relpath(r['target'], REPO_ROOT)
+        print(
+            f"{status:>9}  {r['total_ms']:8.1f} ms  (load {r['load_ms']:6.1f} ms)"
+            f"  {r['bytes']:>8} B  {r['lines']:>6} lines  {target}"
+        )
+    written = sum(r['written'] for r in results)
+    total_bytes = sum(r['bytes'] for r in results)
+    total_lines = sum(r['lines'] for r in results)
+    print(
+        f'{len(results)} screens, {written} written, {total_bytes} B / {total_lines} lines,'
+        f' {elapsed * 1000:.1f} ms total'
+    )
+    peak = f"peak RSS: {_mib(peak_rss_bytes('self'))} (main)"
+    if any(r['pid'] != os.getpid() for r in results):
+        peak += f", {_mib(peak_rss_bytes('children'))} (largest worker)"
+    print(peak)
+
+
+def select_templates(templates_dir, names):
+    templates = [os.path.abspath(t) for t in discover_templates(templates_dir)]
+    if names:
+        wanted = {n[: -len('.tsx')] if n.endswith('.tsx') else n for n in names}
+        templates = [t for t in templates if os.path.basename(t).split('.')[0] in wanted]
+    return templates
+
+
+def watch(args):
+    """Rebuild affected screens whenever their template inputs change."""
+    inputs = {}
+
+    def refresh(templates):
+        for t in templates:
+            try:
+                inputs[t] = template_inputs(t)
+            except (tsx_template.TemplateError, OSError):
+                # Broken template: rebuild it on its own next edit.
+                inputs[t] = {t}
+
+    refresh(select_templates(args.templates, args.names))
+    watcher = fswatch.open_watcher([os.path.abspath(args.templates)], polling=args.poll)
+    mode = 'polling' if isinstance(watcher, fswatch.PollingWatcher) else 'inotify'
+    print(f'Watching {os.path.relpath(args.templates)} ({mode}); Ctrl-C to stop')
+    try:
+        for batch in fswatch.debounced(watcher, quiet=args.debounce):
+            templates = select_templates(args.templates, args.names)
+            affected = [t for t in templates if t not in inputs or inputs[t] & batch]
+            if not affected:
+                continue
+            started = time.perf_counter()
+            try:
+                results = generate_all(affected, args.out, jobs=args.jobs)
+            except (tsx_template.TemplateError, OSError) as e:
+                print(f'error: {e}', file=sys.stderr)
+            else:
+                print_report(results, time.perf_counter() - started)
+            refresh(affected)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--templates', default=DEFAULT_TEMPLATES_DIR, help='directory of *.tsx.tmpl screen templates')
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR, help='output directory (default: src/screens)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='rewrite targets even if they are unchanged')
+    parser.add_argument('--watch', action='store_true', help='keep running and rebuild screens whose inputs change')
+    parser.add_argument('--poll', action='store_true', help='with --watch, poll mtimes instead of using inotify')
+    parser.add_argument('--debounce', type=float, default=0.2, help='with --watch, seconds of quiet before rebuilding')
+    parser.add_argument('names', nargs='*', help='only generate these screens (e.g. AskAIScreen)')
+    args = parser.parse_args(argv)
+
+    templates = select_templates(args.templates, args.names)
+    if not templates:
+        print(f'No templates found in {args.templates}', file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    started = time.perf_counter()
+    results = generate_all(templates, args.out, jobs=args.jobs, force=args.force)
+    print_report(results, time.perf_counter() - started)
+    if args.watch:
+        return watch(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,9 +7,14 @@
 const GEMINI_API_KEY =
   process.env.EXPO_PUBLIC_GEMINI_API_KEY || 'YOUR_GEMINI_API_KEY_HERE';
 
+// Optional: point the Gemini client at another endpoint, e.g. the local
+// stand-in from scripts/mock_gemini_server.py (http://<host>:8765).
+const GEMINI_BASE_URL = process.env.EXPO_PUBLIC_GEMINI_BASE_URL || '';
+
 export const config = {
   gemini: {
     apiKey: GEMINI_API_KEY,
+    baseUrl: GEMINI_BASE_URL,
     models: {
       flash: 'gemini-3-flash-preview',
       pro: 'gemini-3-pro-preview',
@@ -0,0 +1,38 @@
+/**
+ * Dev Menu — CulinaMind AI (development only)
+ * Adds the development tools to React Native's dev menu. App.tsx loads
+ * this module inside `if (__DEV__)`, so Metro drops it, and everything it
+ * imports, from release bundles.
+ *
+ *  • Run Gemini load test: see geminiLoadTest.ts. Also runs once on its
+ *    own when EXPO_PUBLIC_GEMINI_LOAD_TEST is set (to 1, or to a JSON
+ *    object of options).
+ *  • Run parser checks: see parserChecks.ts.
+ *  • Show startup timing: the startup phase marks so far.
+ */
+
+import { DevSettings, InteractionManager } from 'react-native';
+import { formatStartupMarks } from '../utils/startupTiming';
+import { runGeminiLoadTest, type LoadTestOptions } from './geminiLoadTest';
+import { runParserChecks } from './parserChecks';
+
+const LOAD_TEST_SPEC = process.env.EXPO_PUBLIC_GEMINI_LOAD_TEST;
+
+function loadTest(): void {
+  const options: LoadTestOptions = LOAD_TEST_SPEC && LOAD_TEST_SPEC !== '1' ? JSON.parse(LOAD_TEST_SPEC) : {};
+  runGeminiLoadTest(options)
+    .then((report) => console.log('Gemini load test:\n' + JSON.stringify(report, null, 2)))
+    .catch((e) => console.warn('Gemini load test failed:', e));
+}
+
+function parserChecks(): void {
+  const failures = runParserChecks();
+  if (failures.length === 0) console.log('Parser checks: all passed');
+  else console.warn(`Parser checks: ${failures.length} failed\n` + JSON.stringify(failures, null, 2));
+}
+
+DevSettings.addMenuItem('Run Gemini load test', loadTest);
+DevSettings.addMenuItem('Run parser checks', parserChecks);
+DevSettings.addMenuItem('Show startup timing', () => console.log('Startup timing:\n' + formatStartupMarks()));
+
+if (LOAD_TEST_SPEC) InteractionManager.runAfterInteractions(loadTest);
@@ -0,0 +1,177 @@
+/**
+ * Gemini Load Test — CulinaMind AI (development only)
+ * Drives the real service layer (caching, coalescing, concurrency lanes
+ * and all) at a fixed concurrency and reports latency percentiles and
+ * throughput per scenario. Meant to run against the local stand-in server:
+ *
+ *   python scripts/mock_gemini_server.py --profile typical
+ *   EXPO_PUBLIC_GEMINI_BASE_URL=http://<host>:8765 \
+ *   EXPO_PUBLIC_GEMINI_LOAD_TEST='{"concurrency":8,"requests":100}' npx expo start
+ *
+ * It runs from the dev menu (see devMenu.ts), and once at startup when
+ * EXPO_PUBLIC_GEMINI_LOAD_TEST is set, and logs the JSON report.
+ */
+
+import { config } from '../config/env';
+import {
+  chatWithGemini,
+  clearResponseCache,
+  combineGroceryLists,
+  generateRecipeImage,
+  generateRecipesFromQuery,
+  getResponseCacheStats,
+  getSchedulerStats,
+} from '../services/gemini';
+import { clearExtractionCache } from '../services/extractionCache';
+import { clearImageCache, getImageCacheStats } from '../services/imageCache';
+
+export type LoadScenario = 'recipes' | 'grocery' | 'image' | 'chat';
+
+export interface LoadTestOptions {
+  scenarios?: LoadScenario[];
+  /** Requests in flight at once, per scenario. */
+  concurrency?: number;
+  /** Requests issued per scenario. */
+  requests?: number;
+  /** Size of each scenario's input pool; repeats exercise caching/coalescing. */
+  distinctInputs?: number;
+  /** Clear the response and image caches before starting. */
+  clearCaches?: boolean;
+}
+
+export interface ScenarioReport {
+  requests: number;
+  errors: number;
+  wallMs: number;
+  throughputRps: number;
+  latencyMs: { p50: number; p95: number; p99: number; mean: number; max: number };
+}
+
+export interface LoadTestReport {
+  baseUrl: string;
+  options: Required<LoadTestOptions>;
+  scenarios: Partial<Record<LoadScenario, ScenarioReport>>;
+  responseCache: ReturnType<typeof getResponseCacheStats>;
+  imageCache: Awaited<ReturnType<typeof getImageCacheStats>>;
+  scheduler: ReturnType<typeof getSchedulerStats>;
+  /** GET /stats from the mock server, when reachable. */
+  server?: unknown;
+}
+
+const DEFAULTS: Required<LoadTestOptions> = {
+  scenarios: ['recipes', 'grocery', 'image', 'chat'],
+  concurrency: 8,
+  requests: 50,
+  distinctInputs: 10,
+  clearCaches: true,
+};
+
+const QUERIES = ['pasta', 'curry', 'tacos', 'soup', 'salad', 'stir fry', 'risotto', 'bowl'];
+
+/** One request for `scenario`, using input `i` of its pool. Returns false on a soft failure. */
+async function runOne(scenario: LoadScenario, i: number): Promise<boolean> {
+  const q = `${QUERIES[i % QUERIES.length]} ${i}`;
+  switch (scenario) {
+    case 'recipes':
+      return (await generateRecipesFromQuery(q, 'All', ['onion', 'garlic'])).length > 0;
+    case 'grocery':
+      return (await combineGroceryLists([`https://example.com/a/${i}`, `https://example.com/b/${i}`]))
+        .combinedList.length > 0;
+    case 'image':
+      return (await generateRecipeImage(`Mock ${q}`, 'load test')) !== null;
+    case 'chat':
+      return (
+        await chatWithGemini('load-test', `What goes well with ${q}?`, [
+          { role: 'user', text: 'Hi' },
+          { role: 'model', text: 'Hello! What are we cooking?' },
+        ])
+      ).length > 0;
+  }
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const rank = Math.ceil((p / 100) * sorted.length) - 1;
+  return sorted[Math.min(sorted.length - 1, Math.max(0, rank))];
+}
+
+const round = (ms: number) => Math.round(ms * 10) / 10;
+
+async function runScenario(scenario: LoadScenario, opts: Required<LoadTestOptions>): Promise<ScenarioReport> {
+  const latencies: number[] = [];
+  let errors = 0;
+  let next = 0;
+
+  const worker = async () => {
+    while (next < opts.requests) {
+      const n = next++;
+      const started = performance.now();
+      try {
+        if (!(await runOne(scenario, n % opts.distinctInputs))) errors++;
+      } catch {
+        errors++;
+      }
+      latencies.push(performance.now() - started);
+    }
+  };
+
+  const started = performance.now();
+  await Promise.all(Array.from({ length: Math.min(opts.concurrency, opts.requests) }, worker));
+  const wallMs = performance.now() - started;
+
+  latencies.sort((a, b) => a - b);
+  const total = latencies.reduce((sum, ms) => sum + ms, 0);
+  return {
+    requests: latencies.length,
+    errors,
+    wallMs: round(wallMs),
+    throughputRps: round((latencies.length / wallMs) * 1000),
+    latencyMs: {
+      p50: round(percentile(latencies, 50)),
+      p95: round(percentile(latencies, 95)),
+      p99: round(percentile(latencies, 99)),
+      mean: round(latencies.length ? total / latencies.length : 0),
+      max: round(latencies[latencies.length - 1] ?? 0),
+    },
+  };
+}
+
+/**
+ * Run each scenario in turn and return the combined report. Refuses to run
+ * against the real Gemini endpoint so a stray call can't burn API quota.
+ */
+export async function runGeminiLoadTest(options: LoadTestOptions = {}): Promise<LoadTestReport> {
+  if (!config.gemini.baseUrl) {
+    throw new Error('Set EXPO_PUBLIC_GEMINI_BASE_URL to the mock server before running the load test.');
+  }
+  const opts: Required<LoadTestOptions> = { ...DEFAULTS, ...options };
+  if (opts.clearCaches) {
+    clearResponseCache();
+    await clearImageCache();
+    await clearExtractionCache();
+  }
+  // Zero the mock server's counters so its stats cover just this run.
+  await fetch(`${config.gemini.baseUrl}/reset`, { method: 'POST' }).catch(() => {});
+
+  const scenarios: LoadTestReport['scenarios'] = {};
+  for (const scenario of opts.scenarios) {
+    scenarios[scenario] = await runScenario(scenario, opts);
+  }
+
+  let server: unknown;
+  try {
+    server = await (await fetch(`${config.gemini.baseUrl}/stats`)).json();
+  } catch {
+    // Not the mock server, or it has gone away.
+  }
+
+  return {
+    baseUrl: config.gemini.baseUrl,
+    options: opts,
+    scenarios,
+    responseCache: getResponseCacheStats(),
+    imageCache: await getImageCacheStats(),
+    scheduler: getSchedulerStats(),
+    server,
+  };
+}
@@ -0,0 +1,81 @@
+/**
+ * Parser Checks — CulinaMind AI (development only)
+ * Known-tricky inputs for the on-device parsers, each with the result it
+ * must produce. runParserChecks() runs them all and returns the failures
+ * (empty when everything passes); a failing case names its input, what
+ * was expected, and what came back.
+ */
+
+import { mergeIngredients, parseQuantity } from '../utils/ingredientMerge';
+import { extractJSON } from '../utils/jsonExtract';
+import { num, object, str } from '../utils/schema';
+
+export interface ParserCheckFailure {
+  check: string;
+  expected: unknown;
+  actual: unknown;
+}
+
+interface ParserCheck {
+  check: string;
+  expected: unknown;
+  run: () => unknown;
+}
+
+const mergedQuantities = (items: [name: string, quantity: string][]) =>
+  mergeIngredients(items.map(([name, quantity]) => ({ name, quantity }))).map((m) => `${m.key}: ${m.quantity}`);
+
+const recipeSchema = object({ title: str, servings: num });
+
+const CHECKS: ParserCheck[] = [
+  {
+    check: 'size words do not hide the count: "2 large eggs" + "3 eggs"',
+    expected: ['egg: 5'],
+    run: () => mergedQuantities([['eggs', '2 large eggs'], ['eggs', '3 eggs']]),
+  },
+  {
+    check: 'size words are not part of the name: "large eggs" + "extra-large eggs" + "eggs"',
+    expected: ['egg: 6'],
+    run: () => mergedQuantities([['large eggs', '2'], ['extra-large eggs', '1'], ['eggs', '3']]),
+  },
+  {
+    check: 'a package size is the unit: "1 (14 oz) can"',
+    expected: { amount: 14, unit: 'oz' },
+    run: () => parseQuantity('1 (14 oz) can'),
+  },
+  {
+    check: 'package sizes multiply and merge: "1 (14 oz) can" + "2 (14-oz) cans"',
+    expected: ['tomato: 2.63 lb'],
+    run: () => mergedQuantities([['diced tomatoes', '1 (14 oz) can'], ['diced tomatoes', '2 (14-oz) cans']]),
+  },
+  {
+    check: 'a parenthetical that is not a size is skipped: "2 (about) cloves"',
+    expected: { amount: 2, unit: 'clove' },
+    run: () => parseQuantity('2 (about) cloves'),
+  },
+  {
+    check: 'a stray bracket before the JSON does not stop extraction',
+    expected: { title: 'Soup', servings: 2 },
+    run: () => extractJSON('See step [1 below.\n{"title": "Soup", "servings": 2}', recipeSchema),
+  },
+  {
+    check: 'a later top-level object wins over one nested in broken JSON',
+    expected: { title: 'Outer', servings: 4 },
+    run: () =>
+      extractJSON('{broken {"title": "Inner", "servings": 1}} {"title": "Outer", "servings": 4}', recipeSchema),
+  },
+];
+
+export function runParserChecks(): ParserCheckFailure[] {
+  const failures: ParserCheckFailure[] = [];
+  for (const { check, expected, run } of CHECKS) {
+    let actual: unknown;
+    try {
+      actual = run();
+    } catch (error) {
+      actual = `threw ${String(error)}`;
+    }
+    if (JSON.stringify(actual) !== JSON.stringify(expected)) failures.push({ check, expected, actual });
+  }
+  return failures;
+}
@@ -2,14 +2,17 @@ import React from 'react';
 import { createNativeStackNavigator } from '@react-navigation/native-stack';
 import { RootStackParamList } from './types';
 
+import { lazyScreen } from './lazyScreen';
 import SplashScreen from '../screens/SplashScreen';
-import OnboardingScreen from '../screens/OnboardingScreen';
-import VoiceAssistantScreen from '../screens/VoiceAssistantScreen';
-import AddIngredientScreen from '../screens/AddIngredientScreen';
-import ShoppingListScreen from '../screens/ShoppingListScreen';
-import RecipeDetailsScreen from '../screens/RecipeDetailsScreen';
-import PaywallScreen from '../screens/PaywallScreen';
-import BottomTabNavigator from './BottomTabNavigator';
+
+// Everything past the splash loads on first navigation.
+const getOnboarding = lazyScreen('Onboarding', () => require('../screens/OnboardingScreen'));
+const getMainTabs = lazyScreen('MainTabs', () => require('./BottomTabNavigator'));
+const getVoiceAssistant = lazyScreen('VoiceAssistant', () => require('../screens/VoiceAssistantScreen'));
+const getAddIngredient = lazyScreen('AddIngredient', () => require('../screens/AddIngredientScreen'));
+const getShoppingList = lazyScreen('ShoppingList', () => require('../screens/ShoppingListScreen'));
+const getRecipeDetails = lazyScreen('RecipeDetails', () => require('../screens/RecipeDetailsScreen'));
+const getPaywall = lazyScreen('Paywall', () => require('../screens/PaywallScreen'));
 
 const Stack = createNativeStackNavigator<RootStackParamList>();
 
@@ -25,17 +28,17 @@ const AppNavigator = () => {
       <Stack.Screen name="Splash" component={SplashScreen} />
       <Stack.Screen
         name="Onboarding"
-        component={OnboardingScreen}
+        getComponent={getOnboarding}
         options={{ gestureEnabled: false }}
       />
       <Stack.Screen
         name="MainTabs"
-        component={BottomTabNavigator}
+        getComponent={getMainTabs}
         options={{ gestureEnabled: false }}
       />
       <Stack.Screen
         name="VoiceAssistant"
-        component={VoiceAssistantScreen}
+        getComponent={getVoiceAssistant}
         options={{
           animation: 'slide_from_bottom',
           presentation: 'modal',
@@ -43,28 +46,28 @@ const AppNavigator = () => {
       />
       <Stack.Screen
         name="AddIngredient"
-        component={AddIngredientScreen}
+        getComponent={getAddIngredient}
         options={{
           animation: 'slide_from_right',
         }}
       />
       <Stack.Screen
         name="ShoppingList"
-        component={ShoppingListScreen}
+        getComponent={getShoppingList}
         options={{
           animation: 'slide_from_right',
         }}
       />
       <Stack.Screen
         name="RecipeDetails"
-        component={RecipeDetailsScreen}
+        getComponent={getRecipeDetails}
         options={{
           animation: 'slide_from_right',
         }}
       />
       <Stack.Screen
         name="Paywall"
-        component={PaywallScreen}
+        getComponent={getPaywall}
         options={{
           animation: 'slide_from_bottom',
           presentation: 'modal',
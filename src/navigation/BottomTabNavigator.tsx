@@ -23,15 +23,17 @@ import { colors } from '../theme/colors';
 import { useThemeStore } from '../store/useThemeStore';
 import { useChatStore } from '../store/useChatStore';
 import { BottomTabParamList } from './types';
+import { lazyScreen } from './lazyScreen';
 
-import HomeScreen from '../screens/HomeScreen';
-import PantryScreen from '../screens/PantryScreen';
-import ImportScreen from '../screens/ImportScreen';
-import AskAIScreen from '../screens/AskAIScreen';
-import NutritionScreen from '../screens/NutritionScreen';
-import CartScreen from '../screens/CartScreen';
-import ProfileScreen from '../screens/ProfileScreen';
-import ChatBotScreen from '../screens/ChatBotScreen';
+// Tabs load the first time they are focused; the chat on first open.
+const getHome = lazyScreen('Home', () => require('../screens/HomeScreen'));
+const getPantry = lazyScreen('Pantry', () => require('../screens/PantryScreen'));
+const getImport = lazyScreen('Import', () => require('../screens/ImportScreen'));
+const getAskAI = lazyScreen('AskAI', () => require('../screens/AskAIScreen'));
+const getNutrition = lazyScreen('Nutrition', () => require('../screens/NutritionScreen'));
+const getCart = lazyScreen('Cart', () => require('../screens/CartScreen'));
+const getProfile = lazyScreen('Profile', () => require('../screens/ProfileScreen'));
+const getChatBot = lazyScreen('ChatBot', () => require('../screens/ChatBotScreen'));
 
 const Tab = createBottomTabNavigator<BottomTabParamList>();
 
@@ -77,6 +79,12 @@ const ChatFAB = () => {
   );
 };
 
+// Modal only renders its children while visible, so this first runs on open.
+const ChatBotModal = ({ onClose }: { onClose: () => void }) => {
+  const ChatBotScreen = getChatBot();
+  return <ChatBotScreen onClose={onClose} />;
+};
+
 // ─── Bottom Tab Navigator ───────────────────────────────────────────
 
 const BottomTabNavigator = () => {
@@ -114,7 +122,7 @@ const BottomTabNavigator = () => {
     >
       <Tab.Screen
         name="Home"
-        component={HomeScreen}
+        getComponent={getHome}
         options={{
           tabBarIcon: ({ color, size }) => (
             <Home size={size - 2} color={color} />
@@ -123,7 +131,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="Pantry"
-        component={PantryScreen}
+        getComponent={getPantry}
         options={{
           tabBarIcon: ({ color, size }) => (
             <Package size={size - 2} color={color} />
@@ -132,7 +140,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="Import"
-        component={ImportScreen}
+        getComponent={getImport}
         options={{
           tabBarIcon: ({ color, size }) => (
             <Download size={size - 2} color={color} />
@@ -141,7 +149,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="AskAI"
-        component={AskAIScreen}
+        getComponent={getAskAI}
         options={{
           tabBarLabel: 'Ask AI',
           tabBarIcon: ({ color, size }) => (
@@ -151,7 +159,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="Nutrition"
-        component={NutritionScreen}
+        getComponent={getNutrition}
         options={{
           tabBarIcon: ({ color, size }) => (
             <Activity size={size - 2} color={color} />
@@ -160,7 +168,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="Cart"
-        component={CartScreen}
+        getComponent={getCart}
         options={{
           tabBarIcon: ({ color, size }) => (
             <ShoppingCart size={size - 2} color={color} />
@@ -169,7 +177,7 @@ const BottomTabNavigator = () => {
       />
       <Tab.Screen
         name="Profile"
-        component={ProfileScreen}
+        getComponent={getProfile}
         options={{
           tabBarIcon: ({ color, size }) => (
             <UserCircle size={size - 2} color={color} />
@@ -188,7 +196,7 @@ const BottomTabNavigator = () => {
         presentationStyle="pageSheet"
         onRequestClose={closeChat}
       >
-        <ChatBotScreen onClose={closeChat} />
+        <ChatBotModal onClose={closeChat} />
       </Modal>
     </View>
   );
@@ -0,0 +1,23 @@
+import type { ComponentType } from 'react';
+import { markStartup } from '../utils/startupTiming';
+
+/**
+ * Deferred screen module for a navigator's `getComponent`. The screen's
+ * module (and everything it imports) is evaluated the first time the
+ * screen is shown rather than at app start, so startup cost does not grow
+ * with the number of screens. `load` must be a literal `require` call so
+ * the bundler still includes the module.
+ */
+export function lazyScreen(
+  name: string,
+  load: () => { default: ComponentType<any> },
+): () => ComponentType<any> {
+  let component: ComponentType<any> | null = null;
+  return () => {
+    if (!component) {
+      component = load().default;
+      markStartup(`screen:${name}`);
+    }
+    return component;
+  };
+}
@@ -1,9 +1,10 @@
-import React, { useState, useRef, useCallback, useEffect } from 'react';
+import React, { useState, useRef, useCallback, useEffect, useMemo, memo } from 'react';
 import {
   View,
   Text,
   StyleSheet,
   ScrollView,
+  FlatList,
   TextInput,
   TouchableOpacity,
   ActivityIndicator,
@@ -11,6 +12,7 @@ import {
   Animated,
   Image,
   Dimensions,
+  type ViewToken,
 } from 'react-native';
 import { LinearGradient } from 'expo-linear-gradient';
 import * as Speech from 'expo-speech';
@@ -40,36 +42,522 @@ import { colors } from '../theme/colors';
 import { typography } from '../theme/typography';
 import { spacing, borderRadius } from '../theme/spacing';
 import { useThemeStore } from '../store/useThemeStore';
-import { usePantryStore } from '../store/usePantryStore';
+import { usePantryStore, selectPantryNames } from '../store/usePantryStore';
 import { useCartStore } from '../store/useCartStore';
-import { useHistoryStore, type HistoryRecipe } from '../store/useHistoryStore';
 import {
-  generateRecipesFromQuery,
+  useHistoryStore,
+  selectSearchHistory,
+  selectCookedItems,
+  type HistoryRecipe,
+  type SearchHistoryEntry,
+  type CookedEntry,
+} from '../store/useHistoryStore';
+import {
+  streamRecipesFromQuery,
   generateRecipeImage,
-  transcribeAudio,
+  isAbortError,
   type AIRecipeSuggestion,
 } from '../services/gemini';
+import { startVoiceCapture, type VoiceCapture } from '../services/voiceCapture';
+import {
+  requestThumbnail,
+  setThumbnailPriority,
+  PRIORITY_OFFSCREEN,
+  PRIORITY_VISIBLE,
+} from '../services/imageQueue';
+import { pinImage, pinnedImageUri } from '../services/imageCache';
 import AppHeader from '../components/AppHeader';
+import { traceRender } from '../utils/trace';
 
 const { width: SCREEN_WIDTH } = Dimensions.get('window');
 const CUISINES = ['All', 'Indian', 'Italian', 'Asian', 'Mexican', 'Mediterranean', 'American'];
 type Tab = 'search' | 'history' | 'cooked';
 
+interface Palette {
+  cardBg: string;
+  textColor: string;
+  subtextColor: string;
+  inputBg: string;
+  accentPurple: string;
+  accentPurpleDark: string;
+}
+
+// `uri` is the full-size image; `thumb` the list thumbnail shown until it arrives.
+type ImageState = { loading: boolean; uri?: string; thumb?: string };
+
+const RECIPE_IMAGE_HEIGHT = 180;
+const recipeViewability = { itemVisiblePercentThreshold: 20 };
+
+// Fixed row heights let the history and cooked lists skip measuring.
+const HISTORY_CARD_HEIGHT = 166;
+const COOKED_CARD_HEIGHT = 218;
+const HISTORY_ROW_LENGTH = HISTORY_CARD_HEIGHT + spacing.sm;
+const COOKED_ROW_LENGTH = COOKED_CARD_HEIGHT + spacing.sm;
+
+const keyById = (item: { id: string }) => item.id;
+
+const historyItemLayout = (_: unknown, index: number) => ({
+  length: HISTORY_ROW_LENGTH,
+  offset: HISTORY_ROW_LENGTH * index,
+  index,
+});
+
+// With numColumns, `index` is the row index.
+const cookedItemLayout = (_: unknown, index: number) => ({
+  length: COOKED_ROW_LENGTH,
+  offset: COOKED_ROW_LENGTH * index,
+  index,
+});
+
+const formatTimestamp = (ts: number) => {
+  const diff = Date.now() - ts;
+  const mins = Math.floor(diff / 60000);
+  if (mins < 1) return 'Just now';
+  if (mins < 60) return mins + 'm ago';
+  const hrs = Math.floor(mins / 60);
+  if (hrs < 24) return hrs + 'h ago';
+  const days = Math.floor(hrs / 24);
+  if (days < 7) return days + 'd ago';
+  return new Date(ts).toLocaleDateString();
+};
+
+const getDifficultyColor = (diff: string) => {
+  switch (diff) {
+    case 'Easy': return colors.secondary;
+    case 'Medium': return colors.warning;
+    case 'Hard': return colors.danger;
+    default: return colors.textSecondary;
+  }
+};
+
+const RecipeCard = memo(function RecipeCard({
+  recipe: r,
+  isExpanded,
+  isAdded,
+  isSpeaking,
+  recipeCooked,
+  imgState,
+  palette,
+  onToggleExpand,
+  onSpeak,
+  onGenerateImage,
+  onAddToCart,
+  onMarkCooked,
+}: {
+  recipe: AIRecipeSuggestion;
+  isExpanded: boolean;
+  isAdded: boolean;
+  isSpeaking: boolean;
+  recipeCooked: boolean;
+  imgState?: ImageState;
+  palette: Palette;
+  onToggleExpand: (id: string) => void;
+  onSpeak: (recipe: AIRecipeSuggestion, isSpeaking: boolean) => void;
+  onGenerateImage: (recipe: AIRecipeSuggestion) => void;
+  onAddToCart: (recipe: AIRecipeSuggestion) => void;
+  onMarkCooked: (recipe: AIRecipeSuggestion, imageUri?: string) => void;
+}) {
+  const { cardBg, textColor, subtextColor, inputBg, accentPurple, accentPurpleDark } = palette;
+  return (
+    <View style={[styles.recipeCard, { backgroundColor: cardBg }]}>
+      {/* AI-generated image */}
+      {imgState?.uri ? (
+        <Image source={{ uri: imgState.uri }} style={styles.recipeImage} resizeMode="cover" />
+      ) : imgState?.thumb ? (
+        // The full image, decoded at card size
+        <Image
+          source={{ uri: imgState.thumb }}
+          style={styles.recipeImage}
+          resizeMode="cover"
+          resizeMethod="resize"
+        />
+      ) : imgState?.loading ? (
+        <View style={[styles.recipeImagePlaceholder, { backgroundColor: inputBg }]}>
+          <ActivityIndicator size="small" color={accentPurple} />
+          <Text style={[typography.caption, { color: subtextColor, marginTop: 4 }]}>
+            AI generating image...
+          </Text>
+        </View>
+      ) : null}
+
+      {/* Header + meta */}
+      <TouchableOpacity
+        onPress={() => {
+          // Full-size image only once the user opens the recipe
+          if (!isExpanded && !imgState?.uri && !imgState?.loading) onGenerateImage(r);
+          onToggleExpand(r.id);
+        }}
+        activeOpacity={0.7}
+        style={{ padding: spacing.md }}
+      >
+        <View style={styles.recipeTop}>
+          <View style={{ flex: 1 }}>
+            <Text style={[typography.subtitle, { color: textColor }]}>{r.title}</Text>
+            <Text style={[typography.caption, { color: subtextColor, marginTop: 2 }]}>
+              {r.cuisine} cuisine
+            </Text>
+          </View>
+          <View style={{ flexDirection: 'row', alignItems: 'center', gap: 8 }}>
+            {/* TTS quick toggle */}
+            <TouchableOpacity
+              onPress={() => onSpeak(r, isSpeaking)}
+              style={[
+                styles.iconBtn,
+                { backgroundColor: isSpeaking ? colors.danger + '20' : accentPurple + '15' },
+              ]}
+            >
+              {isSpeaking ? (
+                <VolumeX size={16} color={colors.danger} />
+              ) : (
+                <Volume2 size={16} color={accentPurple} />
+              )}
+            </TouchableOpacity>
+            <View style={[styles.scoreBadge, { backgroundColor: colors.primary + '20' }]}>
+              <Star size={12} color={colors.primary} />
+              <Text style={[typography.caption, { color: colors.primary, fontFamily: 'Inter-Bold' }]}>
+                {r.matchScore}%
+              </Text>
+            </View>
+          </View>
+        </View>
+
+        <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
+          {r.description}
+        </Text>
+
+        <View style={styles.recipeMeta}>
+          <View style={styles.metaItem}>
+            <Clock size={14} color={subtextColor} />
+            <Text style={[typography.caption, { color: subtextColor }]}>{r.estimatedTime}</Text>
+          </View>
+          <View style={styles.metaItem}>
+            <Users size={14} color={subtextColor} />
+            <Text style={[typography.caption, { color: subtextColor }]}>{r.servings} servings</Text>
+          </View>
+          <View style={styles.metaItem}>
+            <Flame size={14} color={subtextColor} />
+            <Text style={[typography.caption, { color: subtextColor }]}>
+              {r.nutritionEstimate.calories} cal
+            </Text>
+          </View>
+          <View style={[styles.diffBadge, { backgroundColor: getDifficultyColor(r.difficulty) + '20' }]}>
+            <Text
+              style={[
+                typography.caption,
+                { color: getDifficultyColor(r.difficulty), fontFamily: 'Inter-SemiBold' },
+              ]}
+            >
+              {r.difficulty}
+            </Text>
+          </View>
+        </View>
+
+        <View style={{ alignItems: 'center', marginTop: spacing.xs }}>
+          {isExpanded ? (
+            <ChevronUp size={18} color={subtextColor} />
+          ) : (
+            <ChevronDown size={18} color={subtextColor} />
+          )}
+        </View>
+      </TouchableOpacity>
+
+      {/* Expanded details */}
+      {isExpanded && (
+        <View style={[styles.expandedContent, { paddingHorizontal: spacing.md, paddingBottom: spacing.md }]}>
+          {/* Generate image button (if no image yet) */}
+          {!imgState?.uri && !imgState?.loading && (
+            <TouchableOpacity
+              onPress={() => onGenerateImage(r)}
+              style={[styles.generateImgBtn, { backgroundColor: accentPurple + '15' }]}
+            >
+              <ImageIcon size={16} color={accentPurple} />
+              <Text style={[typography.bodySmall, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>
+                Generate AI Image
+              </Text>
+            </TouchableOpacity>
+          )}
+
+          {/* Ingredients */}
+          <Text
+            style={[
+              typography.bodySmall,
+              { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.sm },
+            ]}
+          >
+            Ingredients ({r.ingredients.length})
+          </Text>
+          {r.ingredients.map((ing, i) => (
+            <View key={i} style={styles.ingredientRow}>
+              <View style={[styles.dot, { backgroundColor: accentPurple }]} />
+              <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{ing.name}</Text>
+              <Text style={[typography.caption, { color: subtextColor }]}>{ing.quantity}</Text>
+            </View>
+          ))}
+
+          {/* Instructions */}
+          <Text
+            style={[
+              typography.bodySmall,
+              { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.md },
+            ]}
+          >
+            Instructions
+          </Text>
+          {r.instructions.map((step, i) => (
+            <View key={i} style={styles.stepRow}>
+              <LinearGradient colors={[accentPurple, accentPurpleDark]} style={styles.stepNum}>
+                <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-Bold' }]}>
+                  {i + 1}
+                </Text>
+              </LinearGradient>
+              <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{step}</Text>
+            </View>
+          ))}
+
+          {/* Nutrition */}
+          <View style={[styles.nutritionRow, { backgroundColor: inputBg }]}>
+            <View style={styles.nutritionItem}>
+              <Text style={[typography.caption, { color: subtextColor }]}>🔥 Calories</Text>
+              <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
+                {r.nutritionEstimate.calories}
+              </Text>
+            </View>
+            <View style={styles.nutritionItem}>
+              <Text style={[typography.caption, { color: subtextColor }]}>💪 Protein</Text>
+              <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
+                {r.nutritionEstimate.protein}g
+              </Text>
+            </View>
+            <View style={styles.nutritionItem}>
+              <Text style={[typography.caption, { color: subtextColor }]}>🍞 Carbs</Text>
+              <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
+                {r.nutritionEstimate.carbs}g
+              </Text>
+            </View>
+            <View style={styles.nutritionItem}>
+              <Text style={[typography.caption, { color: subtextColor }]}>🧈 Fat</Text>
+              <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
+                {r.nutritionEstimate.fat}g
+              </Text>
+            </View>
+          </View>
+
+          {/* Action buttons */}
+          <View style={styles.actionRow}>
+            <TouchableOpacity
+              onPress={() => onAddToCart(r)}
+              disabled={isAdded}
+              style={{ flex: 1 }}
+            >
+              <LinearGradient
+                colors={isAdded ? ['#22C55E', '#16A34A'] : [colors.primary, colors.primaryDark]}
+                style={styles.actionBtn}
+              >
+                {isAdded ? (
+                  <CheckCircle size={16} color={colors.white} />
+                ) : (
+                  <ShoppingCart size={16} color={colors.white} />
+                )}
+                <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
+                  {isAdded ? 'In Cart' : 'Add to Cart'}
+                </Text>
+              </LinearGradient>
+            </TouchableOpacity>
+            <TouchableOpacity
+              onPress={() => onMarkCooked(r, imgState?.uri)}
+              disabled={recipeCooked}
+              style={{ flex: 1 }}
+            >
+              <LinearGradient
+                colors={recipeCooked ? ['#22C55E', '#16A34A'] : [accentPurple, accentPurpleDark]}
+                style={styles.actionBtn}
+              >
+                {recipeCooked ? (
+                  <CheckCircle size={16} color={colors.white} />
+                ) : (
+                  <ChefHat size={16} color={colors.white} />
+                )}
+                <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
+                  {recipeCooked ? 'Cooked!' : 'Mark Cooked'}
+                </Text>
+              </LinearGradient>
+            </TouchableOpacity>
+          </View>
+
+          {/* Full TTS button */}
+          <TouchableOpacity
+            onPress={() => onSpeak(r, isSpeaking)}
+            style={[
+              styles.ttsFullBtn,
+              { backgroundColor: isSpeaking ? colors.danger + '15' : accentPurple + '10' },
+            ]}
+          >
+            {isSpeaking ? (
+              <VolumeX size={16} color={colors.danger} />
+            ) : (
+              <Volume2 size={16} color={accentPurple} />
+            )}
+            <Text
+              style={[
+                typography.caption,
+                {
+                  color: isSpeaking ? colors.danger : accentPurple,
+                  fontFamily: 'Inter-SemiBold',
+                },
+              ]}
+            >
+              {isSpeaking ? 'Stop Reading' : 'Read Recipe Aloud'}
+            </Text>
+          </TouchableOpacity>
+        </View>
+      )}
+    </View>
+  );
+});
+
+// Memoized rows: the history store replaces only the entry it updates, so
+// unchanged rows keep their props and skip re-rendering.
+const HistoryEntryCard = memo(function HistoryEntryCard({
+  entry,
+  palette,
+  onRemove,
+  onSearchAgain,
+}: {
+  entry: SearchHistoryEntry;
+  palette: Palette;
+  onRemove: (id: string) => void;
+  onSearchAgain: (entry: SearchHistoryEntry) => void;
+}) {
+  const { cardBg, textColor, subtextColor, inputBg, accentPurple } = palette;
+  return (
+    <View style={[styles.historyCard, { backgroundColor: cardBg }]}>
+      <View style={styles.historyHeader}>
+        <View style={{ flex: 1 }}>
+          <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6 }}>
+            <Search size={14} color={accentPurple} />
+            <Text
+              numberOfLines={1}
+              style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold', flexShrink: 1 }]}
+            >
+              {'"' + entry.query + '"'}
+            </Text>
+          </View>
+          <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6, marginTop: 2 }}>
+            <Clock size={12} color={subtextColor} />
+            <Text style={[typography.caption, { color: subtextColor }]}>
+              {formatTimestamp(entry.timestamp)}
+            </Text>
+            {entry.cuisine !== 'All' && (
+              <View style={[styles.cuisineTag, { backgroundColor: accentPurple + '15' }]}>
+                <Text style={[typography.caption, { color: accentPurple }]}>{entry.cuisine}</Text>
+              </View>
+            )}
+          </View>
+        </View>
+        <TouchableOpacity onPress={() => onRemove(entry.id)} style={{ padding: 4 }}>
+          <X size={16} color={subtextColor} />
+        </TouchableOpacity>
+      </View>
+
+      <ScrollView horizontal showsHorizontalScrollIndicator={false} style={{ marginTop: spacing.sm }}>
+        {entry.recipes.map((recipe) => (
+          <View key={recipe.id} style={[styles.historyRecipeChip, { backgroundColor: inputBg }]}>
+            <View style={[styles.historyRecipeImgPlaceholder, { backgroundColor: accentPurple + '20' }]}>
+              <Sparkles size={12} color={accentPurple} />
+            </View>
+            <View style={{ flex: 1 }}>
+              <Text
+                numberOfLines={1}
+                style={[typography.caption, { color: textColor, fontFamily: 'Inter-SemiBold' }]}
+              >
+                {recipe.title}
+              </Text>
+              <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>
+                {recipe.cuisine} · {recipe.estimatedTime}
+              </Text>
+            </View>
+            <View style={[styles.miniScoreBadge, { backgroundColor: colors.primary + '20' }]}>
+              <Text style={{ color: colors.primary, fontSize: 10, fontFamily: 'Inter-Bold' }}>
+                {recipe.matchScore}%
+              </Text>
+            </View>
+          </View>
+        ))}
+      </ScrollView>
+
+      <TouchableOpacity
+        onPress={() => onSearchAgain(entry)}
+        style={[styles.reSearchBtn, { backgroundColor: accentPurple + '10' }]}
+      >
+        <Search size={14} color={accentPurple} />
+        <Text style={[typography.caption, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>
+          Search Again
+        </Text>
+      </TouchableOpacity>
+    </View>
+  );
+});
+
+const CookedCard = memo(function CookedCard({ item, palette }: { item: CookedEntry; palette: Palette }) {
+  const { cardBg, textColor, subtextColor, accentPurple } = palette;
+  const imageUri = item.imageFile ? pinnedImageUri(item.imageFile) : item.imageUri;
+  return (
+    <View style={[styles.cookedCard, { backgroundColor: cardBg }]}>
+      {imageUri ? (
+        <Image
+          source={{ uri: imageUri }}
+          style={styles.cookedImage}
+          resizeMode="cover"
+          resizeMethod="resize"
+        />
+      ) : (
+        <LinearGradient
+          colors={[accentPurple + '30', colors.primary + '20']}
+          style={styles.cookedImagePlaceholder}
+        >
+          <ChefHat size={28} color={accentPurple} />
+        </LinearGradient>
+      )}
+      <View style={{ padding: spacing.sm }}>
+        <Text
+          numberOfLines={2}
+          style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}
+        >
+          {item.recipeTitle}
+        </Text>
+        <View style={{ flexDirection: 'row', alignItems: 'center', gap: 4, marginTop: 4 }}>
+          <Clock size={10} color={subtextColor} />
+          <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>
+            {formatTimestamp(item.cookedAt)}
+          </Text>
+        </View>
+        <View
+          style={[styles.cuisineTag, { backgroundColor: accentPurple + '15', marginTop: 4, alignSelf: 'flex-start' }]}
+        >
+          <Text style={{ color: accentPurple, fontSize: 10, fontFamily: 'Inter-SemiBold' }}>
+            {item.cuisine}
+          </Text>
+        </View>
+      </View>
+    </View>
+  );
+});
+
 const AskAIScreen: React.FC = () => {
+  traceRender('AskAIScreen');
   const isDark = useThemeStore((s) => s.isDarkMode);
-  const pantryIngredients = usePantryStore((s) => s.ingredients);
+  const pantryNames = usePantryStore(selectPantryNames);
   const addItemsForRecipe = useCartStore((s) => s.addItemsForRecipe);
 
-  const {
-    searchHistory,
-    cookedItems,
-    addSearchEntry,
-    removeSearchEntry,
-    clearSearchHistory,
-    markAsCooked,
-    clearCookedItems,
-    isCooked,
-  } = useHistoryStore();
+  const searchHistory = useHistoryStore(selectSearchHistory);
+  const cookedItems = useHistoryStore(selectCookedItems);
+  const cookedCountByRecipe = useHistoryStore((s) => s.cookedCountByRecipe);
+  const addSearchEntry = useHistoryStore((s) => s.addSearchEntry);
+  const removeSearchEntry = useHistoryStore((s) => s.removeSearchEntry);
+  const clearSearchHistory = useHistoryStore((s) => s.clearSearchHistory);
+  const markAsCooked = useHistoryStore((s) => s.markAsCooked);
+  const updateCookedImage = useHistoryStore((s) => s.updateCookedImage);
+  const clearCookedItems = useHistoryStore((s) => s.clearCookedItems);
 
   const [query, setQuery] = useState('');
   const [cuisine, setCuisine] = useState('All');
@@ -82,9 +570,13 @@ const AskAIScreen: React.FC = () => {
   const [speakingRecipeId, setSpeakingRecipeId] = useState<string | null>(null);
   const [isListening, setIsListening] = useState(false);
   const [isTranscribing, setIsTranscribing] = useState(false);
-  const [imageStates, setImageStates] = useState<Record<string, { loading: boolean; base64?: string }>>({});
+  const [imageStates, setImageStates] = useState<Record<string, ImageState>>({});
 
-  const recordingRef = useRef<Audio.Recording | null>(null);
+  const captureRef = useRef<VoiceCapture | null>(null);
+  // Cancels the current search and its image generations when superseded
+  const searchAbortRef = useRef<AbortController | null>(null);
+  // Query, cuisine and pantry of the search in flight, if any.
+  const runningSearchRef = useRef<string | null>(null);
 
   const pulseAnim = useRef(new Animated.Value(1)).current;
 
@@ -96,6 +588,17 @@ const AskAIScreen: React.FC = () => {
   const accentPurple = '#8B5CF6';
   const accentPurpleDark = '#6D28D9';
 
+  const palette = useMemo(
+    () => ({ cardBg, textColor, subtextColor, inputBg, accentPurple, accentPurpleDark }),
+    [isDark],
+  );
+
+  const handleSearchAgain = useCallback((entry: SearchHistoryEntry) => {
+    setQuery(entry.query);
+    setCuisine(entry.cuisine);
+    setActiveTab('search');
+  }, []);
+
   // ── Mic pulse animation ─────────────────────────────────────────────
   useEffect(() => {
     if (isListening) {
@@ -114,8 +617,8 @@ const AskAIScreen: React.FC = () => {
 
   // ── TTS: speak recipe aloud ───────────────────────────────────────
   const speakRecipe = useCallback(
-    (recipe: AIRecipeSuggestion) => {
-      if (speakingRecipeId === recipe.id) {
+    (recipe: AIRecipeSuggestion, isSpeaking: boolean) => {
+      if (isSpeaking) {
         Speech.stop();
         setSpeakingRecipeId(null);
         return;
@@ -165,7 +668,7 @@ const AskAIScreen: React.FC = () => {
         onError: () => setSpeakingRecipeId(null),
       });
     },
-    [speakingRecipeId],
+    [],
   );
 
   // Stop speech on unmount
@@ -175,7 +678,7 @@ const AskAIScreen: React.FC = () => {
     };
   }, []);
 
-  // ── STT: voice input via expo-av + Gemini transcription ───────────
+  // ── STT: voice input, transcribed segment by segment ─────────────
   const startRecording = useCallback(async () => {
     try {
       const permission = await Audio.requestPermissionsAsync();
@@ -184,15 +687,12 @@ const AskAIScreen: React.FC = () => {
         return;
       }
 
-      await Audio.setAudioModeAsync({
-        allowsRecordingIOS: true,
-        playsInSilentModeIOS: true,
+      // Earlier segments are transcribed while the user keeps talking
+      captureRef.current = await startVoiceCapture({
+        onTranscript: (text) => {
+          if (text) setQuery(text);
+        },
       });
-
-      const { recording } = await Audio.Recording.createAsync(
-        Audio.RecordingOptionsPresets.HIGH_QUALITY,
-      );
-      recordingRef.current = recording;
       setIsListening(true);
     } catch (error) {
       console.error('Failed to start recording:', error);
@@ -201,44 +701,17 @@ const AskAIScreen: React.FC = () => {
   }, []);
 
   const stopRecordingAndTranscribe = useCallback(async () => {
-    if (!recordingRef.current) {
-      setIsListening(false);
-      return;
-    }
-
+    const capture = captureRef.current;
+    captureRef.current = null;
     setIsListening(false);
-    setIsTranscribing(true);
+    if (!capture) return;
 
+    setIsTranscribing(true);
     try {
-      await recordingRef.current.stopAndUnloadAsync();
-      await Audio.setAudioModeAsync({ allowsRecordingIOS: false });
-
-      const uri = recordingRef.current.getURI();
-      recordingRef.current = null;
+      // Only the last segment is still outstanding here
+      const transcribedText = await capture.stop();
 
-      if (!uri) {
-        throw new Error('No recording URI found');
-      }
-
-      // Read the audio file as base64
-      const response = await fetch(uri);
-      const blob = await response.blob();
-      const base64 = await new Promise<string>((resolve, reject) => {
-        const reader = new FileReader();
-        reader.onloadend = () => {
-          const dataUrl = reader.result as string;
-          // Strip the data:...;base64, prefix
-          const b64 = dataUrl.split(',')[1];
-          resolve(b64);
-        };
-        reader.onerror = reject;
-        reader.readAsDataURL(blob);
-      });
-
-      // Send to Gemini for transcription
-      const transcribedText = await transcribeAudio(base64, 'audio/mp4');
-
-      if (transcribedText && transcribedText.length > 0) {
+      if (transcribedText.length > 0) {
         setQuery(transcribedText);
       } else {
         Alert.alert('No Speech Detected', 'Could not detect any speech. Please try again.');
@@ -262,41 +735,87 @@ const AskAIScreen: React.FC = () => {
   // Clean up recording on unmount
   useEffect(() => {
     return () => {
-      if (recordingRef.current) {
-        recordingRef.current.stopAndUnloadAsync().catch(() => {});
-      }
+      captureRef.current?.cancel();
+    };
+  }, []);
+
+  // Drop in-flight search/image requests on unmount
+  useEffect(() => {
+    return () => {
+      searchAbortRef.current?.abort();
     };
   }, []);
 
   // ── AI image generation per recipe ────────────────────────────────
-  const generateImageForRecipe = async (
+  const generateImageForRecipe = useCallback(async (
     recipeId: string,
     title: string,
     description?: string,
   ) => {
-    setImageStates((prev) => ({ ...prev, [recipeId]: { loading: true } }));
+    const signal = searchAbortRef.current?.signal;
+    setImageStates((prev) => ({ ...prev, [recipeId]: { ...prev[recipeId], loading: true } }));
     try {
-      const base64 = await generateRecipeImage(title, description);
+      const uri = await generateRecipeImage(title, description, { signal });
+      if (signal?.aborted) return;
       setImageStates((prev) => ({
         ...prev,
-        [recipeId]: { loading: false, base64: base64 || undefined },
+        [recipeId]: { ...prev[recipeId], loading: false, uri: uri || undefined },
       }));
     } catch {
-      setImageStates((prev) => ({ ...prev, [recipeId]: { loading: false } }));
+      setImageStates((prev) => ({ ...prev, [recipeId]: { ...prev[recipeId], loading: false } }));
     }
-  };
+  }, []);
+
+  // Thumbnails go through the image queue; cards on screen go first.
+  const loadThumbnail = useCallback(async (recipe: AIRecipeSuggestion) => {
+    const signal = searchAbortRef.current?.signal;
+    const thumb = await requestThumbnail(recipe, { priority: PRIORITY_OFFSCREEN, signal });
+    if (!thumb || signal?.aborted) return;
+    setImageStates((prev) => ({
+      ...prev,
+      [recipe.id]: { loading: false, ...prev[recipe.id], thumb },
+    }));
+  }, []);
+
+  const onViewableRecipesChanged = useRef(({ changed }: { changed: ViewToken[] }) => {
+    for (const token of changed) {
+      setThumbnailPriority(token.item, token.isViewable ? PRIORITY_VISIBLE : PRIORITY_OFFSCREEN);
+    }
+  }).current;
+
+  const handleGenerateImage = useCallback(
+    (recipe: AIRecipeSuggestion) => generateImageForRecipe(recipe.id, recipe.title, recipe.description),
+    [generateImageForRecipe],
+  );
 
   // ── Search ────────────────────────────────────────────────────────
   const handleSearch = async () => {
     if (!query.trim()) return;
+    // Searching again for the same thing keeps the running search.
+    const searchKey = JSON.stringify([query.trim().toLowerCase(), cuisine, pantryNames]);
+    if (runningSearchRef.current === searchKey) return;
+    searchAbortRef.current?.abort();
+    const controller = new AbortController();
+    searchAbortRef.current = controller;
+    runningSearchRef.current = searchKey;
     setLoading(true);
     setSearched(true);
     setExpandedRecipe(null);
     setImageStates({});
+    setRecipes([]);
     try {
-      const pantryNames = pantryIngredients.map((i) => i.name);
-      const results = await generateRecipesFromQuery(query.trim(), cuisine, pantryNames);
-      setRecipes(results);
+      // Cards render as each recipe arrives and queue a thumbnail
+      const results = await streamRecipesFromQuery(
+        query.trim(),
+        cuisine,
+        pantryNames,
+        (recipe) => {
+          setRecipes((prev) => [...prev, recipe]);
+          loadThumbnail(recipe);
+        },
+        { signal: controller.signal },
+      );
+      if (searchAbortRef.current !== controller) return;
 
       // Save to history
       const historyRecipes: HistoryRecipe[] = results.map((r) => ({
@@ -310,20 +829,19 @@ const AskAIScreen: React.FC = () => {
         matchScore: r.matchScore,
       }));
       addSearchEntry({ query: query.trim(), cuisine, recipes: historyRecipes });
-
-      // Auto-generate images for the first 3 results
-      results
-        .slice(0, 3)
-        .forEach((r) => generateImageForRecipe(r.id, r.title, r.description));
     } catch (err: any) {
+      if (isAbortError(err) || searchAbortRef.current !== controller) return;
       Alert.alert('Error', err.message || 'Failed to search recipes');
     } finally {
-      setLoading(false);
+      if (searchAbortRef.current === controller) {
+        runningSearchRef.current = null;
+        setLoading(false);
+      }
     }
   };
 
   // ── Add to cart ───────────────────────────────────────────────────
-  const handleAddToCart = (recipe: AIRecipeSuggestion) => {
+  const handleAddToCart = useCallback((recipe: AIRecipeSuggestion) => {
     const items = recipe.ingredients.map((ing, idx) => ({
       id: 'ai-cart-' + Date.now() + '-' + idx,
       name: ing.name,
@@ -335,45 +853,34 @@ const AskAIScreen: React.FC = () => {
     addItemsForRecipe(recipe.id, recipe.title, items);
     setAddedRecipes((prev) => new Set(prev).add(recipe.id));
     Alert.alert('Added!', recipe.title + ' ingredients added to cart.');
-  };
+  }, [addItemsForRecipe]);
 
   // ── Mark as cooked ────────────────────────────────────────────────
-  const handleMarkCooked = (recipe: AIRecipeSuggestion) => {
-    const img = imageStates[recipe.id]?.base64;
-    markAsCooked({
+  const handleMarkCooked = useCallback((recipe: AIRecipeSuggestion, imageUri?: string) => {
+    const cookedId = markAsCooked({
       recipeId: recipe.id,
       recipeTitle: recipe.title,
       cuisine: recipe.cuisine,
-      imageBase64: img,
     });
+    // History outlives the image cache, so keep a pinned copy of the image.
+    // Without one, this joins the full-size request started on expand.
+    (imageUri ? Promise.resolve(imageUri) : generateRecipeImage(recipe.title, recipe.description))
+      .then((uri) => (uri ? pinImage(uri) : null))
+      .then((file) => {
+        if (file) updateCookedImage(cookedId, file);
+      });
     Alert.alert('\uD83C\uDF89 Marked as Cooked!', '"' + recipe.title + '" added to your cooked history.');
-  };
+  }, [markAsCooked, updateCookedImage]);
 
-  const getDifficultyColor = (diff: string) => {
-    switch (diff) {
-      case 'Easy': return colors.secondary;
-      case 'Medium': return colors.warning;
-      case 'Hard': return colors.danger;
-      default: return colors.textSecondary;
-    }
-  };
-
-  const formatTimestamp = (ts: number) => {
-    const diff = Date.now() - ts;
-    const mins = Math.floor(diff / 60000);
-    if (mins < 1) return 'Just now';
-    if (mins < 60) return mins + 'm ago';
-    const hrs = Math.floor(mins / 60);
-    if (hrs < 24) return hrs + 'h ago';
-    const days = Math.floor(hrs / 24);
-    if (days < 7) return days + 'd ago';
-    return new Date(ts).toLocaleDateString();
-  };
+  const toggleExpanded = useCallback(
+    (id: string) => setExpandedRecipe((prev) => (prev === id ? null : id)),
+    [],
+  );
 
   // ═══════════════════════════════════════════════════════════════════
   // SUB-TAB: SEARCH
   // ═══════════════════════════════════════════════════════════════════
-  const renderSearchTab = () => (
+  const renderSearchHeader = () => (
     <>
       {/* Search Input Card */}
       <View style={[styles.searchCard, { backgroundColor: cardBg }]}>
@@ -500,255 +1007,12 @@ const AskAIScreen: React.FC = () => {
         </View>
       )}
 
-      {/* Recipe Cards */}
-      {recipes.map((r) => {
-        const isExpanded = expandedRecipe === r.id;
-        const isAdded = addedRecipes.has(r.id);
-        const isSpeaking = speakingRecipeId === r.id;
-        const recipeCooked = isCooked(r.id);
-        const imgState = imageStates[r.id];
-
-        return (
-          <View key={r.id} style={[styles.recipeCard, { backgroundColor: cardBg }]}>
-            {/* AI-generated image */}
-            {imgState?.base64 ? (
-              <Image source={{ uri: imgState.base64 }} style={styles.recipeImage} resizeMode="cover" />
-            ) : imgState?.loading ? (
-              <View style={[styles.recipeImagePlaceholder, { backgroundColor: inputBg }]}>
-                <ActivityIndicator size="small" color={accentPurple} />
-                <Text style={[typography.caption, { color: subtextColor, marginTop: 4 }]}>
-                  AI generating image...
-                </Text>
-              </View>
-            ) : null}
-
-            {/* Header + meta */}
-            <TouchableOpacity
-              onPress={() => setExpandedRecipe(isExpanded ? null : r.id)}
-              activeOpacity={0.7}
-              style={{ padding: spacing.md }}
-            >
-              <View style={styles.recipeTop}>
-                <View style={{ flex: 1 }}>
-                  <Text style={[typography.subtitle, { color: textColor }]}>{r.title}</Text>
-                  <Text style={[typography.caption, { color: subtextColor, marginTop: 2 }]}>
-                    {r.cuisine} cuisine
-                  </Text>
-                </View>
-                <View style={{ flexDirection: 'row', alignItems: 'center', gap: 8 }}>
-                  {/* TTS quick toggle */}
-                  <TouchableOpacity
-                    onPress={() => speakRecipe(r)}
-                    style={[
-                      styles.iconBtn,
-                      { backgroundColor: isSpeaking ? colors.danger + '20' : accentPurple + '15' },
-                    ]}
-                  >
-                    {isSpeaking ? (
-                      <VolumeX size={16} color={colors.danger} />
-                    ) : (
-                      <Volume2 size={16} color={accentPurple} />
-                    )}
-                  </TouchableOpacity>
-                  <View style={[styles.scoreBadge, { backgroundColor: colors.primary + '20' }]}>
-                    <Star size={12} color={colors.primary} />
-                    <Text style={[typography.caption, { color: colors.primary, fontFamily: 'Inter-Bold' }]}>
-                      {r.matchScore}%
-                    </Text>
-                  </View>
-                </View>
-              </View>
-
-              <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
-                {r.description}
-              </Text>
-
-              <View style={styles.recipeMeta}>
-                <View style={styles.metaItem}>
-                  <Clock size={14} color={subtextColor} />
-                  <Text style={[typography.caption, { color: subtextColor }]}>{r.estimatedTime}</Text>
-                </View>
-                <View style={styles.metaItem}>
-                  <Users size={14} color={subtextColor} />
-                  <Text style={[typography.caption, { color: subtextColor }]}>{r.servings} servings</Text>
-                </View>
-                <View style={styles.metaItem}>
-                  <Flame size={14} color={subtextColor} />
-                  <Text style={[typography.caption, { color: subtextColor }]}>
-                    {r.nutritionEstimate.calories} cal
-                  </Text>
-                </View>
-                <View style={[styles.diffBadge, { backgroundColor: getDifficultyColor(r.difficulty) + '20' }]}>
-                  <Text
-                    style={[
-                      typography.caption,
-                      { color: getDifficultyColor(r.difficulty), fontFamily: 'Inter-SemiBold' },
-                    ]}
-                  >
-                    {r.difficulty}
-                  </Text>
-                </View>
-              </View>
-
-              <View style={{ alignItems: 'center', marginTop: spacing.xs }}>
-                {isExpanded ? (
-                  <ChevronUp size={18} color={subtextColor} />
-                ) : (
-                  <ChevronDown size={18} color={subtextColor} />
-                )}
-              </View>
-            </TouchableOpacity>
 
-            {/* Expanded details */}
-            {isExpanded && (
-              <View style={[styles.expandedContent, { paddingHorizontal: spacing.md, paddingBottom: spacing.md }]}>
-                {/* Generate image button (if no image yet) */}
-                {!imgState?.base64 && !imgState?.loading && (
-                  <TouchableOpacity
-                    onPress={() => generateImageForRecipe(r.id, r.title, r.description)}
-                    style={[styles.generateImgBtn, { backgroundColor: accentPurple + '15' }]}
-                  >
-                    <ImageIcon size={16} color={accentPurple} />
-                    <Text style={[typography.bodySmall, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>
-                      Generate AI Image
-                    </Text>
-                  </TouchableOpacity>
-                )}
-
-                {/* Ingredients */}
-                <Text
-                  style={[
-                    typography.bodySmall,
-                    { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.sm },
-                  ]}
-                >
-                  Ingredients ({r.ingredients.length})
-                </Text>
-                {r.ingredients.map((ing, i) => (
-                  <View key={i} style={styles.ingredientRow}>
-                    <View style={[styles.dot, { backgroundColor: accentPurple }]} />
-                    <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{ing.name}</Text>
-                    <Text style={[typography.caption, { color: subtextColor }]}>{ing.quantity}</Text>
-                  </View>
-                ))}
-
-                {/* Instructions */}
-                <Text
-                  style={[
-                    typography.bodySmall,
-                    { color: textColor, fontFamily: 'Inter-SemiBold', marginTop: spacing.md },
-                  ]}
-                >
-                  Instructions
-                </Text>
-                {r.instructions.map((step, i) => (
-                  <View key={i} style={styles.stepRow}>
-                    <LinearGradient colors={[accentPurple, accentPurpleDark]} style={styles.stepNum}>
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-Bold' }]}>
-                        {i + 1}
-                      </Text>
-                    </LinearGradient>
-                    <Text style={[typography.bodySmall, { color: textColor, flex: 1 }]}>{step}</Text>
-                  </View>
-                ))}
-
-                {/* Nutrition */}
-                <View style={[styles.nutritionRow, { backgroundColor: inputBg }]}>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>🔥 Calories</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
-                      {r.nutritionEstimate.calories}
-                    </Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>💪 Protein</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
-                      {r.nutritionEstimate.protein}g
-                    </Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>🍞 Carbs</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
-                      {r.nutritionEstimate.carbs}g
-                    </Text>
-                  </View>
-                  <View style={styles.nutritionItem}>
-                    <Text style={[typography.caption, { color: subtextColor }]}>🧈 Fat</Text>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-Bold' }]}>
-                      {r.nutritionEstimate.fat}g
-                    </Text>
-                  </View>
-                </View>
-
-                {/* Action buttons */}
-                <View style={styles.actionRow}>
-                  <TouchableOpacity onPress={() => handleAddToCart(r)} disabled={isAdded} style={{ flex: 1 }}>
-                    <LinearGradient
-                      colors={isAdded ? ['#22C55E', '#16A34A'] : [colors.primary, colors.primaryDark]}
-                      style={styles.actionBtn}
-                    >
-                      {isAdded ? (
-                        <CheckCircle size={16} color={colors.white} />
-                      ) : (
-                        <ShoppingCart size={16} color={colors.white} />
-                      )}
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
-                        {isAdded ? 'In Cart' : 'Add to Cart'}
-                      </Text>
-                    </LinearGradient>
-                  </TouchableOpacity>
-                  <TouchableOpacity
-                    onPress={() => handleMarkCooked(r)}
-                    disabled={recipeCooked}
-                    style={{ flex: 1 }}
-                  >
-                    <LinearGradient
-                      colors={recipeCooked ? ['#22C55E', '#16A34A'] : [accentPurple, accentPurpleDark]}
-                      style={styles.actionBtn}
-                    >
-                      {recipeCooked ? (
-                        <CheckCircle size={16} color={colors.white} />
-                      ) : (
-                        <ChefHat size={16} color={colors.white} />
-                      )}
-                      <Text style={[typography.caption, { color: colors.white, fontFamily: 'Inter-SemiBold' }]}>
-                        {recipeCooked ? 'Cooked!' : 'Mark Cooked'}
-                      </Text>
-                    </LinearGradient>
-                  </TouchableOpacity>
-                </View>
-
-                {/* Full TTS button */}
-                <TouchableOpacity
-                  onPress={() => speakRecipe(r)}
-                  style={[
-                    styles.ttsFullBtn,
-                    { backgroundColor: isSpeaking ? colors.danger + '15' : accentPurple + '10' },
-                  ]}
-                >
-                  {isSpeaking ? (
-                    <VolumeX size={16} color={colors.danger} />
-                  ) : (
-                    <Volume2 size={16} color={accentPurple} />
-                  )}
-                  <Text
-                    style={[
-                      typography.caption,
-                      {
-                        color: isSpeaking ? colors.danger : accentPurple,
-                        fontFamily: 'Inter-SemiBold',
-                      },
-                    ]}
-                  >
-                    {isSpeaking ? 'Stop Reading' : 'Read Recipe Aloud'}
-                  </Text>
-                </TouchableOpacity>
-              </View>
-            )}
-          </View>
-        );
-      })}
+    </>
+  );
 
+  const renderSearchEmpty = () => (
+    <>
       {/* Empty state – not searched yet */}
       {!searched && !loading && (
         <View style={styles.emptyState}>
@@ -786,7 +1050,7 @@ const AskAIScreen: React.FC = () => {
       )}
 
       {/* Empty state – searched but no results */}
-      {searched && !loading && recipes.length === 0 && (
+      {searched && !loading && (
         <View style={styles.emptyState}>
           <Search size={48} color={subtextColor} />
           <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>
@@ -797,197 +1061,185 @@ const AskAIScreen: React.FC = () => {
     </>
   );
 
+  const renderRecipe = useCallback(
+    ({ item: r }: { item: AIRecipeSuggestion }) => (
+      <RecipeCard
+        recipe={r}
+        isExpanded={expandedRecipe === r.id}
+        isAdded={addedRecipes.has(r.id)}
+        isSpeaking={speakingRecipeId === r.id}
+        recipeCooked={r.id in cookedCountByRecipe}
+        imgState={imageStates[r.id]}
+        palette={palette}
+        onToggleExpand={toggleExpanded}
+        onSpeak={speakRecipe}
+        onGenerateImage={handleGenerateImage}
+        onAddToCart={handleAddToCart}
+        onMarkCooked={handleMarkCooked}
+      />
+    ),
+    [
+      expandedRecipe,
+      addedRecipes,
+      speakingRecipeId,
+      cookedCountByRecipe,
+      imageStates,
+      palette,
+      toggleExpanded,
+      speakRecipe,
+      handleGenerateImage,
+      handleAddToCart,
+      handleMarkCooked,
+    ],
+  );
+
+  const renderSearchTab = () => (
+    <FlatList
+      data={recipes}
+      keyExtractor={keyById}
+      renderItem={renderRecipe}
+      onViewableItemsChanged={onViewableRecipesChanged}
+      viewabilityConfig={recipeViewability}
+      ListHeaderComponent={renderSearchHeader()}
+      ListEmptyComponent={renderSearchEmpty()}
+      contentContainerStyle={styles.listContent}
+      keyboardShouldPersistTaps="handled"
+      showsVerticalScrollIndicator={false}
+      initialNumToRender={3}
+      maxToRenderPerBatch={3}
+      windowSize={5}
+    />
+  );
+
   // ═══════════════════════════════════════════════════════════════════
   // SUB-TAB: HISTORY
   // ═══════════════════════════════════════════════════════════════════
+  const renderHistoryEntry = useCallback(
+    ({ item }: { item: SearchHistoryEntry }) => (
+      <HistoryEntryCard
+        entry={item}
+        palette={palette}
+        onRemove={removeSearchEntry}
+        onSearchAgain={handleSearchAgain}
+      />
+    ),
+    [palette, removeSearchEntry, handleSearchAgain],
+  );
+
   const renderHistoryTab = () => (
     <>
-      {searchHistory.length > 0 && (
-        <TouchableOpacity
-          onPress={() =>
-            Alert.alert('Clear History', 'Remove all search history?', [
-              { text: 'Cancel', style: 'cancel' },
-              { text: 'Clear', style: 'destructive', onPress: clearSearchHistory },
-            ])
-          }
-          style={[styles.clearBtn, { backgroundColor: colors.danger + '15' }]}
-        >
-          <Trash2 size={14} color={colors.danger} />
-          <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>
-            Clear All History
-          </Text>
-        </TouchableOpacity>
-      )}
-
-      {searchHistory.length === 0 && (
-        <View style={styles.emptyState}>
-          <History size={48} color={subtextColor} />
-          <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>
-            No search history yet
-          </Text>
-          <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
-            Your recipe searches will appear here
-          </Text>
-        </View>
-      )}
-
-      {searchHistory.map((entry) => (
-        <View key={entry.id} style={[styles.historyCard, { backgroundColor: cardBg }]}>
-          <View style={styles.historyHeader}>
-            <View style={{ flex: 1 }}>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6 }}>
-                <Search size={14} color={accentPurple} />
-                <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>
-                  {'"' + entry.query + '"'}
-                </Text>
-              </View>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 6, marginTop: 2 }}>
-                <Clock size={12} color={subtextColor} />
-                <Text style={[typography.caption, { color: subtextColor }]}>
-                  {formatTimestamp(entry.timestamp)}
-                </Text>
-                {entry.cuisine !== 'All' && (
-                  <View style={[styles.cuisineTag, { backgroundColor: accentPurple + '15' }]}>
-                    <Text style={[typography.caption, { color: accentPurple }]}>{entry.cuisine}</Text>
-                  </View>
-                )}
-              </View>
-            </View>
-            <TouchableOpacity onPress={() => removeSearchEntry(entry.id)} style={{ padding: 4 }}>
-              <X size={16} color={subtextColor} />
-            </TouchableOpacity>
-          </View>
-
-          <ScrollView horizontal showsHorizontalScrollIndicator={false} style={{ marginTop: spacing.sm }}>
-            {entry.recipes.map((recipe) => (
-              <View key={recipe.id} style={[styles.historyRecipeChip, { backgroundColor: inputBg }]}>
-                <View style={[styles.historyRecipeImgPlaceholder, { backgroundColor: accentPurple + '20' }]}>
-                  <Sparkles size={12} color={accentPurple} />
-                </View>
-                <View style={{ flex: 1 }}>
-                  <Text
-                    numberOfLines={1}
-                    style={[typography.caption, { color: textColor, fontFamily: 'Inter-SemiBold' }]}
-                  >
-                    {recipe.title}
-                  </Text>
-                  <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>
-                    {recipe.cuisine} · {recipe.estimatedTime}
-                  </Text>
-                </View>
-                <View style={[styles.miniScoreBadge, { backgroundColor: colors.primary + '20' }]}>
-                  <Text style={{ color: colors.primary, fontSize: 10, fontFamily: 'Inter-Bold' }}>
-                    {recipe.matchScore}%
-                  </Text>
-                </View>
-              </View>
-            ))}
-          </ScrollView>
-
+      <View style={styles.listHeader}>
+        {searchHistory.length > 0 && (
           <TouchableOpacity
-            onPress={() => {
-              setQuery(entry.query);
-              setCuisine(entry.cuisine);
-              setActiveTab('search');
-            }}
-            style={[styles.reSearchBtn, { backgroundColor: accentPurple + '10' }]}
+            onPress={() =>
+              Alert.alert('Clear History', 'Remove all search history?', [
+                { text: 'Cancel', style: 'cancel' },
+                { text: 'Clear', style: 'destructive', onPress: clearSearchHistory },
+              ])
+            }
+            style={[styles.clearBtn, { backgroundColor: colors.danger + '15' }]}
           >
-            <Search size={14} color={accentPurple} />
-            <Text style={[typography.caption, { color: accentPurple, fontFamily: 'Inter-SemiBold' }]}>
-              Search Again
+            <Trash2 size={14} color={colors.danger} />
+            <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>
+              Clear All History
             </Text>
           </TouchableOpacity>
-        </View>
-      ))}
+        )}
+      </View>
+      <FlatList
+        data={searchHistory}
+        keyExtractor={keyById}
+        renderItem={renderHistoryEntry}
+        getItemLayout={historyItemLayout}
+        ListEmptyComponent={
+          <View style={styles.emptyState}>
+            <History size={48} color={subtextColor} />
+            <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>
+              No search history yet
+            </Text>
+            <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
+              Your recipe searches will appear here
+            </Text>
+          </View>
+        }
+        contentContainerStyle={styles.fixedListContent}
+        showsVerticalScrollIndicator={false}
+        initialNumToRender={6}
+        maxToRenderPerBatch={6}
+        windowSize={7}
+        removeClippedSubviews
+      />
     </>
   );
 
   // ═══════════════════════════════════════════════════════════════════
   // SUB-TAB: COOKED
   // ═══════════════════════════════════════════════════════════════════
+  const renderCookedItem = useCallback(
+    ({ item }: { item: CookedEntry }) => <CookedCard item={item} palette={palette} />,
+    [palette],
+  );
+
   const renderCookedTab = () => (
     <>
-      {cookedItems.length > 0 && (
-        <View style={[styles.cookedStats, { backgroundColor: cardBg }]}>
-          <LinearGradient
-            colors={[colors.secondary + '20', colors.secondary + '05']}
-            style={styles.cookedStatsGradient}
-          >
-            <ChefHat size={24} color={colors.secondary} />
-            <View style={{ marginLeft: spacing.sm }}>
-              <Text style={[typography.h3, { color: textColor }]}>{cookedItems.length}</Text>
-              <Text style={[typography.caption, { color: subtextColor }]}>Recipes Cooked</Text>
-            </View>
-          </LinearGradient>
-        </View>
-      )}
-
-      {cookedItems.length > 0 && (
-        <TouchableOpacity
-          onPress={() =>
-            Alert.alert('Clear Cooked', 'Remove all cooked history?', [
-              { text: 'Cancel', style: 'cancel' },
-              { text: 'Clear', style: 'destructive', onPress: clearCookedItems },
-            ])
-          }
-          style={[styles.clearBtn, { backgroundColor: colors.danger + '15', marginTop: spacing.sm }]}
-        >
-          <Trash2 size={14} color={colors.danger} />
-          <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>
-            Clear Cooked History
-          </Text>
-        </TouchableOpacity>
-      )}
-
-      {cookedItems.length === 0 && (
-        <View style={styles.emptyState}>
-          <ChefHat size={48} color={subtextColor} />
-          <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>
-            Nothing cooked yet
-          </Text>
-          <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
-            Mark recipes as cooked to track your culinary journey
-          </Text>
-        </View>
-      )}
-
-      <View style={styles.cookedGrid}>
-        {cookedItems.map((item) => (
-          <View key={item.id} style={[styles.cookedCard, { backgroundColor: cardBg }]}>
-            {item.imageBase64 ? (
-              <Image source={{ uri: item.imageBase64 }} style={styles.cookedImage} resizeMode="cover" />
-            ) : (
-              <LinearGradient
-                colors={[accentPurple + '30', colors.primary + '20']}
-                style={styles.cookedImagePlaceholder}
-              >
-                <ChefHat size={28} color={accentPurple} />
-              </LinearGradient>
-            )}
-            <View style={{ padding: spacing.sm }}>
-              <Text
-                numberOfLines={2}
-                style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}
-              >
-                {item.recipeTitle}
-              </Text>
-              <View style={{ flexDirection: 'row', alignItems: 'center', gap: 4, marginTop: 4 }}>
-                <Clock size={10} color={subtextColor} />
-                <Text style={[typography.caption, { color: subtextColor, fontSize: 10 }]}>
-                  {formatTimestamp(item.cookedAt)}
-                </Text>
-              </View>
-              <View
-                style={[styles.cuisineTag, { backgroundColor: accentPurple + '15', marginTop: 4, alignSelf: 'flex-start' }]}
-              >
-                <Text style={{ color: accentPurple, fontSize: 10, fontFamily: 'Inter-SemiBold' }}>
-                  {item.cuisine}
-                </Text>
+      <View style={styles.listHeader}>
+        {cookedItems.length > 0 && (
+          <View style={[styles.cookedStats, { backgroundColor: cardBg }]}>
+            <LinearGradient
+              colors={[colors.secondary + '20', colors.secondary + '05']}
+              style={styles.cookedStatsGradient}
+            >
+              <ChefHat size={24} color={colors.secondary} />
+              <View style={{ marginLeft: spacing.sm }}>
+                <Text style={[typography.h3, { color: textColor }]}>{cookedItems.length}</Text>
+                <Text style={[typography.caption, { color: subtextColor }]}>Recipes Cooked</Text>
               </View>
-            </View>
+            </LinearGradient>
           </View>
-        ))}
+        )}
+
+        {cookedItems.length > 0 && (
+          <TouchableOpacity
+            onPress={() =>
+              Alert.alert('Clear Cooked', 'Remove all cooked history?', [
+                { text: 'Cancel', style: 'cancel' },
+                { text: 'Clear', style: 'destructive', onPress: clearCookedItems },
+              ])
+            }
+            style={[styles.clearBtn, { backgroundColor: colors.danger + '15', marginTop: spacing.sm }]}
+          >
+            <Trash2 size={14} color={colors.danger} />
+            <Text style={[typography.caption, { color: colors.danger, fontFamily: 'Inter-SemiBold' }]}>
+              Clear Cooked History
+            </Text>
+          </TouchableOpacity>
+        )}
       </View>
+      <FlatList
+        data={cookedItems}
+        keyExtractor={keyById}
+        renderItem={renderCookedItem}
+        numColumns={2}
+        columnWrapperStyle={styles.cookedRow}
+        getItemLayout={cookedItemLayout}
+        ListEmptyComponent={
+          <View style={styles.emptyState}>
+            <ChefHat size={48} color={subtextColor} />
+            <Text style={[typography.body, { color: subtextColor, marginTop: spacing.md }]}>
+              Nothing cooked yet
+            </Text>
+            <Text style={[typography.bodySmall, { color: subtextColor, marginTop: spacing.xs }]}>
+              Mark recipes as cooked to track your culinary journey
+            </Text>
+          </View>
+        }
+        contentContainerStyle={styles.fixedListContent}
+        showsVerticalScrollIndicator={false}
+        initialNumToRender={6}
+        maxToRenderPerBatch={4}
+        windowSize={5}
+        removeClippedSubviews
+      />
     </>
   );
 
@@ -1043,15 +1295,10 @@ const AskAIScreen: React.FC = () => {
         })}
       </View>
 
-      {/* Content */}
-      <ScrollView
-        showsVerticalScrollIndicator={false}
-        contentContainerStyle={{ padding: spacing.md, paddingBottom: 120 }}
-      >
-        {activeTab === 'search' && renderSearchTab()}
-        {activeTab === 'history' && renderHistoryTab()}
-        {activeTab === 'cooked' && renderCookedTab()}
-      </ScrollView>
+      {/* Content: one virtualized list per tab */}
+      {activeTab === 'search' && renderSearchTab()}
+      {activeTab === 'history' && renderHistoryTab()}
+      {activeTab === 'cooked' && renderCookedTab()}
     </View>
   );
 };
@@ -1131,7 +1378,7 @@ const styles = StyleSheet.create({
     borderRadius: borderRadius.full,
   },
   recipeCard: { borderRadius: borderRadius.xl, marginTop: spacing.sm, overflow: 'hidden' },
-  recipeImage: { width: '100%', height: 180 },
+  recipeImage: { width: '100%', height: RECIPE_IMAGE_HEIGHT },
   recipeImagePlaceholder: { width: '100%', height: 120, alignItems: 'center', justifyContent: 'center' },
   recipeTop: { flexDirection: 'row', justifyContent: 'space-between', alignItems: 'flex-start' },
   scoreBadge: {
@@ -1204,7 +1451,16 @@ const styles = StyleSheet.create({
     borderRadius: borderRadius.md,
     marginTop: spacing.sm,
   },
-  historyCard: { padding: spacing.md, borderRadius: borderRadius.xl, marginTop: spacing.sm },
+  listContent: { padding: spacing.md, paddingBottom: 120 },
+  listHeader: { paddingHorizontal: spacing.md, paddingTop: spacing.sm },
+  fixedListContent: { paddingHorizontal: spacing.md, paddingBottom: 120 },
+  historyCard: {
+    height: HISTORY_CARD_HEIGHT,
+    padding: spacing.md,
+    borderRadius: borderRadius.xl,
+    marginTop: spacing.sm,
+    overflow: 'hidden',
+  },
   historyHeader: { flexDirection: 'row', justifyContent: 'space-between', alignItems: 'flex-start' },
   historyRecipeChip: {
     flexDirection: 'row',
@@ -1244,9 +1500,11 @@ const styles = StyleSheet.create({
   },
   cookedStats: { borderRadius: borderRadius.xl, overflow: 'hidden' },
   cookedStatsGradient: { flexDirection: 'row', alignItems: 'center', padding: spacing.md },
-  cookedGrid: { flexDirection: 'row', flexWrap: 'wrap', gap: spacing.sm, marginTop: spacing.sm },
+  cookedRow: { gap: spacing.sm },
   cookedCard: {
     width: (SCREEN_WIDTH - spacing.md * 2 - spacing.sm) / 2,
+    height: COOKED_CARD_HEIGHT,
+    marginTop: spacing.sm,
     borderRadius: borderRadius.lg,
     overflow: 'hidden',
   },
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { memo, useCallback, useState } from 'react';
 import {
   View,
   Text,
@@ -24,21 +24,137 @@ import { colors } from '../theme/colors';
 import { typography } from '../theme/typography';
 import { spacing, borderRadius } from '../theme/spacing';
 import { useThemeStore } from '../store/useThemeStore';
-import { useCartStore, CartRecipeGroup } from '../store/useCartStore';
+import {
+  useCartStore,
+  selectGroupedByRecipe,
+  selectMergedCart,
+  CartItem,
+  CartMergedLine,
+} from '../store/useCartStore';
 import AppHeader from '../components/AppHeader';
+import { traceRender } from '../utils/trace';
+
+// Toggling an item replaces only that item object, so the other rows skip
+// re-rendering.
+const CartItemRow = memo(function CartItemRow({
+  item,
+  textColor,
+  subtextColor,
+  onToggle,
+  onRemove,
+}: {
+  item: CartItem;
+  textColor: string;
+  subtextColor: string;
+  onToggle: (id: string) => void;
+  onRemove: (id: string) => void;
+}) {
+  return (
+    <View style={[styles.cartItem, item.isChecked && styles.cartItemChecked]}>
+      <TouchableOpacity onPress={() => onToggle(item.id)}>
+        {item.isChecked ? (
+          <CheckCircle size={22} color={colors.secondary} />
+        ) : (
+          <Circle size={22} color={subtextColor} />
+        )}
+      </TouchableOpacity>
+      <View style={{ flex: 1 }}>
+        <Text
+          style={[
+            typography.bodySmall,
+            {
+              color: item.isChecked ? subtextColor : textColor,
+              textDecorationLine: item.isChecked ? 'line-through' : 'none',
+            },
+          ]}
+        >
+          {item.name}
+        </Text>
+        <Text style={[typography.caption, { color: subtextColor }]}>
+          {item.quantity} - {item.category}
+        </Text>
+      </View>
+      <Text style={[typography.bodySmall, { color: colors.primary, fontFamily: 'Inter-SemiBold' }]}>
+        {'$' + item.estimatedPrice.toFixed(2)}
+      </Text>
+      <TouchableOpacity
+        onPress={() => onRemove(item.id)}
+        hitSlop={{ top: 10, bottom: 10, left: 10, right: 10 }}
+      >
+        <X size={16} color={subtextColor} />
+      </TouchableOpacity>
+    </View>
+  );
+});
+
+const MergedLineRow = memo(function MergedLineRow({
+  line,
+  textColor,
+  subtextColor,
+  onToggle,
+}: {
+  line: CartMergedLine;
+  textColor: string;
+  subtextColor: string;
+  onToggle: (line: CartMergedLine) => void;
+}) {
+  return (
+    <View style={[styles.cartItem, line.isChecked && styles.cartItemChecked]}>
+      <TouchableOpacity onPress={() => onToggle(line)}>
+        {line.isChecked ? (
+          <CheckCircle size={22} color={colors.secondary} />
+        ) : (
+          <Circle size={22} color={subtextColor} />
+        )}
+      </TouchableOpacity>
+      <View style={{ flex: 1 }}>
+        <Text
+          style={[
+            typography.bodySmall,
+            {
+              color: line.isChecked ? subtextColor : textColor,
+              textDecorationLine: line.isChecked ? 'line-through' : 'none',
+            },
+          ]}
+        >
+          {line.name}
+        </Text>
+        <Text style={[typography.caption, { color: subtextColor }]}>
+          {line.quantity || '-'} - {line.category || 'Other'}
+        </Text>
+        {line.recipeNames.length > 1 && (
+          <Text style={[typography.caption, { color: subtextColor }]} numberOfLines={1}>
+            Used in: {line.recipeNames.join(', ')}
+          </Text>
+        )}
+      </View>
+      <Text style={[typography.bodySmall, { color: colors.primary, fontFamily: 'Inter-SemiBold' }]}>
+        {'$' + line.estimatedPrice.toFixed(2)}
+      </Text>
+    </View>
+  );
+});
+
+type CartView = 'recipes' | 'combined';
+
+const NO_MERGED_LINES: CartMergedLine[] = [];
+const selectNoMergedLines = () => NO_MERGED_LINES;
 
 const CartScreen: React.FC = () => {
+  traceRender('CartScreen');
   const isDark = useThemeStore((s) => s.isDarkMode);
-  const items = useCartStore((s) => s.items);
+  const [view, setView] = useState<CartView>('recipes');
+  const groups = useCartStore(selectGroupedByRecipe);
+  // Merging only runs while the combined list is on screen.
+  const mergedLines = useCartStore(view === 'combined' ? selectMergedCart : selectNoMergedLines);
+  const totalCost = useCartStore((s) => s.totalCost);
+  const itemCount = useCartStore((s) => s.itemCount);
+  const checkedCount = useCartStore((s) => s.checkedCount);
   const toggleItem = useCartStore((s) => s.toggleItem);
   const removeItem = useCartStore((s) => s.removeItem);
   const removeRecipeItems = useCartStore((s) => s.removeRecipeItems);
   const clearCart = useCartStore((s) => s.clearCart);
   const clearChecked = useCartStore((s) => s.clearChecked);
-  const getGroupedByRecipe = useCartStore((s) => s.getGroupedByRecipe);
-  const getTotalCost = useCartStore((s) => s.getTotalCost);
-  const getItemCount = useCartStore((s) => s.getItemCount);
-  const getCheckedCount = useCartStore((s) => s.getCheckedCount);
 
   const [expandedRecipes, setExpandedRecipes] = useState<Record<string, boolean>>({});
 
@@ -47,10 +163,15 @@ const CartScreen: React.FC = () => {
   const textColor = isDark ? colors.textPrimary : colors.textDark;
   const subtextColor = isDark ? colors.textSecondary : colors.textMuted;
 
-  const groups = getGroupedByRecipe();
-  const totalCost = getTotalCost();
-  const itemCount = getItemCount();
-  const checkedCount = getCheckedCount();
+  // Checking a combined line checks it in every recipe.
+  const toggleMergedLine = useCallback(
+    (line: CartMergedLine) => {
+      for (const item of line.items) {
+        if (item.isChecked === line.isChecked) toggleItem(item.id);
+      }
+    },
+    [toggleItem],
+  );
 
   const toggleRecipeExpand = (recipeId: string) => {
     setExpandedRecipes((prev) => ({ ...prev, [recipeId]: !prev[recipeId] }));
@@ -82,7 +203,7 @@ const CartScreen: React.FC = () => {
     );
   };
 
-  if (items.length === 0) {
+  if (itemCount === 0) {
     return (
       <View style={[styles.container, { backgroundColor: bg }]}>
         <AppHeader title="Shopping Cart" />
@@ -141,85 +262,99 @@ const CartScreen: React.FC = () => {
           </View>
         </LinearGradient>
 
-        {/* Recipe Groups */}
-        <Text style={[typography.subtitle, { color: textColor, marginTop: spacing.lg, marginBottom: spacing.sm }]}>
-          Items by Recipe ({groups.length} recipes)
-        </Text>
-        {groups.map((group) => {
-          const isExpanded = expandedRecipes[group.recipeId] !== false;
-          const checkedInGroup = group.items.filter((i) => i.isChecked).length;
-          return (
-            <View key={group.recipeId} style={[styles.recipeGroup, { backgroundColor: cardBg }]}>
-              <TouchableOpacity
-                style={styles.recipeGroupHeader}
-                onPress={() => toggleRecipeExpand(group.recipeId)}
+        {/* View switch */}
+        <View style={[styles.viewSwitch, { backgroundColor: cardBg }]}>
+          {(['recipes', 'combined'] as const).map((v) => (
+            <TouchableOpacity
+              key={v}
+              onPress={() => setView(v)}
+              style={[styles.viewSwitchBtn, view === v && { backgroundColor: colors.primary }]}
+            >
+              <Text
+                style={[
+                  typography.caption,
+                  { color: view === v ? colors.white : subtextColor, fontFamily: 'Inter-SemiBold' },
+                ]}
               >
-                <View style={styles.recipeGroupLeft}>
-                  <Package size={18} color={colors.primary} />
-                  <View style={{ flex: 1 }}>
-                    <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]} numberOfLines={1}>
-                      {group.recipeName}
-                    </Text>
-                    <Text style={[typography.caption, { color: subtextColor }]}>
-                      {checkedInGroup}/{group.items.length} items  -  {'$' + group.totalEstimatedCost.toFixed(2)}
-                    </Text>
-                  </View>
-                </View>
-                <View style={{ flexDirection: 'row', alignItems: 'center', gap: spacing.sm }}>
+                {v === 'recipes' ? 'By Recipe' : 'Combined'}
+              </Text>
+            </TouchableOpacity>
+          ))}
+        </View>
+
+        {view === 'combined' ? (
+          <>
+            <Text style={[typography.subtitle, { color: textColor, marginTop: spacing.md, marginBottom: spacing.sm }]}>
+              Combined List ({mergedLines.length} items)
+            </Text>
+            <View style={[styles.recipeGroup, { backgroundColor: cardBg }]}>
+              {mergedLines.map((line) => (
+                <MergedLineRow
+                  key={line.key}
+                  line={line}
+                  textColor={textColor}
+                  subtextColor={subtextColor}
+                  onToggle={toggleMergedLine}
+                />
+              ))}
+            </View>
+          </>
+        ) : (
+          <>
+            {/* Recipe Groups */}
+            <Text style={[typography.subtitle, { color: textColor, marginTop: spacing.md, marginBottom: spacing.sm }]}>
+              Items by Recipe ({groups.length} recipes)
+            </Text>
+            {groups.map((group) => {
+              const isExpanded = expandedRecipes[group.recipeId] !== false;
+              return (
+                <View key={group.recipeId} style={[styles.recipeGroup, { backgroundColor: cardBg }]}>
                   <TouchableOpacity
-                    onPress={() => handleRemoveRecipe(group.recipeId, group.recipeName)}
-                    hitSlop={{ top: 10, bottom: 10, left: 10, right: 10 }}
+                    style={styles.recipeGroupHeader}
+                    onPress={() => toggleRecipeExpand(group.recipeId)}
                   >
-                    <Trash2 size={16} color={colors.danger} />
-                  </TouchableOpacity>
-                  {isExpanded ? (
-                    <ChevronUp size={18} color={subtextColor} />
-                  ) : (
-                    <ChevronDown size={18} color={subtextColor} />
-                  )}
-                </View>
-              </TouchableOpacity>
-
-              {isExpanded &&
-                group.items.map((item) => (
-                  <View key={item.id} style={[styles.cartItem, item.isChecked && styles.cartItemChecked]}>
-                    <TouchableOpacity onPress={() => toggleItem(item.id)}>
-                      {item.isChecked ? (
-                        <CheckCircle size={22} color={colors.secondary} />
+                    <View style={styles.recipeGroupLeft}>
+                      <Package size={18} color={colors.primary} />
+                      <View style={{ flex: 1 }}>
+                        <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]} numberOfLines={1}>
+                          {group.recipeName}
+                        </Text>
+                        <Text style={[typography.caption, { color: subtextColor }]}>
+                          {group.checkedCount}/{group.items.length} items  -  {'$' + group.totalEstimatedCost.toFixed(2)}
+                        </Text>
+                      </View>
+                    </View>
+                    <View style={{ flexDirection: 'row', alignItems: 'center', gap: spacing.sm }}>
+                      <TouchableOpacity
+                        onPress={() => handleRemoveRecipe(group.recipeId, group.recipeName)}
+                        hitSlop={{ top: 10, bottom: 10, left: 10, right: 10 }}
+                      >
+                        <Trash2 size={16} color={colors.danger} />
+                      </TouchableOpacity>
+                      {isExpanded ? (
+                        <ChevronUp size={18} color={subtextColor} />
                       ) : (
-                        <Circle size={22} color={subtextColor} />
+                        <ChevronDown size={18} color={subtextColor} />
                       )}
-                    </TouchableOpacity>
-                    <View style={{ flex: 1 }}>
-                      <Text
-                        style={[
-                          typography.bodySmall,
-                          {
-                            color: item.isChecked ? subtextColor : textColor,
-                            textDecorationLine: item.isChecked ? 'line-through' : 'none',
-                          },
-                        ]}
-                      >
-                        {item.name}
-                      </Text>
-                      <Text style={[typography.caption, { color: subtextColor }]}>
-                        {item.quantity} - {item.category}
-                      </Text>
                     </View>
-                    <Text style={[typography.bodySmall, { color: colors.primary, fontFamily: 'Inter-SemiBold' }]}>
-                      {'$' + item.estimatedPrice.toFixed(2)}
-                    </Text>
-                    <TouchableOpacity
-                      onPress={() => removeItem(item.id)}
-                      hitSlop={{ top: 10, bottom: 10, left: 10, right: 10 }}
-                    >
-                      <X size={16} color={subtextColor} />
-                    </TouchableOpacity>
-                  </View>
-                ))}
-            </View>
-          );
-        })}
+                  </TouchableOpacity>
+
+                  {isExpanded &&
+                    group.items.map((item) => (
+                      <CartItemRow
+                        key={item.id}
+                        item={item}
+                        textColor={textColor}
+                        subtextColor={subtextColor}
+                        onToggle={toggleItem}
+                        onRemove={removeItem}
+                      />
+                    ))}
+                </View>
+              );
+            })}
+          </>
+        )}
       </ScrollView>
 
       {/* Checkout Bar */}
@@ -276,6 +411,18 @@ const styles = StyleSheet.create({
     borderTopColor: colors.border + '30',
   },
   cartItemChecked: { opacity: 0.6 },
+  viewSwitch: {
+    flexDirection: 'row',
+    borderRadius: borderRadius.lg,
+    padding: 4,
+    marginTop: spacing.lg,
+  },
+  viewSwitchBtn: {
+    flex: 1,
+    alignItems: 'center',
+    paddingVertical: spacing.sm,
+    borderRadius: borderRadius.md,
+  },
   checkoutBar: {
     position: 'absolute',
     bottom: 0,
@@ -185,7 +185,7 @@ const ChatBotScreen: React.FC<ChatBotScreenProps> = ({ onClose }) => {
           }).join('\n')}\nWhen the user asks for recipes or meal ideas, prioritize using ingredients they already have. If items are expiring soon, suggest recipes that use those first.`
         : undefined;
 
-      const reply = await chatWithGemini(trimmed, history, pantryContext);
+      const reply = await chatWithGemini('chatbot', trimmed, history, pantryContext);
       addMessage('bot', reply);
     } catch (error: any) {
       addMessage(
@@ -28,7 +28,7 @@ import { colors } from '../theme/colors';
 import { typography } from '../theme/typography';
 import { spacing, borderRadius } from '../theme/spacing';
 import { useThemeStore } from '../store/useThemeStore';
-import { usePantryStore } from '../store/usePantryStore';
+import { usePantryStore, selectPantryNames } from '../store/usePantryStore';
 import { useCartStore } from '../store/useCartStore';
 import { getQuickRecipeIdeas } from '../services/gemini';
 import type { NavigationProp } from '@react-navigation/native';
@@ -44,9 +44,9 @@ const HomeScreen: React.FC<Props> = ({ navigation }) => {
   const insets = useSafeAreaInsets();
   const isDark = useThemeStore((s) => s.isDarkMode);
   const ingredients = usePantryStore((s) => s.ingredients);
-  const cartItems = useCartStore((s) => s.items);
-  const getItemCount = useCartStore((s) => s.getItemCount);
-  const getTotalCost = useCartStore((s) => s.getTotalCost);
+  const pantryNames = usePantryStore(selectPantryNames);
+  const cartItemCount = useCartStore((s) => s.itemCount);
+  const cartTotalCost = useCartStore((s) => s.totalCost);
 
   const [quickRecipes, setQuickRecipes] = useState<
     { title: string; description: string; time: string; ingredients: string[] }[]
@@ -67,8 +67,7 @@ const HomeScreen: React.FC<Props> = ({ navigation }) => {
   const loadQuickRecipes = async () => {
     setLoadingRecipes(true);
     try {
-      const names = ingredients.map((i) => i.name);
-      const recipes = await getQuickRecipeIdeas(names);
+      const recipes = await getQuickRecipeIdeas(pantryNames);
       setQuickRecipes(recipes);
     } catch {
       // silently fail
@@ -88,14 +87,14 @@ const HomeScreen: React.FC<Props> = ({ navigation }) => {
     {
       icon: ShoppingCart,
       label: 'Cart Items',
-      value: getItemCount().toString(),
+      value: cartItemCount.toString(),
       color: colors.primary,
       onPress: () => navigation.navigate('Cart' as any),
     },
     {
       icon: TrendingUp,
       label: 'Est. Cost',
-      value: '$' + getTotalCost().toFixed(0),
+      value: '$' + cartTotalCost.toFixed(0),
       color: colors.info,
       onPress: () => navigation.navigate('Cart' as any),
     },
@@ -316,7 +315,7 @@ const HomeScreen: React.FC<Props> = ({ navigation }) => {
           </View>
         )}
 
-        {cartItems.length > 0 && (
+        {cartItemCount > 0 && (
           <View style={styles.section}>
             <View style={styles.sectionHeader}>
               <Text style={[typography.subtitle, { color: textColor }]}>Cart Preview</Text>
@@ -334,10 +333,10 @@ const HomeScreen: React.FC<Props> = ({ navigation }) => {
               </LinearGradient>
               <View style={{ flex: 1 }}>
                 <Text style={[typography.bodySmall, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>
-                  {getItemCount()} items in cart
+                  {cartItemCount} items in cart
                 </Text>
                 <Text style={[typography.caption, { color: subtextColor }]}>
-                  {'Estimated: $' + getTotalCost().toFixed(2)}
+                  {'Estimated: $' + cartTotalCost.toFixed(2)}
                 </Text>
               </View>
               <ArrowRight size={18} color={subtextColor} />
@@ -33,6 +33,7 @@ import { spacing, borderRadius } from '../theme/spacing';
 import { getShadow } from '../theme/shadows';
 import { useThemeStore } from '../store/useThemeStore';
 import { useNutritionStore, DailyNutrition } from '../store/useNutritionStore';
+import { sumRange } from '../utils/nutritionRollups';
 import { useProfileStore } from '../store/useProfileStore';
 import { TabScreenProps } from '../navigation/types';
 import AppHeader from '../components/AppHeader';
@@ -112,7 +113,9 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
   const cardBg = isDark ? colors.cardDark : colors.cardLight;
   const textColor = isDark ? colors.textPrimary : colors.textDark;
 
-  const entries = useNutritionStore((s) => s.entries);
+  const entriesByDate = useNutritionStore((s) => s.entriesByDate);
+  const rollupsByDate = useNutritionStore((s) => s.rollupsByDate);
+  const dates = useNutritionStore((s) => s.dates);
   const weeklyGoal = useNutritionStore((s) => s.weeklyGoal);
   const profile = useProfileStore();
   const dailyCalTarget = profile.profile.dailyCalorieTarget || weeklyGoal.calories;
@@ -129,30 +132,20 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
     setRefDate(d);
   };
 
-  // Filter entries by period
-  const filtered = useMemo(() => {
+  // Meals logged on the selected day
+  const dayEntries = viewMode === 'daily' ? entriesByDate[fmtDate(refDate)] ?? [] : [];
+
+  // Aggregates, summed from per-day rollups
+  const totals = useMemo(() => {
     if (viewMode === 'daily') {
       const ds = fmtDate(refDate);
-      return entries.filter((e) => e.date === ds);
+      return sumRange(dates, rollupsByDate, ds, ds);
     }
     const range = viewMode === 'weekly' ? weekRange(refDate) : monthRange(refDate);
-    const s = fmtDate(range.start);
-    const e = fmtDate(range.end);
-    return entries.filter((x) => x.date >= s && x.date <= e);
-  }, [entries, viewMode, refDate]);
-
-  // Aggregates
-  const totals = useMemo(() => {
-    const t = { calories: 0, protein: 0, carbs: 0, fat: 0, fiber: 0, sodium: 0 };
-    filtered.forEach((e) => {
-      t.calories += e.calories; t.protein += e.protein;
-      t.carbs += e.carbs; t.fat += e.fat;
-      t.fiber += e.fiber; t.sodium += e.sodium;
-    });
-    return t;
-  }, [filtered]);
+    return sumRange(dates, rollupsByDate, fmtDate(range.start), fmtDate(range.end));
+  }, [dates, rollupsByDate, viewMode, refDate]);
 
-  const numDays = useMemo(() => new Set(filtered.map((e) => e.date)).size || 1, [filtered]);
+  const numDays = totals.days || 1;
 
   const avgDaily = useMemo(() => ({
     calories: totals.calories / numDays,
@@ -170,7 +163,7 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
       for (let i = 6; i >= 0; i--) {
         const d = new Date(refDate); d.setDate(d.getDate() - i);
         labels.push(DAY_NAMES[d.getDay()]);
-        pts.push(entries.filter((e) => e.date === fmtDate(d)).reduce((s, e) => s + e.calories, 0));
+        pts.push(rollupsByDate[fmtDate(d)]?.calories ?? 0);
       }
       return { labels, datasets: [{ data: pts.length ? pts : [0] }] };
     } else if (viewMode === 'weekly') {
@@ -179,7 +172,7 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
       for (let i = 0; i < 7; i++) {
         const d = new Date(start); d.setDate(start.getDate() + i);
         labels.push(DAY_NAMES[d.getDay()]);
-        pts.push(entries.filter((e) => e.date === fmtDate(d)).reduce((s, e) => s + e.calories, 0));
+        pts.push(rollupsByDate[fmtDate(d)]?.calories ?? 0);
       }
       return { labels, datasets: [{ data: pts.length ? pts : [0] }] };
     } else {
@@ -190,11 +183,11 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
         const we = new Date(ws); we.setDate(ws.getDate() + 6);
         labels.push(`W${w + 1}`);
         const wsd = fmtDate(ws); const wed = fmtDate(we > end ? end : we);
-        pts.push(entries.filter((e) => e.date >= wsd && e.date <= wed).reduce((s, e) => s + e.calories, 0));
+        pts.push(sumRange(dates, rollupsByDate, wsd, wed).calories);
       }
       return { labels, datasets: [{ data: pts.length ? pts : [0] }] };
     }
-  }, [entries, viewMode, refDate]);
+  }, [dates, rollupsByDate, viewMode, refDate]);
 
   // Period label
   const periodLabel = useMemo(() => {
@@ -397,10 +390,10 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
         )}
 
         {/* Meal Log (daily only) */}
-        {viewMode === 'daily' && filtered.length > 0 && (
+        {viewMode === 'daily' && dayEntries.length > 0 && (
           <Animated.View entering={FadeInUp.delay(450).duration(300)} style={{ marginTop: spacing.md }}>
             <Text style={[typography.subtitle, { color: textColor, marginBottom: spacing.sm }]}>Meal Log</Text>
-            {filtered.map((entry, i) => (
+            {dayEntries.map((entry, i) => (
               <View key={`${entry.recipeName}-${i}`} style={[styles.mealItem, { backgroundColor: cardBg }, getShadow('small')]}>
                 <View style={{ flex: 1 }}>
                   <Text style={[typography.body, { color: textColor, fontFamily: 'Inter-SemiBold' }]}>{entry.recipeName}</Text>
@@ -444,7 +437,7 @@ const NutritionScreen = ({ navigation }: TabScreenProps<'Nutrition'>) => {
           />
         </Animated.View>
 
-        {filtered.length === 0 && (
+        {totals.meals === 0 && (
           <View style={styles.emptyState}>
             <Calendar size={40} color={colors.textMuted} />
             <Text style={[typography.body, { color: colors.textMuted, marginTop: spacing.sm, textAlign: 'center' }]}>
@@ -32,13 +32,18 @@ import { typography } from '../theme/typography';
 import { spacing, borderRadius } from '../theme/spacing';
 import { getShadow } from '../theme/shadows';
 import { useThemeStore } from '../store/useThemeStore';
-import { usePantryStore } from '../store/usePantryStore';
+import {
+  usePantryStore,
+  selectExpiringCount,
+  selectFilteredIngredients,
+} from '../store/usePantryStore';
 import { TabScreenProps } from '../navigation/types';
 import AppHeader from '../components/AppHeader';
 import FilterChip from '../components/FilterChip';
 import IngredientCard from '../components/IngredientCard';
 import Badge from '../components/Badge';
 import { hapticLight, hapticMedium, hapticSuccess } from '../utils/haptics';
+import { traceRender } from '../utils/trace';
 import { chatWithGemini } from '../services/gemini';
 import { Ingredient, IngredientCategory, UnitType } from '../types/ingredient';
 
@@ -103,26 +108,21 @@ const filters = ['All', 'Expiring', 'Surplus'] as const;
 // ─── Component ──────────────────────────────────────────────────────
 
 const PantryScreen = ({ navigation }: TabScreenProps<'Pantry'>) => {
+  traceRender('PantryScreen');
   const insets = useSafeAreaInsets();
   const isDarkMode = useThemeStore((s) => s.isDarkMode);
-  const {
-    filter,
-    searchQuery,
-    setFilter,
-    setSearchQuery,
-    getFilteredIngredients,
-    ingredients,
-    addIngredient,
-  } = usePantryStore();
+  const filter = usePantryStore((s) => s.filter);
+  const searchQuery = usePantryStore((s) => s.searchQuery);
+  const setFilter = usePantryStore((s) => s.setFilter);
+  const setSearchQuery = usePantryStore((s) => s.setSearchQuery);
+  const ingredients = usePantryStore((s) => s.ingredients);
+  const addIngredient = usePantryStore((s) => s.addIngredient);
+  const filteredIngredients = usePantryStore(selectFilteredIngredients);
+  const expiringCount = usePantryStore(selectExpiringCount);
 
   const bg = isDarkMode ? colors.backgroundDark : colors.backgroundLight;
   const cardBg = isDarkMode ? colors.cardDark : colors.cardLight;
   const textColor = isDarkMode ? colors.textPrimary : colors.textDark;
-  const filteredIngredients = getFilteredIngredients();
-
-  const expiringCount = ingredients.filter(
-    (i) => i.daysUntilExpiry !== undefined && i.daysUntilExpiry <= 3
-  ).length;
 
   // ── Chat state ────────────────────────────────────────────────────
   const [chatOpen, setChatOpen] = useState(false);
@@ -229,6 +229,7 @@ const PantryScreen = ({ navigation }: TabScreenProps<'Pantry'>) => {
       }
 
       const reply = await chatWithGemini(
+        'pantry',
         trimmed,
         [{ role: 'user' as const, text: pantryPrompt }, { role: 'model' as const, text: 'Understood! I can see your pantry. Tell me what food items you have and I\'ll help you add them.' }, ...history],
       );
@@ -26,7 +26,7 @@ import { spacing, borderRadius } from '../theme/spacing';
 import { getShadow } from '../theme/shadows';
 import { useThemeStore } from '../store/useThemeStore';
 import { useCookbookStore } from '../store/useCookbookStore';
-import { usePantryStore } from '../store/usePantryStore';
+import { usePantryStore, selectPantryNames } from '../store/usePantryStore';
 import { findRecipesFromCookbooks } from '../services/gemini';
 import RecipeMatchCard from '../components/RecipeMatchCard';
 import AILoadingAnimation from '../components/AILoadingAnimation';
@@ -37,7 +37,7 @@ const RecipeFinderScreen = ({ navigation }: any) => {
   const isDarkMode = useThemeStore((s) => s.isDarkMode);
   const { cookbooks, recipeMatches, isSearching, searchError, setRecipeMatches, setIsSearching, setSearchError } =
     useCookbookStore();
-  const pantryIngredients = usePantryStore((s) => s.ingredients);
+  const pantryNames = usePantryStore(selectPantryNames);
 
   const [customIngredients, setCustomIngredients] = useState<string[]>([]);
   const [inputValue, setInputValue] = useState('');
@@ -50,7 +50,7 @@ const RecipeFinderScreen = ({ navigation }: any) => {
 
   // Build ingredient list from pantry + custom
   const allIngredients = [
-    ...(usePantry ? pantryIngredients.map((i) => i.name) : []),
+    ...(usePantry ? pantryNames : []),
     ...customIngredients,
   ];
 
@@ -151,10 +151,10 @@ const RecipeFinderScreen = ({ navigation }: any) => {
               />
             </View>
           </TouchableOpacity>
-          {usePantry && pantryIngredients.length > 0 && (
+          {usePantry && pantryNames.length > 0 && (
             <View style={styles.pantryPreview}>
               <Text style={[typography.caption, { color: colors.textSecondary }]}>
-                From pantry: {pantryIngredients.map((i) => i.name).join(', ')}
+                From pantry: {pantryNames.join(', ')}
               </Text>
             </View>
           )}
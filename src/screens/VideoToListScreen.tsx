@@ -82,6 +82,10 @@ const VideoToListScreen = ({ navigation }: any) => {
       setExtractedRecipes(result.recipes);
       setCurrentGroceryList(result.combinedList);
       setTotalEstimatedCost(result.totalEstimatedCost ?? null);
+      if (result.failedUrls.length > 0) {
+        const n = result.failedUrls.length;
+        setExtractionError(`Couldn't read ${n} link${n === 1 ? '' : 's'}; the list covers the rest.`);
+      }
       hapticSuccess();
     } catch (err: any) {
       setExtractionError(err.message || 'Failed to extract recipes.');
@@ -0,0 +1,167 @@
+/**
+ * Chat Context — CulinaMind AI
+ * Keeps each chat request's prompt bounded no matter how long the session
+ * runs:
+ *  • The most recent turns are sent verbatim, newest first, until the
+ *    history token budget is spent.
+ *  • Older turns are folded into a compact rolling digest (one clipped line
+ *    per turn, oldest lines dropped once the digest budget is full) that is
+ *    appended to the system instruction. The digest is extended
+ *    incrementally as turns age out rather than rebuilt every message.
+ *  • The assembled system instruction is memoized per pantry context, so the
+ *    static prompt is only concatenated when the pantry actually changes.
+ * Every build records prompt-size metrics for the turn. A manager holds the
+ * state of one conversation; use a separate manager for each.
+ */
+
+import { hashString } from '../utils/hash';
+
+export interface ChatTurn {
+  role: 'user' | 'model';
+  text: string;
+}
+
+export interface ChatPromptMetrics {
+  timestamp: number;
+  systemTokens: number;
+  digestTokens: number;
+  historyTokens: number;
+  messageTokens: number;
+  totalTokens: number;
+  turnsSent: number;
+  turnsDigested: number;
+}
+
+export interface ChatContext {
+  systemInstruction: string;
+  history: ChatTurn[];
+  metrics: ChatPromptMetrics;
+}
+
+const HISTORY_TOKEN_BUDGET = 2000;
+const DIGEST_TOKEN_BUDGET = 400;
+const DIGEST_LINE_CHARS = 140;
+const METRICS_KEPT = 50;
+
+/**
+ * Rough token estimate (~4 characters per token for English text). Good
+ * enough for budgeting; the API does its own exact count.
+ */
+export const estimateTokens = (text: string): number => Math.ceil(text.length / 4);
+
+function digestLine(turn: ChatTurn): string {
+  const flat = turn.text.replace(/\s+/g, ' ').trim();
+  const clipped = flat.length > DIGEST_LINE_CHARS ? `${flat.slice(0, DIGEST_LINE_CHARS - 1)}…` : flat;
+  return `${turn.role === 'user' ? 'User' : 'You'}: ${clipped}`;
+}
+
+/** Chained hash of `hash` followed by turns [from, to). */
+function extendHash(hash: string, turns: ChatTurn[], from: number, to: number): string {
+  for (let i = from; i < to; i++) hash = hashString(`${hash}\u0000${turns[i].role}\u0000${turns[i].text}`);
+  return hash;
+}
+
+export class ChatContextManager {
+  // Rolling digest of history[0 .. digestedCount)
+  private digestLines: string[] = [];
+  private digestTokens = 0;
+  private digestedCount = 0;
+  private digestedHash = '';
+
+  private systemCache: { key: string; text: string; tokens: number } | null = null;
+  private metricsLog: ChatPromptMetrics[] = [];
+
+  constructor(
+    private readonly baseInstruction: string,
+    private readonly historyBudget: number = HISTORY_TOKEN_BUDGET,
+    private readonly digestBudget: number = DIGEST_TOKEN_BUDGET,
+  ) {}
+
+  build(history: ChatTurn[], userMessage: string, pantryContext?: string): ChatContext {
+    const system = this.systemInstruction(pantryContext);
+
+    // Walk back from the newest turn until the budget runs out.
+    let historyTokens = 0;
+    let cut = history.length;
+    while (cut > 0) {
+      const cost = estimateTokens(history[cut - 1].text);
+      if (historyTokens + cost > this.historyBudget) break;
+      historyTokens += cost;
+      cut--;
+    }
+    // Gemini expects the conversation to open with a user turn.
+    while (cut < history.length && history[cut].role !== 'user') {
+      historyTokens -= estimateTokens(history[cut].text);
+      cut++;
+    }
+
+    this.updateDigest(history, cut);
+    const digest = this.digestLines.length
+      ? `\n\nSummary of the earlier conversation (oldest first):\n${this.digestLines.join('\n')}`
+      : '';
+
+    const digestTokens = estimateTokens(digest);
+    const messageTokens = estimateTokens(userMessage);
+    const metrics: ChatPromptMetrics = {
+      timestamp: Date.now(),
+      systemTokens: system.tokens,
+      digestTokens,
+      historyTokens,
+      messageTokens,
+      totalTokens: system.tokens + digestTokens + historyTokens + messageTokens,
+      turnsSent: history.length - cut,
+      turnsDigested: cut,
+    };
+    this.metricsLog.push(metrics);
+    if (this.metricsLog.length > METRICS_KEPT) this.metricsLog.shift();
+
+    return {
+      systemInstruction: system.text + digest,
+      history: history.slice(cut),
+      metrics,
+    };
+  }
+
+  /** Prompt-size metrics for the most recent turns, oldest first. */
+  metrics(): ChatPromptMetrics[] {
+    return this.metricsLog.slice();
+  }
+
+  reset(): void {
+    this.digestLines = [];
+    this.digestTokens = 0;
+    this.digestedCount = 0;
+    this.digestedHash = '';
+  }
+
+  private systemInstruction(pantryContext?: string) {
+    const key = pantryContext ?? '';
+    if (!this.systemCache || this.systemCache.key !== key) {
+      const text = pantryContext ? `${this.baseInstruction}\n\n${pantryContext}` : this.baseInstruction;
+      this.systemCache = { key, text, tokens: estimateTokens(text) };
+    }
+    return this.systemCache;
+  }
+
+  private updateDigest(history: ChatTurn[], cut: number): void {
+    // History is append-only within a conversation; if what we digested last
+    // time is no longer a prefix (chat cleared, a turn edited, or the window
+    // grew back), start over.
+    let hash = cut >= this.digestedCount ? extendHash('', history, 0, this.digestedCount) : null;
+    if (hash !== this.digestedHash) {
+      this.reset();
+      hash = '';
+    }
+
+    for (let i = this.digestedCount; i < cut; i++) {
+      const line = digestLine(history[i]);
+      this.digestLines.push(line);
+      this.digestTokens += estimateTokens(line) + 1;
+    }
+    while (this.digestTokens > this.digestBudget && this.digestLines.length > 0) {
+      this.digestTokens -= estimateTokens(this.digestLines.shift()!) + 1;
+    }
+    this.digestedHash = extendHash(hash, history, this.digestedCount, cut);
+    this.digestedCount = cut;
+  }
+}
@@ -0,0 +1,180 @@
+/**
+ * Extraction Cache — CulinaMind AI
+ * On-device store for recipes extracted from URLs, so importing a link we
+ * have already read costs nothing. Entries are keyed by a normalized form
+ * of the URL (tracking parameters dropped, YouTube links reduced to the
+ * video id) and stamped with when they were extracted; callers decide how
+ * old is too old. Each result lives in its own JSON file under the app's
+ * document directory, with an index of save and access times so the least
+ * recently used entries are evicted past a fixed count.
+ */
+
+import * as FileSystem from 'expo-file-system';
+import { hashString } from '../utils/hash';
+
+const CACHE_DIR = `${FileSystem.documentDirectory}url-extractions/`;
+const INDEX_PATH = `${CACHE_DIR}index.json`;
+const INDEX_VERSION = 1;
+const MAX_ENTRIES = 200;
+const INDEX_WRITE_DELAY_MS = 500;
+
+/** Recipe pages rarely change; re-extract after a month by default. */
+export const EXTRACTION_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+
+interface IndexEntry {
+  url: string;
+  savedAt: number;
+  lastAccess: number;
+}
+
+interface IndexFile {
+  version: number;
+  entries: Record<string, IndexEntry>;
+}
+
+export interface CachedExtraction<T> {
+  value: T;
+  /** When the extraction ran (ms since epoch). */
+  savedAt: number;
+}
+
+export interface ExtractionCacheStats {
+  entries: number;
+  maxEntries: number;
+}
+
+let index: Map<string, IndexEntry> | null = null;
+let loading: Promise<Map<string, IndexEntry>> | null = null;
+let indexWriteTimer: ReturnType<typeof setTimeout> | null = null;
+
+const TRACKING_PARAMS = /^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|igshid|si|feature|ref|ref_src)$/i;
+const YOUTUBE_HOSTS = new Set(['youtube.com', 'm.youtube.com', 'music.youtube.com', 'youtu.be']);
+
+/**
+ * Canonical form of a recipe URL: the same page shared from different
+ * places ("youtu.be/ID?si=…", "youtube.com/watch?v=ID&t=30",
+ * "www.site.com/recipe/?utm_source=…#comments") normalizes to one string.
+ * Unparseable input is returned trimmed.
+ */
+export function normalizeRecipeUrl(url: string): string {
+  let parsed: URL;
+  try {
+    parsed = new URL(/^[a-z][\w+.-]*:\/\//i.test(url.trim()) ? url.trim() : `https://${url.trim()}`);
+  } catch {
+    return url.trim();
+  }
+  const host = parsed.hostname.toLowerCase().replace(/^www\./, '');
+
+  if (YOUTUBE_HOSTS.has(host)) {
+    const id =
+      host === 'youtu.be'
+        ? parsed.pathname.split('/')[1]
+        : parsed.searchParams.get('v') ?? /^\/(?:shorts|embed|live)\/([^/]+)/.exec(parsed.pathname)?.[1];
+    if (id) return `youtube:${id}`;
+  }
+
+  const params = Array.from(parsed.searchParams.entries())
+    .filter(([name]) => !TRACKING_PARAMS.test(name))
+    .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+  const query = params.length > 0 ? `?${new URLSearchParams(params).toString()}` : '';
+  const path = parsed.pathname.replace(/\/+$/, '');
+  return `${host}${parsed.port ? `:${parsed.port}` : ''}${path}${query}`;
+}
+
+/** Stable cache key for a URL's extraction. */
+export function extractionCacheKey(url: string): string {
+  return hashString(normalizeRecipeUrl(url));
+}
+
+async function loadIndex(): Promise<Map<string, IndexEntry>> {
+  if (index) return index;
+  if (!loading) {
+    loading = (async () => {
+      const loaded = new Map<string, IndexEntry>();
+      try {
+        await FileSystem.makeDirectoryAsync(CACHE_DIR, { intermediates: true });
+        const info = await FileSystem.getInfoAsync(INDEX_PATH);
+        if (info.exists) {
+          const parsed = JSON.parse(await FileSystem.readAsStringAsync(INDEX_PATH)) as IndexFile;
+          if (parsed.version === INDEX_VERSION) {
+            for (const [key, entry] of Object.entries(parsed.entries)) loaded.set(key, entry);
+          }
+        }
+      } catch (error) {
+        console.warn('Extraction cache index unreadable, starting empty:', error);
+      }
+      index = loaded;
+      return loaded;
+    })();
+  }
+  return loading;
+}
+
+function scheduleIndexWrite(): void {
+  if (indexWriteTimer) clearTimeout(indexWriteTimer);
+  indexWriteTimer = setTimeout(() => {
+    indexWriteTimer = null;
+    if (!index) return;
+    const data: IndexFile = { version: INDEX_VERSION, entries: Object.fromEntries(index) };
+    FileSystem.writeAsStringAsync(INDEX_PATH, JSON.stringify(data)).catch((error) =>
+      console.warn('Failed to write extraction cache index:', error),
+    );
+  }, INDEX_WRITE_DELAY_MS);
+}
+
+async function evictOverLimit(entries: Map<string, IndexEntry>): Promise<void> {
+  if (entries.size <= MAX_ENTRIES) return;
+  const oldestFirst = Array.from(entries.entries()).sort((a, b) => a[1].lastAccess - b[1].lastAccess);
+  for (const [key] of oldestFirst.slice(0, entries.size - MAX_ENTRIES)) {
+    entries.delete(key);
+    await FileSystem.deleteAsync(`${CACHE_DIR}${key}.json`, { idempotent: true }).catch(() => {});
+  }
+}
+
+/**
+ * Return the cached extraction for `key` if it is younger than `maxAgeMs`,
+ * else null. Stale entries are left in place for the next put to replace.
+ */
+export async function getCachedExtraction<T>(
+  key: string,
+  maxAgeMs: number = EXTRACTION_MAX_AGE_MS,
+): Promise<CachedExtraction<T> | null> {
+  const entries = await loadIndex();
+  const entry = entries.get(key);
+  if (!entry || Date.now() - entry.savedAt > maxAgeMs) return null;
+
+  try {
+    const value = JSON.parse(await FileSystem.readAsStringAsync(`${CACHE_DIR}${key}.json`)) as T;
+    entry.lastAccess = Date.now();
+    scheduleIndexWrite();
+    return { value, savedAt: entry.savedAt };
+  } catch {
+    // File missing or corrupt: forget it and extract again.
+    entries.delete(key);
+    scheduleIndexWrite();
+    return null;
+  }
+}
+
+export async function putExtraction<T>(key: string, url: string, value: T): Promise<void> {
+  const entries = await loadIndex();
+  await FileSystem.writeAsStringAsync(`${CACHE_DIR}${key}.json`, JSON.stringify(value));
+  const now = Date.now();
+  entries.set(key, { url, savedAt: now, lastAccess: now });
+  await evictOverLimit(entries);
+  scheduleIndexWrite();
+}
+
+export async function getExtractionCacheStats(): Promise<ExtractionCacheStats> {
+  const entries = await loadIndex();
+  return { entries: entries.size, maxEntries: MAX_ENTRIES };
+}
+
+export async function clearExtractionCache(): Promise<void> {
+  const entries = await loadIndex();
+  entries.clear();
+  if (indexWriteTimer) clearTimeout(indexWriteTimer);
+  indexWriteTimer = null;
+  await FileSystem.deleteAsync(CACHE_DIR, { idempotent: true });
+  await FileSystem.makeDirectoryAsync(CACHE_DIR, { intermediates: true });
+}
@@ -1,7 +1,20 @@
 import { GoogleGenAI } from '@google/genai';
 import { config } from '../config/env';
 import { Cookbook, RecipeMatch } from '../types/cookbook';
-import { ExtractedRecipe, GroceryItem, VideoExtractionResult } from '../types/recipe';
+import { ExtractedRecipe, GroceryCategory, GroceryItem, VideoExtractionResult } from '../types/recipe';
+import { LRUCache, CacheStats } from '../utils/lruCache';
+import { hashString } from '../utils/hash';
+import { JSONArrayStreamParser } from '../utils/jsonStream';
+import { extractJSON } from '../utils/jsonExtract';
+import { mergeIngredients } from '../utils/ingredientMerge';
+import { type Infer, type Schema, arrayOf, num, object, oneOf, optional, str, withDefault } from '../utils/schema';
+import { type Span, startSpan } from '../utils/trace';
+import { ChatContextManager, type ChatPromptMetrics, type ChatTurn } from './chatContext';
+import { RequestScheduler, isAbortError } from './requestScheduler';
+import { getCachedImage, imageCacheKey, putImage } from './imageCache';
+import { EXTRACTION_MAX_AGE_MS, extractionCacheKey, getCachedExtraction, putExtraction } from './extractionCache';
+
+export { isAbortError } from './requestScheduler';
 
 // ─── Types for new AI functions ───────────────────────────────────────
 
@@ -34,34 +47,231 @@ export interface NutritionInsight {
   recommendations: string[];
 }
 
+// ─── Response Schemas ─────────────────────────────────────────────────
+
+const GROCERY_CATEGORIES: readonly GroceryCategory[] = [
+  'Produce', 'Meat & Seafood', 'Dairy & Eggs', 'Bakery', 'Pantry Staples',
+  'Spices & Seasonings', 'Frozen', 'Beverages', 'Other',
+];
+
+const category = withDefault(oneOf(GROCERY_CATEGORIES, 'Other'), 'Other' as GroceryCategory);
+const strings = withDefault(arrayOf(str), [] as string[]);
+
+const groceryItemSchema = object({
+  name: str,
+  quantity: withDefault(str, ''),
+  category,
+  notes: optional(str),
+});
+
+const recipeMatchesSchema = arrayOf(
+  object({
+    title: str,
+    cookbookTitle: str,
+    cookbookAuthor: withDefault(str, ''),
+    matchedIngredients: strings,
+    missingIngredients: strings,
+    matchPercentage: withDefault(num, 0),
+    description: withDefault(str, ''),
+    estimatedTime: optional(str),
+    pageNumber: optional(str),
+  }),
+);
+
+const urlExtractionSchema = object({
+  recipe: object({
+    title: str,
+    sourceUrl: withDefault(str, ''),
+    sourceTitle: optional(str),
+    description: withDefault(str, ''),
+    servings: optional(num),
+    prepTime: optional(str),
+    cookTime: optional(str),
+    totalTime: optional(str),
+    cuisine: optional(str),
+    ingredients: withDefault(arrayOf(groceryItemSchema), []),
+    instructions: strings,
+    tips: optional(arrayOf(str)),
+  }),
+  groceryList: withDefault(arrayOf(groceryItemSchema), []),
+  totalEstimatedCost: optional(str),
+});
+
+const recipeSuggestionSchema = object({
+  title: str,
+  description: withDefault(str, ''),
+  cuisine: withDefault(str, ''),
+  estimatedTime: withDefault(str, ''),
+  difficulty: oneOf(['Easy', 'Medium', 'Hard'] as const, 'Medium'),
+  servings: withDefault(num, 2),
+  ingredients: withDefault(
+    arrayOf(object({ name: str, quantity: withDefault(str, ''), category: withDefault(str, 'Other') })),
+    [],
+  ),
+  instructions: strings,
+  nutritionEstimate: object({ calories: num, protein: num, carbs: num, fat: num }),
+  tags: strings,
+  matchScore: withDefault(num, 0),
+});
+
+const nutritionInsightSchema = object({
+  summary: withDefault(str, ''),
+  tips: strings,
+  warnings: strings,
+  dailyScore: withDefault(num, 0),
+  macroBreakdown: object({ protein: num, carbs: num, fat: num, fiber: withDefault(num, 0) }),
+  recommendations: strings,
+});
+
+const quickIdeasSchema = arrayOf(
+  object({ title: str, description: withDefault(str, ''), time: withDefault(str, ''), ingredients: strings }),
+);
+
+// ─── Parse Timing ─────────────────────────────────────────────────────
+
+export interface ParseStats {
+  calls: number;
+  failures: number;
+  totalMs: number;
+  maxMs: number;
+  lastMs: number;
+}
+
+const parseStats: Record<string, ParseStats> = {};
+
+function recordParse(fn: string, ms: number, failed: boolean): void {
+  const entry = (parseStats[fn] ??= { calls: 0, failures: 0, totalMs: 0, maxMs: 0, lastMs: 0 });
+  entry.calls++;
+  if (failed) entry.failures++;
+  entry.totalMs += ms;
+  entry.lastMs = ms;
+  if (ms > entry.maxMs) entry.maxMs = ms;
+}
+
 /**
- * Extract JSON from a response that may contain markdown fences or extra text.
+ * Locate, parse and validate a model response, timing it under `fn`.
+ * Closes the call's trace span, if any.
  */
-function extractJSON(text: string): any {
-  // Try direct parse first
+function parseResponse<T>(fn: string, text: string, schema: Schema<T>, span?: Span): T {
+  const started = performance.now();
+  let failed = true;
   try {
-    return JSON.parse(text);
-  } catch {}
-  // Try to extract from ```json ... ``` blocks
-  const fenceMatch = text.match(/```(?:json)?\s*([\s\S]*?)```/);
-  if (fenceMatch) {
-    try {
-      return JSON.parse(fenceMatch[1].trim());
-    } catch {}
-  }
-  // Try to find first { or [ and match to last } or ]
-  const start = text.search(/[{\[]/);
-  const end = Math.max(text.lastIndexOf('}'), text.lastIndexOf(']'));
-  if (start !== -1 && end > start) {
-    try {
-      return JSON.parse(text.substring(start, end + 1));
-    } catch {}
+    const value = extractJSON(text, schema);
+    failed = false;
+    return value;
+  } finally {
+    recordParse(fn, performance.now() - started, failed);
+    span?.phase('parse');
+    span?.end(failed ? { error: 'parse' } : undefined);
   }
-  throw new Error('Could not parse JSON from AI response');
+}
+
+/** Per-function JSON extraction/validation timings. */
+export function getParseStats(): Record<string, ParseStats> {
+  const out: Record<string, ParseStats> = {};
+  for (const [fn, stats] of Object.entries(parseStats)) out[fn] = { ...stats };
+  return out;
 }
 
 // Initialize the Gemini client
-const ai = new GoogleGenAI({ apiKey: config.gemini.apiKey });
+const ai = new GoogleGenAI({
+  apiKey: config.gemini.apiKey,
+  ...(config.gemini.baseUrl ? { httpOptions: { baseUrl: config.gemini.baseUrl } } : {}),
+});
+
+// ─── Request Scheduling ───────────────────────────────────────────────
+
+/**
+ * Every Gemini call goes through one scheduler: identical in-flight requests
+ * share a single promise, each model gets its own concurrency cap (image
+ * generation is slow and heavily rate-limited), and callers can pass an
+ * AbortSignal to drop work that is no longer needed.
+ */
+const FLASH_CONCURRENCY = 4;
+const IMAGE_CONCURRENCY = 2;
+
+const scheduler = new RequestScheduler({
+  [config.gemini.models.flash]: FLASH_CONCURRENCY,
+  [config.gemini.models.image]: IMAGE_CONCURRENCY,
+});
+
+type GenerateContentParams = Parameters<typeof ai.models.generateContent>[0];
+
+interface RequestOptions {
+  /** Requests sharing a key while one is in flight are coalesced. */
+  key?: string;
+  signal?: AbortSignal;
+  /**
+   * Trace span of the calling function (see utils/trace). Time up to this
+   * call is recorded as `prompt`, waiting for a lane slot as `queue` and
+   * the round-trip as `network`; a failed request ends the span.
+   */
+  span?: Span;
+}
+
+function generateContent(params: GenerateContentParams, options: RequestOptions = {}) {
+  const { span } = options;
+  span?.phase('prompt');
+  return scheduler
+    .run({ lane: params.model, key: options.key, signal: options.signal }, (signal) => {
+      span?.phase('queue');
+      return ai.models.generateContent({ ...params, config: { ...params.config, abortSignal: signal } });
+    })
+    .then(
+      (response) => {
+        span?.phase('network');
+        return response;
+      },
+      (error) => {
+        span?.end({ error: isAbortError(error) ? 'aborted' : 'request' });
+        throw error;
+      },
+    );
+}
+
+export function getSchedulerStats() {
+  return scheduler.stats();
+}
+
+// ─── Response Cache ───────────────────────────────────────────────────
+
+/**
+ * Text responses are cached by (function, model, normalized inputs) so a
+ * repeated search — e.g. "Search Again" from history — returns instantly
+ * instead of making another round-trip and burning quota.
+ */
+const RESPONSE_CACHE_TTL_MS = 10 * 60 * 1000;
+const RESPONSE_CACHE_MAX_ENTRIES = 100;
+
+const responseCache = new LRUCache<unknown>(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_MS);
+
+const normalizeText = (text?: string) => (text ?? '').trim().toLowerCase().replace(/\s+/g, ' ');
+
+const normalizeList = (items?: string[]) =>
+  Array.from(new Set((items ?? []).map(normalizeText).filter(Boolean))).sort();
+
+function responseCacheKey(fn: string, model: string, inputs: unknown): string {
+  return `${fn}:${model}:${hashString(JSON.stringify(inputs))}`;
+}
+
+async function withResponseCache<T>(key: string, load: () => Promise<T>, span?: Span): Promise<T> {
+  const hit = responseCache.get(key);
+  if (hit !== undefined) {
+    span?.end({ cached: true });
+    return hit as T;
+  }
+  const value = await load();
+  responseCache.set(key, value);
+  return value;
+}
+
+export function getResponseCacheStats(): CacheStats {
+  return responseCache.stats();
+}
+
+export function clearResponseCache(): void {
+  responseCache.clear();
+}
 
 // ─── Cookbook Recipe Finder ────────────────────────────────────────────
 
@@ -74,6 +284,7 @@ export async function findRecipesFromCookbooks(
   availableIngredients: string[],
   dietaryPreferences?: string[],
 ): Promise<RecipeMatch[]> {
+  const span = startSpan('gemini', 'findRecipesFromCookbooks');
   const cookbookList = cookbooks
     .map((c) => `- "${c.title}" by ${c.author}`)
     .join('\n');
@@ -117,22 +328,29 @@ Important:
 - Keep descriptions concise and appetizing
 - Return ONLY the JSON array, no other text`;
 
+  const cacheKey = responseCacheKey('findRecipesFromCookbooks', config.gemini.models.flash, {
+    cookbooks: cookbooks.map((c) => `${normalizeText(c.title)}|${normalizeText(c.author)}`).sort(),
+    ingredients: normalizeList(availableIngredients),
+    diet: normalizeList(dietaryPreferences),
+  });
+
   try {
-    const response = await ai.models.generateContent({
-      model: config.gemini.models.flash,
-      contents: prompt,
-      config: {
-        responseMimeType: 'application/json',
-      },
-    });
+    return await withResponseCache(cacheKey, async () => {
+      const response = await generateContent({
+        model: config.gemini.models.flash,
+        contents: prompt,
+        config: {
+          responseMimeType: 'application/json',
+        },
+      }, { key: cacheKey, span });
 
-    const text = response.text || '[]';
-    const parsed = JSON.parse(text) as Omit<RecipeMatch, 'id'>[];
+      const parsed = parseResponse('findRecipesFromCookbooks', response.text || '[]', recipeMatchesSchema, span);
 
-    return parsed.map((r, i) => ({
-      ...r,
-      id: `match-${Date.now()}-${i}`,
-    }));
+      return parsed.map((r, i) => ({
+        ...r,
+        id: `match-${Date.now()}-${i}`,
+      }));
+    }, span);
   } catch (error) {
     console.error('Gemini cookbook search error:', error);
     throw new Error('Failed to find recipes. Please check your API key and try again.');
@@ -141,13 +359,56 @@ Important:
 
 // ─── Video / URL Recipe Extractor ─────────────────────────────────────
 
+type UrlExtraction = Infer<typeof urlExtractionSchema>;
+
+let extractionSeq = 0;
+
+/** Give an extraction fresh ids, so importing the same URL twice never shares them. */
+function toExtractionResult(parsed: UrlExtraction, extractedAt: number): VideoExtractionResult {
+  const stamp = `${Date.now()}-${extractionSeq++}`;
+  const recipe: ExtractedRecipe = {
+    ...parsed.recipe,
+    id: `recipe-${stamp}`,
+    extractedAt: new Date(extractedAt).toISOString(),
+    ingredients: parsed.recipe.ingredients.map((ing, i) => ({
+      id: `ing-${stamp}-${i}`,
+      ...ing,
+      isChecked: false,
+    })),
+  };
+
+  const groceryList: GroceryItem[] = parsed.groceryList.map((item, i) => ({
+    id: `grocery-${stamp}-${i}`,
+    ...item,
+    isChecked: false,
+  }));
+
+  return {
+    recipe,
+    groceryList,
+    totalEstimatedCost: parsed.totalEstimatedCost,
+  };
+}
+
 /**
  * Given a URL (video or recipe page), ask Gemini to analyze it
- * and extract a structured recipe + grocery list.
+ * and extract a structured recipe + grocery list. Results are kept on
+ * device per normalized URL (see extractionCache); one younger than
+ * `options.maxAgeMs` is returned without a model call. Pass 0 to
+ * force a fresh extraction.
  */
 export async function extractRecipeFromUrl(
   url: string,
+  options: { maxAgeMs?: number; signal?: AbortSignal } = {},
 ): Promise<VideoExtractionResult> {
+  const span = startSpan('gemini', 'extractRecipeFromUrl');
+  const key = extractionCacheKey(url);
+  const cached = await getCachedExtraction<UrlExtraction>(key, options.maxAgeMs ?? EXTRACTION_MAX_AGE_MS);
+  if (cached) {
+    span.end({ cached: true });
+    return toExtractionResult(cached.value, cached.savedAt);
+  }
+
   const isYouTube = /youtu\.?be/.test(url);
   const sourceHint = isYouTube
     ? 'This is a YouTube cooking video. Analyze the video page, title, description, and any available transcript to extract the full recipe.'
@@ -206,51 +467,20 @@ Rules:
   try {
     // NOTE: responseMimeType and thinkingConfig are NOT compatible with tools,
     // so we ask for JSON in the prompt and parse manually.
-    const response = await ai.models.generateContent({
+    // Concurrent imports of the same link share one call.
+    const response = await generateContent({
       model: config.gemini.models.flash,
       contents: prompt,
       config: {
         tools: [{ urlContext: {} }],
       },
-    });
-
-    const text = response.text || '{}';
-    const parsed = extractJSON(text);
-
-    // Add IDs and defaults to items
-    const recipe: ExtractedRecipe = {
-      ...parsed.recipe,
-      id: `recipe-${Date.now()}`,
-      extractedAt: new Date().toISOString(),
-      ingredients: (parsed.recipe.ingredients || []).map(
-        (ing: any, i: number) => ({
-          id: `ing-${Date.now()}-${i}`,
-          name: ing.name,
-          quantity: ing.quantity,
-          category: ing.category || 'Other',
-          isChecked: false,
-          notes: ing.notes,
-        })
-      ),
-    };
-
-    const groceryList: GroceryItem[] = (parsed.groceryList || []).map(
-      (item: any, i: number) => ({
-        id: `grocery-${Date.now()}-${i}`,
-        name: item.name,
-        quantity: item.quantity,
-        category: item.category || 'Other',
-        isChecked: false,
-        notes: item.notes,
-      })
-    );
+    }, { key: `extract:${key}`, signal: options.signal, span });
 
-    return {
-      recipe,
-      groceryList,
-      totalEstimatedCost: parsed.totalEstimatedCost,
-    };
+    const parsed = parseResponse('extractRecipeFromUrl', response.text || '{}', urlExtractionSchema, span);
+    putExtraction(key, url, parsed).catch((error) => console.warn('Failed to cache URL extraction:', error));
+    return toExtractionResult(parsed, Date.now());
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Gemini URL extraction error:', error);
     throw new Error('Failed to extract recipe. Please check the URL and try again.');
   }
@@ -259,107 +489,105 @@ Rules:
 // ─── Multi-URL Grocery List Combiner ──────────────────────────────────
 
 /**
- * Given multiple URLs, extract recipes and produce a
- * combined, deduplicated grocery list.
+ * One shopping list for several recipes. Duplicates are combined on-device
+ * (utils/ingredientMerge), with the recipes that use each line in `notes`.
  */
-export async function combineGroceryLists(
-  urls: string[],
-): Promise<{ recipes: ExtractedRecipe[]; combinedList: GroceryItem[]; totalEstimatedCost: string }> {
-  const urlList = urls.map((u, i) => `${i + 1}. ${u}`).join('\n');
-
-  const prompt = `You are a professional chef and meal-prep expert. A user wants to cook recipes from ALL of the following URLs this week:
-
-${urlList}
-
-Please analyze each URL (they may be YouTube cooking videos, food blogs, or recipe websites). Extract the recipes and create ONE COMBINED, DEDUPLICATED grocery shopping list that covers ALL recipes.
-
-You MUST respond with ONLY valid JSON in this exact format (no markdown, no extra text):
-{
-  "recipes": [
-    {
-      "title": "Recipe Name",
-      "sourceUrl": "the url",
-      "sourceTitle": "Creator name",
-      "description": "Brief description",
-      "servings": 4,
-      "totalTime": "45 min"
-    }
-  ],
-  "combinedList": [
-    {
-      "name": "Item Name",
-      "quantity": "Combined quantity for all recipes",
-      "category": "Produce",
-      "notes": "Used in: Recipe 1, Recipe 3"
-    }
-  ],
-  "totalEstimatedCost": "$50-70"
+export function mergeGroceryLists(recipes: ExtractedRecipe[]): GroceryItem[] {
+  const stamp = Date.now();
+  const lines = mergeIngredients(
+    recipes.flatMap((r) => r.ingredients.map((item) => ({ ...item, recipe: r.title }))),
+  );
+  return lines.map((line, i) => ({
+    id: `grocery-${stamp}-${i}`,
+    name: line.name,
+    quantity: line.quantity,
+    category: line.items[0].category,
+    isChecked: false,
+    notes: `Used in: ${Array.from(new Set(line.items.map((item) => item.recipe))).join(', ')}`,
+  }));
 }
 
-Rules:
-- COMBINE duplicate ingredients (e.g., if two recipes need onions, add the amounts together)
-- Use practical grocery store quantities
-- In notes, indicate which recipes use this ingredient
-- Categories: Produce, Meat & Seafood, Dairy & Eggs, Bakery, Pantry Staples, Spices & Seasonings, Frozen, Beverages, Other
-- Output ONLY the JSON object, nothing else`;
+/** Add up "$25-35"-style estimates; 'N/A' if any of them cannot be read. */
+function sumCostEstimates(costs: (string | undefined)[]): string {
+  let low = 0;
+  let high = 0;
+  for (const cost of costs) {
+    const match = /\$?\s*(\d+(?:\.\d+)?)(?:\s*[-–]\s*\$?\s*(\d+(?:\.\d+)?))?/.exec(cost ?? '');
+    if (!match) return 'N/A';
+    low += parseFloat(match[1]);
+    high += parseFloat(match[2] ?? match[1]);
+  }
+  return Math.round(low) === Math.round(high) ? `$${Math.round(low)}` : `$${Math.round(low)}-${Math.round(high)}`;
+}
 
+/**
+ * Given multiple URLs, extract recipes and produce a combined,
+ * deduplicated grocery list. Each URL is its own extractRecipeFromUrl
+ * call, so cached URLs cost nothing and the rest run in parallel (bounded
+ * by the flash lane's concurrency); the lists are then merged locally in
+ * mergeGroceryLists. URLs that fail are reported in `failedUrls`; the
+ * call only throws if none succeed.
+ */
+export async function combineGroceryLists(
+  urls: string[],
+  options: { maxAgeMs?: number; signal?: AbortSignal } = {},
+): Promise<{
+  recipes: ExtractedRecipe[];
+  combinedList: GroceryItem[];
+  totalEstimatedCost: string;
+  failedUrls: string[];
+}> {
+  const span = startSpan('gemini', 'combineGroceryLists');
+  // The same page pasted twice (or as youtu.be and youtube.com) is one recipe.
+  const unique = new Map<string, string>();
+  for (const url of urls) {
+    const key = extractionCacheKey(url);
+    if (!unique.has(key)) unique.set(key, url);
+  }
+  const targets = Array.from(unique.values());
+  let detail: Record<string, unknown> = { urls: targets.length, error: 'request' };
   try {
-    // NOTE: responseMimeType and thinkingConfig are NOT compatible with tools,
-    // so we ask for JSON in the prompt and parse manually.
-    const response = await ai.models.generateContent({
-      model: config.gemini.models.flash,
-      contents: prompt,
-      config: {
-        tools: [{ urlContext: {} }],
-      },
+    const settled = await Promise.allSettled(targets.map((url) => extractRecipeFromUrl(url, options)));
+    span.phase('extract');
+
+    const results: VideoExtractionResult[] = [];
+    const failedUrls: string[] = [];
+    settled.forEach((outcome, i) => {
+      if (outcome.status === 'fulfilled') results.push(outcome.value);
+      else if (isAbortError(outcome.reason)) throw outcome.reason;
+      else failedUrls.push(targets[i]);
     });
+    if (results.length === 0) throw new Error('Failed to process recipe URLs. Please try again.');
 
-    const text = response.text || '{}';
-    const parsed = extractJSON(text);
-
-    const recipes: ExtractedRecipe[] = (parsed.recipes || []).map(
-      (r: any, i: number) => ({
-        ...r,
-        id: `recipe-${Date.now()}-${i}`,
-        ingredients: [],
-        instructions: [],
-        extractedAt: new Date().toISOString(),
-      })
-    );
-
-    const combinedList: GroceryItem[] = (parsed.combinedList || []).map(
-      (item: any, i: number) => ({
-        id: `grocery-${Date.now()}-${i}`,
-        name: item.name,
-        quantity: item.quantity,
-        category: item.category || 'Other',
-        isChecked: false,
-        notes: item.notes,
-      })
-    );
-
+    const recipes = results.map((r) => ({ ...r.recipe, ingredientCount: r.recipe.ingredients.length }));
+    const combinedList = mergeGroceryLists(recipes);
+    span.phase('merge');
+    detail = { urls: targets.length, failed: failedUrls.length };
     return {
       recipes,
       combinedList,
-      totalEstimatedCost: parsed.totalEstimatedCost || 'N/A',
+      totalEstimatedCost: sumCostEstimates(results.map((r) => r.totalEstimatedCost)),
+      failedUrls,
     };
   } catch (error) {
-    console.error('Gemini multi-URL error:', error);
-    throw new Error('Failed to process recipe URLs. Please try again.');
+    if (isAbortError(error)) detail = { urls: targets.length, error: 'aborted' };
+    throw error;
+  } finally {
+    span.end(detail);
   }
 }
 
 // ─── AI Recipe Search / Generation ────────────────────────────────────
 
 /**
- * Generate recipe suggestions based on a user query, cuisine filter, and
- * optionally the ingredients they already have in their pantry.
+ * Build the prompt and response-cache key for a recipe search. Shared by the
+ * buffered and streaming variants so they hit the same cache entries.
  */
-export async function generateRecipesFromQuery(
+function recipeQueryRequest(
   query: string,
   cuisine?: string,
   pantryIngredients?: string[],
-): Promise<AIRecipeSuggestion[]> {
+): { prompt: string; cacheKey: string } {
   const pantryNote =
     pantryIngredients && pantryIngredients.length > 0
       ? `\nThe user already has these ingredients in their pantry: ${pantryIngredients.join(', ')}. Prefer recipes that use these.`
@@ -404,28 +632,159 @@ Rules:
 - Sort by matchScore descending
 - Return ONLY the JSON array`;
 
+  const cacheKey = responseCacheKey('generateRecipesFromQuery', config.gemini.models.flash, {
+    query: normalizeText(query),
+    cuisine: cuisine && cuisine !== 'All' ? normalizeText(cuisine) : '',
+    pantry: normalizeList(pantryIngredients),
+  });
+
+  return { prompt, cacheKey };
+}
+
+/**
+ * Generate recipe suggestions based on a user query, cuisine filter, and
+ * optionally the ingredients they already have in their pantry.
+ */
+export async function generateRecipesFromQuery(
+  query: string,
+  cuisine?: string,
+  pantryIngredients?: string[],
+  options: { signal?: AbortSignal } = {},
+): Promise<AIRecipeSuggestion[]> {
+  const span = startSpan('gemini', 'generateRecipesFromQuery');
+  const { prompt, cacheKey } = recipeQueryRequest(query, cuisine, pantryIngredients);
+
   try {
-    const response = await ai.models.generateContent({
-      model: config.gemini.models.flash,
-      contents: prompt,
-      config: {
-        responseMimeType: 'application/json',
-      },
-    });
+    return await withResponseCache(cacheKey, async () => {
+      const response = await generateContent({
+        model: config.gemini.models.flash,
+        contents: prompt,
+        config: {
+          responseMimeType: 'application/json',
+        },
+      }, { key: cacheKey, signal: options.signal, span });
 
-    const text = response.text || '[]';
-    const parsed = JSON.parse(text) as Omit<AIRecipeSuggestion, 'id'>[];
+      const parsed = parseResponse('generateRecipesFromQuery', response.text || '[]', arrayOf(recipeSuggestionSchema), span);
 
-    return parsed.map((r, i) => ({
-      ...r,
-      id: `ai-recipe-${Date.now()}-${i}`,
-    }));
+      return parsed.map((r, i) => ({
+        ...r,
+        id: `ai-recipe-${Date.now()}-${i}`,
+      }));
+    }, span);
   } catch (error) {
+    if (isAbortError(error)) throw error;
     console.error('Gemini recipe search error:', error);
     throw new Error('Failed to generate recipes. Please try again.');
   }
 }
 
+interface SharedStream {
+  recipes: AIRecipeSuggestion[];
+  listeners: Set<(recipe: AIRecipeSuggestion, index: number) => void>;
+}
+
+/** Recipe streams in flight, by response-cache key. */
+const liveStreams = new Map<string, SharedStream>();
+
+/**
+ * Streaming variant of generateRecipesFromQuery: `onRecipe` is called with
+ * each suggestion as soon as its JSON object is complete, so the first card
+ * can render long before the model has finished the whole array. Resolves
+ * with the full list (which is also stored in the response cache); on a
+ * cache hit every recipe is emitted immediately. Identical searches in
+ * flight share one stream: a caller that joins late is first given the
+ * recipes that have already arrived.
+ */
+export async function streamRecipesFromQuery(
+  query: string,
+  cuisine: string | undefined,
+  pantryIngredients: string[] | undefined,
+  onRecipe: (recipe: AIRecipeSuggestion, index: number) => void,
+  options: { signal?: AbortSignal } = {},
+): Promise<AIRecipeSuggestion[]> {
+  const span = startSpan('gemini', 'streamRecipesFromQuery');
+  const { prompt, cacheKey } = recipeQueryRequest(query, cuisine, pantryIngredients);
+
+  const cached = responseCache.get(cacheKey) as AIRecipeSuggestion[] | undefined;
+  if (cached !== undefined) {
+    cached.forEach((recipe, i) => onRecipe(recipe, i));
+    span.end({ cached: true });
+    return cached;
+  }
+
+  let shared = liveStreams.get(cacheKey);
+  if (!shared) {
+    shared = { recipes: [], listeners: new Set() };
+    liveStreams.set(cacheKey, shared);
+  }
+  const stream = shared;
+  let emitted = 0;
+  const listener = (recipe: AIRecipeSuggestion, index: number) => {
+    if (index !== emitted) return;
+    emitted++;
+    onRecipe(recipe, index);
+  };
+  stream.recipes.forEach(listener);
+  stream.listeners.add(listener);
+
+  const model = config.gemini.models.flash;
+  try {
+    span.phase('prompt');
+    const results = await scheduler.run({ lane: model, key: `stream:${cacheKey}`, signal: options.signal }, async (signal) => {
+      span.phase('queue');
+      const { recipes, listeners } = stream;
+      const response = await ai.models.generateContentStream({
+        model,
+        contents: prompt,
+        config: {
+          responseMimeType: 'application/json',
+          abortSignal: signal,
+        },
+      });
+
+      const parser = new JSONArrayStreamParser();
+      const stamp = Date.now();
+      for await (const chunk of response) {
+        if (recipes.length === 0) span.phase('firstRecipe');
+        const started = performance.now();
+        let elements: unknown[];
+        try {
+          elements = parser.feed(chunk.text ?? '');
+          recordParse('streamRecipesFromQuery', performance.now() - started, false);
+        } catch (parseError) {
+          recordParse('streamRecipesFromQuery', performance.now() - started, true);
+          throw parseError;
+        }
+        for (const element of elements) {
+          if (signal.aborted) return recipes;
+          const r = recipeSuggestionSchema(element, `$[${recipes.length}]`);
+          const recipe = { ...r, id: `ai-recipe-${stamp}-${recipes.length}` };
+          recipes.push(recipe);
+          listeners.forEach((l) => l(recipe, recipes.length - 1));
+        }
+      }
+      if (!parser.complete) throw new Error('Recipe stream ended before the JSON array closed');
+      // Finished: a search started from now on gets a new stream.
+      if (liveStreams.get(cacheKey) === stream) liveStreams.delete(cacheKey);
+      return recipes;
+    });
+    // A caller that attached after the stream was handed off still gets every recipe.
+    results.forEach(listener);
+    span.phase('stream');
+    span.end({ recipes: results.length });
+    responseCache.set(cacheKey, results);
+    return results;
+  } catch (error) {
+    span.end({ error: isAbortError(error) ? 'aborted' : 'request' });
+    if (isAbortError(error)) throw error;
+    console.error('Gemini recipe stream error:', error);
+    throw new Error('Failed to generate recipes. Please try again.');
+  } finally {
+    stream.listeners.delete(listener);
+    if (stream.listeners.size === 0 && liveStreams.get(cacheKey) === stream) liveStreams.delete(cacheKey);
+  }
+}
+
 // ─── Nutrition Insights ───────────────────────────────────────────────
 
 /**
@@ -435,6 +794,7 @@ export async function getNutritionInsights(
   recentMeals: { name: string; calories: number; protein: number; carbs: number; fat: number }[],
   userProfile?: { age?: number; weight?: number; height?: number; goal?: string; diet?: string },
 ): Promise<NutritionInsight> {
+  const span = startSpan('gemini', 'getNutritionInsights');
   const mealsList = recentMeals
     .map((m) => `- ${m.name}: ${m.calories} cal, ${m.protein}g protein, ${m.carbs}g carbs, ${m.fat}g fat`)
     .join('\n');
@@ -466,17 +826,23 @@ Rules:
 - warnings only if there are genuine concerns (empty array otherwise)
 - Return ONLY the JSON`;
 
+  const cacheKey = responseCacheKey('getNutritionInsights', config.gemini.models.flash, {
+    recentMeals,
+    userProfile: userProfile ?? null,
+  });
+
   try {
-    const response = await ai.models.generateContent({
-      model: config.gemini.models.flash,
-      contents: prompt,
-      config: {
-        responseMimeType: 'application/json',
-      },
-    });
+    return await withResponseCache(cacheKey, async () => {
+      const response = await generateContent({
+        model: config.gemini.models.flash,
+        contents: prompt,
+        config: {
+          responseMimeType: 'application/json',
+        },
+      }, { key: cacheKey, span });
 
-    const text = response.text || '{}';
-    return JSON.parse(text) as NutritionInsight;
+      return parseResponse('getNutritionInsights', response.text || '{}', nutritionInsightSchema, span);
+    }, span);
   } catch (error) {
     console.error('Gemini nutrition insights error:', error);
     throw new Error('Failed to generate nutrition insights.');
@@ -491,6 +857,7 @@ Rules:
 export async function getQuickRecipeIdeas(
   pantryIngredients: string[],
 ): Promise<{ title: string; description: string; time: string; ingredients: string[] }[]> {
+  const span = startSpan('gemini', 'getQuickRecipeIdeas');
   const prompt = `You are a creative home chef. The user has these ingredients in their pantry:
 ${pantryIngredients.join(', ')}
 
@@ -506,17 +873,22 @@ Respond with ONLY a JSON array:
   }
 ]`;
 
+  const cacheKey = responseCacheKey('getQuickRecipeIdeas', config.gemini.models.flash, {
+    pantry: normalizeList(pantryIngredients),
+  });
+
   try {
-    const response = await ai.models.generateContent({
-      model: config.gemini.models.flash,
-      contents: prompt,
-      config: {
-        responseMimeType: 'application/json',
-      },
-    });
+    return await withResponseCache(cacheKey, async () => {
+      const response = await generateContent({
+        model: config.gemini.models.flash,
+        contents: prompt,
+        config: {
+          responseMimeType: 'application/json',
+        },
+      }, { key: cacheKey, span });
 
-    const text = response.text || '[]';
-    return JSON.parse(text);
+      return parseResponse('getQuickRecipeIdeas', response.text || '[]', quickIdeasSchema, span);
+    }, span);
   } catch (error) {
     console.error('Gemini quick recipe error:', error);
     throw new Error('Failed to generate recipe ideas.');
@@ -525,22 +897,59 @@ Respond with ONLY a JSON array:
 
 // ─── Recipe Image Generation ──────────────────────────────────────────
 
+const IMAGE_STYLE =
+  'Soft natural lighting, shallow depth of field, warm tones, clean background, professional food photography style. No text or watermarks.';
+
+function dishPrompt(recipeTitle: string, recipeDescription?: string): string {
+  const descHint = recipeDescription ? ` The dish is described as: ${recipeDescription}.` : '';
+  return `"${recipeTitle}" plated beautifully on a modern ceramic dish.${descHint}`;
+}
+
+/** First inline image in a response, as a data URI. */
+function responseImage(response: Awaited<ReturnType<typeof generateContent>>): string | null {
+  const parts = response.candidates?.[0]?.content?.parts || [];
+  for (const part of parts) {
+    if (part.inlineData && part.inlineData.mimeType?.startsWith('image/')) {
+      return `data:${part.inlineData.mimeType};base64,${part.inlineData.data}`;
+    }
+  }
+  return null;
+}
+
+async function cacheImage(key: string, dataUri: string): Promise<string> {
+  try {
+    return await putImage(key, dataUri);
+  } catch (cacheError) {
+    console.warn('Failed to cache recipe image:', cacheError);
+    return dataUri;
+  }
+}
+
 /**
  * Generate a photorealistic food image using Gemini's image generation model.
- * Returns a base64-encoded data URI string, or null on failure.
+ * Images are kept in the on-device image cache, so a recipe is only ever
+ * generated once. Returns a file URI for the cached image (or the raw data
+ * URI if it could not be written), or null on failure or when
+ * `options.signal` is aborted.
  */
 export async function generateRecipeImage(
   recipeTitle: string,
   recipeDescription?: string,
+  options: { signal?: AbortSignal } = {},
 ): Promise<string | null> {
-  const descHint = recipeDescription
-    ? ` The dish is described as: ${recipeDescription}.`
-    : '';
+  const span = startSpan('gemini', 'generateRecipeImage');
+  const prompt = `A photorealistic, appetizing, top-down food photography shot of ${dishPrompt(recipeTitle, recipeDescription)} ${IMAGE_STYLE}`;
 
-  const prompt = `A photorealistic, appetizing, top-down food photography shot of "${recipeTitle}" plated beautifully on a modern ceramic dish.${descHint} Soft natural lighting, shallow depth of field, warm tones, clean background, professional food photography style. No text or watermarks.`;
+  const imageKey = imageCacheKey(recipeTitle, recipeDescription);
 
   try {
-    const response = await ai.models.generateContent({
+    const cached = await getCachedImage(imageKey);
+    if (cached) {
+      span.end({ cached: true });
+      return cached;
+    }
+
+    const response = await generateContent({
       model: config.gemini.models.image,
       contents: prompt,
       config: {
@@ -548,22 +957,19 @@ export async function generateRecipeImage(
           aspectRatio: '1:1',
         },
       },
+    }, {
+      key: `image:${imageKey}`,
+      signal: options.signal,
+      span,
     });
 
-    // Look for inline image data in the response parts
-    if (response.candidates && response.candidates.length > 0) {
-      const parts = response.candidates[0].content?.parts || [];
-      for (const part of parts) {
-        if (part.inlineData && part.inlineData.mimeType?.startsWith('image/')) {
-          const base64 = part.inlineData.data;
-          const mimeType = part.inlineData.mimeType;
-          return `data:${mimeType};base64,${base64}`;
-        }
-      }
-    }
-
-    return null;
+    const dataUri = responseImage(response);
+    const uri = dataUri ? await cacheImage(imageKey, dataUri) : null;
+    span.phase('cache');
+    span.end(uri ? undefined : { error: 'no image' });
+    return uri;
   } catch (error) {
+    if (isAbortError(error)) return null;
     console.error('Gemini image generation error:', error);
     return null;
   }
@@ -579,8 +985,9 @@ export async function transcribeAudio(
   base64Audio: string,
   mimeType: string = 'audio/mp4',
 ): Promise<string> {
+  const span = startSpan('gemini', 'transcribeAudio');
   try {
-    const response = await ai.models.generateContent({
+    const response = await generateContent({
       model: config.gemini.models.flash,
       contents: [
         {
@@ -598,9 +1005,10 @@ export async function transcribeAudio(
           ],
         },
       ],
-    });
+    }, { span });
 
     const text = response.text?.trim() || '';
+    span.end({ audioBytes: Math.floor((base64Audio.length * 3) / 4) });
     return text;
   } catch (error) {
     console.error('Gemini audio transcription error:', error);
@@ -610,21 +1018,9 @@ export async function transcribeAudio(
 
 // ─── Chatbot Conversational AI ────────────────────────────────────────
 
-export interface ChatTurn {
-  role: 'user' | 'model';
-  text: string;
-}
+export type { ChatTurn, ChatPromptMetrics } from './chatContext';
 
-/**
- * Send a conversational message to Gemini with full chat history.
- * Returns the bot's text reply.
- */
-export async function chatWithGemini(
-  userMessage: string,
-  history: ChatTurn[] = [],
-  pantryContext?: string,
-): Promise<string> {
-  let systemInstruction = `You are CulinaMind AI — a friendly, knowledgeable cooking and food assistant inside a mobile recipe app. Your personality is warm, encouraging, and concise.
+const CHAT_SYSTEM_INSTRUCTION = `You are CulinaMind AI — a friendly, knowledgeable cooking and food assistant inside a mobile recipe app. Your personality is warm, encouraging, and concise.
 
 You can help users with:
 • Recipe suggestions and step-by-step cooking instructions
@@ -640,13 +1036,41 @@ Rules:
 - When suggesting a recipe, include estimated time and difficulty.
 - Format ingredient lists and steps clearly.`;
 
-  if (pantryContext) {
-    systemInstruction += `\n\n${pantryContext}`;
+// One context manager per conversation, so digests never cross chats.
+const chatContexts = new Map<string, ChatContextManager>();
+
+function chatContextFor(conversationId: string): ChatContextManager {
+  let manager = chatContexts.get(conversationId);
+  if (!manager) {
+    manager = new ChatContextManager(CHAT_SYSTEM_INSTRUCTION);
+    chatContexts.set(conversationId, manager);
   }
+  return manager;
+}
 
+/** Prompt-size metrics for a conversation's recent turns, oldest first. */
+export function getChatPromptMetrics(conversationId: string): ChatPromptMetrics[] {
+  return chatContexts.get(conversationId)?.metrics() ?? [];
+}
+
+/**
+ * Send a conversational message to Gemini. Only a token-budgeted window of
+ * recent `history` is sent verbatim; older turns go into a rolling digest
+ * (see chatContext.ts) kept per `conversationId`, e.g. one per chat screen.
+ * Returns the bot's text reply.
+ */
+export async function chatWithGemini(
+  conversationId: string,
+  userMessage: string,
+  history: ChatTurn[] = [],
+  pantryContext?: string,
+): Promise<string> {
+  const span = startSpan('gemini', 'chatWithGemini');
   try {
-    // Build the contents array with history
-    const contents = history.map((turn) => ({
+    const { systemInstruction, history: recentTurns } = chatContextFor(conversationId).build(history, userMessage, pantryContext);
+
+    // Build the contents array with the windowed history
+    const contents = recentTurns.map((turn) => ({
       role: turn.role === 'model' ? ('model' as const) : ('user' as const),
       parts: [{ text: turn.text }],
     }));
@@ -657,14 +1081,15 @@ Rules:
       parts: [{ text: userMessage }],
     });
 
-    const response = await ai.models.generateContent({
+    const response = await generateContent({
       model: config.gemini.models.flash,
       contents,
       config: {
         systemInstruction,
       },
-    });
+    }, { span });
 
+    span.end({ turns: recentTurns.length });
     return response.text?.trim() || "I'm sorry, I couldn't generate a response. Please try again.";
   } catch (error) {
     console.error('Gemini chat error:', error);
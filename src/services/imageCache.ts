@@ -0,0 +1,198 @@
+/**
+ * Image Cache — CulinaMind AI
+ * On-device store for generated recipe images. Each image is decoded once
+ * from base64 and written to its own file under the app's document
+ * directory; callers get back a `file://` URI they can hand straight to
+ * <Image source={{ uri }} />. An index file tracks size and last access so
+ * the cache stays under a byte budget (least recently used images are
+ * evicted first) and survives app restarts.
+ *
+ * Images that saved state must keep (cooked history) are pinned: copied
+ * out of the cache into a directory that is never evicted. State stores
+ * only the pinned file's name and resolves it with pinnedImageUri when
+ * rendering, so the URI is rebuilt from the current document directory.
+ */
+
+import * as FileSystem from 'expo-file-system';
+import { hashString } from '../utils/hash';
+
+const CACHE_DIR = `${FileSystem.documentDirectory}recipe-images/`;
+const INDEX_PATH = `${CACHE_DIR}index.json`;
+const INDEX_VERSION = 1;
+const MAX_CACHE_BYTES = 64 * 1024 * 1024;
+const INDEX_WRITE_DELAY_MS = 500;
+const PINNED_DIR = `${FileSystem.documentDirectory}saved-images/`;
+
+interface IndexEntry {
+  file: string;
+  bytes: number;
+  lastAccess: number;
+}
+
+interface IndexFile {
+  version: number;
+  entries: Record<string, IndexEntry>;
+}
+
+export interface ImageCacheStats {
+  entries: number;
+  bytes: number;
+  maxBytes: number;
+}
+
+let index: Map<string, IndexEntry> | null = null;
+let loading: Promise<Map<string, IndexEntry>> | null = null;
+let indexWriteTimer: ReturnType<typeof setTimeout> | null = null;
+
+const EXTENSIONS: Record<string, string> = {
+  'image/png': 'png',
+  'image/jpeg': 'jpg',
+  'image/webp': 'webp',
+};
+
+/** Stable cache key for a recipe's generated image. */
+export function imageCacheKey(recipeTitle: string, recipeDescription?: string): string {
+  const normalize = (text?: string) => (text ?? '').trim().toLowerCase().replace(/\s+/g, ' ');
+  return hashString(`${normalize(recipeTitle)}|${normalize(recipeDescription)}`);
+}
+
+/** Decoded size of a base64 payload, without decoding it. */
+function base64ByteLength(base64: string): number {
+  const padding = base64.endsWith('==') ? 2 : base64.endsWith('=') ? 1 : 0;
+  return Math.floor((base64.length * 3) / 4) - padding;
+}
+
+async function loadIndex(): Promise<Map<string, IndexEntry>> {
+  if (index) return index;
+  if (!loading) {
+    loading = (async () => {
+      const loaded = new Map<string, IndexEntry>();
+      try {
+        await FileSystem.makeDirectoryAsync(CACHE_DIR, { intermediates: true });
+        const info = await FileSystem.getInfoAsync(INDEX_PATH);
+        if (info.exists) {
+          const parsed = JSON.parse(await FileSystem.readAsStringAsync(INDEX_PATH)) as IndexFile;
+          if (parsed.version === INDEX_VERSION) {
+            for (const [key, entry] of Object.entries(parsed.entries)) loaded.set(key, entry);
+          }
+        }
+      } catch (error) {
+        console.warn('Image cache index unreadable, starting empty:', error);
+      }
+      index = loaded;
+      return loaded;
+    })();
+  }
+  return loading;
+}
+
+function scheduleIndexWrite(): void {
+  if (indexWriteTimer) clearTimeout(indexWriteTimer);
+  indexWriteTimer = setTimeout(() => {
+    indexWriteTimer = null;
+    if (!index) return;
+    const data: IndexFile = { version: INDEX_VERSION, entries: Object.fromEntries(index) };
+    FileSystem.writeAsStringAsync(INDEX_PATH, JSON.stringify(data)).catch((error) =>
+      console.warn('Failed to write image cache index:', error),
+    );
+  }, INDEX_WRITE_DELAY_MS);
+}
+
+async function evictOverBudget(entries: Map<string, IndexEntry>): Promise<void> {
+  let total = 0;
+  entries.forEach((e) => (total += e.bytes));
+  if (total <= MAX_CACHE_BYTES) return;
+
+  const oldestFirst = Array.from(entries.entries()).sort((a, b) => a[1].lastAccess - b[1].lastAccess);
+  for (const [key, entry] of oldestFirst) {
+    if (total <= MAX_CACHE_BYTES) break;
+    entries.delete(key);
+    total -= entry.bytes;
+    await FileSystem.deleteAsync(CACHE_DIR + entry.file, { idempotent: true }).catch(() => {});
+  }
+}
+
+/**
+ * Return the file URI for a cached image, or null if it is not cached
+ * (or its file has gone missing).
+ */
+export async function getCachedImage(key: string): Promise<string | null> {
+  const entries = await loadIndex();
+  const entry = entries.get(key);
+  if (!entry) return null;
+
+  const uri = CACHE_DIR + entry.file;
+  const info = await FileSystem.getInfoAsync(uri);
+  if (!info.exists) {
+    entries.delete(key);
+    scheduleIndexWrite();
+    return null;
+  }
+  entry.lastAccess = Date.now();
+  scheduleIndexWrite();
+  return uri;
+}
+
+/**
+ * Decode a `data:image/...;base64,` URI into the cache and return the file URI.
+ */
+export async function putImage(key: string, dataUri: string): Promise<string> {
+  const match = /^data:([^;]+);base64,([\s\S]*)$/.exec(dataUri);
+  if (!match) throw new Error('Expected a base64 data URI');
+  const [, mimeType, base64] = match;
+
+  const entries = await loadIndex();
+  const file = `${key}.${EXTENSIONS[mimeType] ?? 'img'}`;
+  await FileSystem.writeAsStringAsync(CACHE_DIR + file, base64, {
+    encoding: FileSystem.EncodingType.Base64,
+  });
+
+  entries.set(key, { file, bytes: base64ByteLength(base64), lastAccess: Date.now() });
+  await evictOverBudget(entries);
+  scheduleIndexWrite();
+  return CACHE_DIR + file;
+}
+
+export async function getImageCacheStats(): Promise<ImageCacheStats> {
+  const entries = await loadIndex();
+  let bytes = 0;
+  entries.forEach((e) => (bytes += e.bytes));
+  return { entries: entries.size, bytes, maxBytes: MAX_CACHE_BYTES };
+}
+
+export async function clearImageCache(): Promise<void> {
+  const entries = await loadIndex();
+  entries.clear();
+  if (indexWriteTimer) clearTimeout(indexWriteTimer);
+  indexWriteTimer = null;
+  await FileSystem.deleteAsync(CACHE_DIR, { idempotent: true });
+  await FileSystem.makeDirectoryAsync(CACHE_DIR, { intermediates: true });
+}
+
+/**
+ * Copy a cached image (a URI returned by this cache) into permanent
+ * storage and return its file name, or null if `uri` is not a cache file.
+ */
+export async function pinImage(uri: string): Promise<string | null> {
+  if (!uri.startsWith(CACHE_DIR)) return null;
+  const file = uri.slice(CACHE_DIR.length);
+  try {
+    await FileSystem.makeDirectoryAsync(PINNED_DIR, { intermediates: true });
+    const info = await FileSystem.getInfoAsync(PINNED_DIR + file);
+    if (!info.exists) await FileSystem.copyAsync({ from: uri, to: PINNED_DIR + file });
+    return file;
+  } catch (error) {
+    console.warn('Failed to pin recipe image:', error);
+    return null;
+  }
+}
+
+/** URI of a pinned image, for <Image source={{ uri }} />. */
+export function pinnedImageUri(file: string): string {
+  return PINNED_DIR + file;
+}
+
+/** Delete a pinned image once nothing refers to it. */
+export async function unpinImage(file: string): Promise<void> {
+  await FileSystem.deleteAsync(PINNED_DIR + file, { idempotent: true }).catch(() => {});
+}
@@ -0,0 +1,132 @@
+/**
+ * Image Queue — CulinaMind AI
+ * Thumbnails for recipe list cards. Every recipe gets its own generated
+ * image, the same cached one its card shows when opened, drawn at card
+ * size and decoded downscaled on the device (resizeMethod="resize").
+ *
+ * Requests are held for a moment and then served by priority, so cards on
+ * screen are drawn before ones the user has scrolled past, and only one
+ * thumbnail is generated at a time. Images already in the image cache are
+ * returned straight away; the cache forgets what it evicts, so nothing
+ * here can hand out a URI whose file is gone.
+ */
+
+import { generateRecipeImage } from './gemini';
+import { getCachedImage, imageCacheKey } from './imageCache';
+
+interface ImageRecipe {
+  title: string;
+  description?: string;
+}
+
+/** Lower runs first. */
+export const PRIORITY_VISIBLE = 0;
+export const PRIORITY_OFFSCREEN = 1;
+
+const BATCH_WINDOW_MS = 600;
+// One at a time leaves the image lane's other slot for full-size requests.
+const MAX_IN_FLIGHT = 1;
+
+interface Pending extends ImageRecipe {
+  key: string;
+  priority: number;
+  seq: number;
+  waiters: number;
+  listeners: ((uri: string | null) => void)[];
+  /** Set once dispatched; aborts the generation when no one is waiting on it. */
+  release?: () => void;
+}
+
+const queue: Pending[] = [];
+const byKey = new Map<string, Pending>(); // queued or in flight
+let seq = 0;
+let timer: ReturnType<typeof setTimeout> | null = null;
+let inFlight = 0;
+
+/**
+ * Thumbnail URI for a recipe card, or null on failure or when
+ * `options.signal` is aborted. Identical requests share one result.
+ */
+export async function requestThumbnail(
+  recipe: ImageRecipe,
+  options: { priority?: number; signal?: AbortSignal } = {},
+): Promise<string | null> {
+  const { priority = PRIORITY_OFFSCREEN, signal } = options;
+  if (signal?.aborted) return null;
+
+  const key = imageCacheKey(recipe.title, recipe.description);
+  const cached = await getCachedImage(key);
+  if (cached || signal?.aborted) return cached;
+
+  let entry = byKey.get(key);
+  if (!entry) {
+    entry = { ...recipe, key, priority, seq: seq++, waiters: 0, listeners: [] };
+    byKey.set(key, entry);
+    queue.push(entry);
+    schedule();
+  } else {
+    entry.priority = Math.min(entry.priority, priority);
+  }
+  return attach(entry, signal);
+}
+
+/** Re-rank a pending request, e.g. as its card scrolls into or out of view. */
+export function setThumbnailPriority(recipe: ImageRecipe, priority: number): void {
+  const entry = byKey.get(imageCacheKey(recipe.title, recipe.description));
+  if (entry) entry.priority = priority;
+}
+
+function attach(entry: Pending, signal?: AbortSignal): Promise<string | null> {
+  entry.waiters++;
+  return new Promise((resolve) => {
+    const listener = (uri: string | null) => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve(uri);
+    };
+    const onAbort = () => {
+      entry.listeners = entry.listeners.filter((l) => l !== listener);
+      if (--entry.waiters === 0) {
+        const at = queue.indexOf(entry);
+        if (at !== -1) queue.splice(at, 1);
+        if (byKey.get(entry.key) === entry) byKey.delete(entry.key);
+        entry.release?.();
+      }
+      resolve(null);
+    };
+    entry.listeners.push(listener);
+    signal?.addEventListener('abort', onAbort);
+  });
+}
+
+function settle(entry: Pending, uri: string | null): void {
+  if (byKey.get(entry.key) === entry) byKey.delete(entry.key);
+  entry.listeners.forEach((l) => l(uri));
+  entry.listeners = [];
+}
+
+function schedule(): void {
+  if (!timer) timer = setTimeout(dispatch, BATCH_WINDOW_MS);
+}
+
+function dispatch(): void {
+  if (timer) clearTimeout(timer);
+  timer = null;
+  while (queue.length > 0 && inFlight < MAX_IN_FLIGHT) {
+    queue.sort((a, b) => a.priority - b.priority || a.seq - b.seq);
+    run(queue.shift()!);
+  }
+}
+
+async function run(entry: Pending): Promise<void> {
+  inFlight++;
+  const controller = new AbortController();
+  entry.release = () => controller.abort();
+  try {
+    // Shares the request (and cache entry) with the full-size image.
+    settle(entry, await generateRecipeImage(entry.title, entry.description, { signal: controller.signal }));
+  } finally {
+    inFlight--;
+    // Whatever queued up meanwhile has already waited a full window.
+    dispatch();
+  }
+}
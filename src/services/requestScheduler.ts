@@ -0,0 +1,165 @@
+/**
+ * Request Scheduler — CulinaMind AI
+ * Sits between the app and the Gemini client:
+ *  • Coalesces identical in-flight requests (same key) into one shared promise.
+ *  • Caps concurrency per lane (one lane per model), queueing the rest FIFO.
+ *  • Supports cancellation through AbortSignal. A caller that aborts stops
+ *    waiting straight away; the underlying request is aborted only once every
+ *    caller sharing it has gone.
+ */
+
+export class AbortError extends Error {
+  constructor(message = 'Request was cancelled') {
+    super(message);
+    this.name = 'AbortError';
+  }
+}
+
+/** True for our AbortError and for the DOMException fetch throws on abort. */
+export const isAbortError = (error: unknown): boolean =>
+  typeof error === 'object' && error !== null && (error as { name?: unknown }).name === 'AbortError';
+
+interface Lane {
+  limit: number;
+  active: number;
+  queue: { start: () => void; cancel: () => void }[];
+}
+
+interface InFlight {
+  promise: Promise<unknown>;
+  controller: AbortController;
+  waiters: number;
+}
+
+export interface ScheduleOptions {
+  /** Concurrency lane, normally the model name. */
+  lane: string;
+  /** Requests with the same key share one in-flight promise. Omit to never coalesce. */
+  key?: string;
+  /** Cancels this caller's interest in the request. */
+  signal?: AbortSignal;
+}
+
+export class RequestScheduler {
+  private lanes = new Map<string, Lane>();
+  private inFlight = new Map<string, InFlight>();
+
+  constructor(
+    limits: Record<string, number>,
+    private readonly defaultLimit: number = 4,
+  ) {
+    for (const [lane, limit] of Object.entries(limits)) {
+      this.lanes.set(lane, { limit, active: 0, queue: [] });
+    }
+  }
+
+  run<T>(options: ScheduleOptions, task: (signal: AbortSignal) => Promise<T>): Promise<T> {
+    const { lane, key, signal } = options;
+    if (signal?.aborted) return Promise.reject(new AbortError());
+
+    let entry = key !== undefined ? this.inFlight.get(key) : undefined;
+    if (!entry) {
+      const controller = new AbortController();
+      const promise = this.acquire(lane, controller.signal).then(async () => {
+        try {
+          if (controller.signal.aborted) throw new AbortError();
+          return await task(controller.signal);
+        } finally {
+          this.release(lane);
+        }
+      });
+      const created: InFlight = { promise, controller, waiters: 0 };
+      entry = created;
+      if (key !== undefined) {
+        this.inFlight.set(key, created);
+        const forget = () => {
+          if (this.inFlight.get(key) === created) this.inFlight.delete(key);
+        };
+        promise.then(forget, forget);
+      }
+    }
+    return this.attach(entry, key, signal) as Promise<T>;
+  }
+
+  /** Number of running and queued requests per lane (for diagnostics). */
+  stats(): Record<string, { active: number; queued: number }> {
+    const out: Record<string, { active: number; queued: number }> = {};
+    this.lanes.forEach((l, name) => {
+      out[name] = { active: l.active, queued: l.queue.length };
+    });
+    return out;
+  }
+
+  private attach(entry: InFlight, key: string | undefined, signal?: AbortSignal): Promise<unknown> {
+    entry.waiters++;
+    if (!signal) return entry.promise;
+
+    return new Promise((resolve, reject) => {
+      let settled = false;
+      const onAbort = () => {
+        if (settled) return;
+        settled = true;
+        entry.waiters--;
+        if (entry.waiters === 0) {
+          if (key !== undefined && this.inFlight.get(key) === entry) this.inFlight.delete(key);
+          entry.controller.abort();
+        }
+        reject(new AbortError());
+      };
+      signal.addEventListener('abort', onAbort);
+      entry.promise.then(
+        (value) => {
+          if (settled) return;
+          settled = true;
+          signal.removeEventListener('abort', onAbort);
+          resolve(value);
+        },
+        (error) => {
+          if (settled) return;
+          settled = true;
+          signal.removeEventListener('abort', onAbort);
+          reject(error);
+        },
+      );
+    });
+  }
+
+  private getLane(name: string): Lane {
+    let lane = this.lanes.get(name);
+    if (!lane) {
+      lane = { limit: this.defaultLimit, active: 0, queue: [] };
+      this.lanes.set(name, lane);
+    }
+    return lane;
+  }
+
+  private acquire(name: string, signal: AbortSignal): Promise<void> {
+    const lane = this.getLane(name);
+    if (lane.active < lane.limit) {
+      lane.active++;
+      return Promise.resolve();
+    }
+    return new Promise((resolve, reject) => {
+      const waiter = {
+        start: () => {
+          signal.removeEventListener('abort', waiter.cancel);
+          lane.active++;
+          resolve();
+        },
+        cancel: () => {
+          lane.queue = lane.queue.filter((w) => w !== waiter);
+          reject(new AbortError());
+        },
+      };
+      signal.addEventListener('abort', waiter.cancel);
+      lane.queue.push(waiter);
+    });
+  }
+
+  private release(name: string): void {
+    const lane = this.getLane(name);
+    lane.active--;
+    const next = lane.queue.shift();
+    if (next) next.start();
+  }
+}
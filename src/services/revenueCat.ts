@@ -17,33 +17,44 @@ const { apiKey, entitlementId } = config.revenueCat;
 
 // ─── Initialisation ─────────────────────────────────────────────────
 
+let configured: Promise<void> | null = null;
+
 /**
- * Call once at app startup (inside App.tsx useEffect).
- * Must be called before any other RevenueCat APIs.
+ * Configure the SDK. App.tsx calls this once the first screen is up, off
+ * the startup critical path; every other function here waits for it (and
+ * starts it if needed), so they are safe to call at any time.
  */
-export async function configureRevenueCat(appUserId?: string): Promise<void> {
-  try {
-    if (__DEV__) {
-      Purchases.setLogLevel(LOG_LEVEL.DEBUG);
-    }
-
-    Purchases.configure({
-      apiKey,
-      appUserID: appUserId || undefined,
-    });
-
-    console.log('[RevenueCat] Configured successfully');
-  } catch (error) {
-    console.error('[RevenueCat] Configuration error:', error);
+export function configureRevenueCat(appUserId?: string): Promise<void> {
+  if (!configured) {
+    configured = (async () => {
+      try {
+        if (__DEV__) {
+          Purchases.setLogLevel(LOG_LEVEL.DEBUG);
+        }
+
+        Purchases.configure({
+          apiKey,
+          appUserID: appUserId || undefined,
+        });
+
+        console.log('[RevenueCat] Configured successfully');
+      } catch (error) {
+        console.error('[RevenueCat] Configuration error:', error);
+      }
+    })();
   }
+  return configured;
 }
 
+const ready = () => configured ?? configureRevenueCat();
+
 // ─── Customer Info ──────────────────────────────────────────────────
 
 /**
  * Fetch the latest customer info from RevenueCat.
  */
 export async function getCustomerInfo(): Promise<CustomerInfo> {
+  await ready();
   return Purchases.getCustomerInfo();
 }
 
@@ -52,6 +63,7 @@ export async function getCustomerInfo(): Promise<CustomerInfo> {
  */
 export async function checkProEntitlement(): Promise<boolean> {
   try {
+    await ready();
     const info = await Purchases.getCustomerInfo();
     return typeof info.entitlements.active[entitlementId] !== 'undefined';
   } catch (error) {
@@ -64,6 +76,7 @@ export async function checkProEntitlement(): Promise<boolean> {
  * Log in / identify a user (e.g. after sign-up or sign-in).
  */
 export async function loginRevenueCat(userId: string): Promise<CustomerInfo> {
+  await ready();
   const { customerInfo } = await Purchases.logIn(userId);
   return customerInfo;
 }
@@ -72,6 +85,7 @@ export async function loginRevenueCat(userId: string): Promise<CustomerInfo> {
  * Log out / reset to anonymous user (e.g. after sign-out).
  */
 export async function logoutRevenueCat(): Promise<CustomerInfo> {
+  await ready();
   return Purchases.logOut();
 }
 
@@ -82,6 +96,7 @@ export async function logoutRevenueCat(): Promise<CustomerInfo> {
  */
 export async function getCurrentOffering(): Promise<PurchasesOffering | null> {
   try {
+    await ready();
     const offerings = await Purchases.getOfferings();
     return offerings.current ?? null;
   } catch (error) {
@@ -95,6 +110,7 @@ export async function getCurrentOffering(): Promise<PurchasesOffering | null> {
  */
 export async function getAllOfferings(): Promise<Record<string, PurchasesOffering>> {
   try {
+    await ready();
     const offerings = await Purchases.getOfferings();
     return offerings.all;
   } catch (error) {
@@ -113,6 +129,7 @@ export async function purchasePackage(
   pkg: PurchasesPackage,
 ): Promise<CustomerInfo | null> {
   try {
+    await ready();
     const { customerInfo } = await Purchases.purchasePackage(pkg);
     return customerInfo;
   } catch (error: any) {
@@ -130,6 +147,7 @@ export async function purchasePackage(
  */
 export async function restorePurchases(): Promise<CustomerInfo | null> {
   try {
+    await ready();
     const info = await Purchases.restorePurchases();
     console.log('[RevenueCat] Purchases restored');
     return info;
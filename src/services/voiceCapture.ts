@@ -0,0 +1,180 @@
+/**
+ * Voice Capture — CulinaMind AI
+ * Records voice search in short segments and transcribes each one as soon
+ * as it is finished, while the user is still speaking:
+ *  • Speech profile: mono, 16 kHz, ~24 kbps AAC — a fraction of the bytes
+ *    of the high-quality music preset, with no loss for transcription.
+ *  • Segments end at a pause once they are a few seconds long (or at a
+ *    hard cap), so words are rarely cut and each upload stays small.
+ *  • Finished segments are transcribed in parallel; the text so far is
+ *    reported in order after each one lands. When the user stops, only
+ *    the last segment is still outstanding.
+ */
+
+import { Audio } from 'expo-av';
+import * as FileSystem from 'expo-file-system';
+import { Platform } from 'react-native';
+import { transcribeAudio } from './gemini';
+
+const SPEECH_RECORDING: Audio.RecordingOptions = {
+  isMeteringEnabled: true,
+  android: {
+    extension: '.m4a',
+    outputFormat: Audio.AndroidOutputFormat.MPEG_4,
+    audioEncoder: Audio.AndroidAudioEncoder.AAC,
+    sampleRate: 16000,
+    numberOfChannels: 1,
+    bitRate: 24000,
+  },
+  ios: {
+    extension: '.m4a',
+    outputFormat: Audio.IOSOutputFormat.MPEG4AAC,
+    audioQuality: Audio.IOSAudioQuality.MEDIUM,
+    sampleRate: 16000,
+    numberOfChannels: 1,
+    bitRate: 24000,
+    linearPCMBitDepth: 16,
+    linearPCMIsBigEndian: false,
+    linearPCMIsFloat: false,
+  },
+  web: {
+    mimeType: 'audio/webm',
+    bitsPerSecond: 24000,
+  },
+};
+
+const SEGMENT_MIME_TYPE = Platform.OS === 'web' ? 'audio/webm' : 'audio/mp4';
+const STATUS_INTERVAL_MS = 150;
+const MIN_SEGMENT_MS = 3000;
+const MAX_SEGMENT_MS = 8000;
+/** Metering level (dBFS) below which the user is taken to be pausing. */
+const PAUSE_DB = -42;
+
+export interface VoiceCapture {
+  /** Stop recording and resolve with the full transcript once the last segment is in. */
+  stop: () => Promise<string>;
+  /** Stop recording and drop any pending transcription. */
+  cancel: () => void;
+}
+
+/**
+ * Start recording. `onTranscript` receives the transcript of the segments
+ * finished so far (in order) each time one more is transcribed. The caller
+ * is responsible for microphone permission.
+ */
+export async function startVoiceCapture(options: {
+  onTranscript: (text: string) => void;
+}): Promise<VoiceCapture> {
+  const texts: (string | undefined)[] = [];
+  const pending: Promise<void>[] = [];
+  let current: Audio.Recording | null = null;
+  let rotation: Promise<void> = Promise.resolve();
+  let rotating = false;
+  let stopped = false;
+  let cancelled = false;
+  let failures = 0;
+
+  const publish = () => {
+    if (cancelled) return;
+    const parts: string[] = [];
+    for (const text of texts) {
+      if (text === undefined) break;
+      if (text) parts.push(text);
+    }
+    options.onTranscript(parts.join(' '));
+  };
+
+  const transcribeSegment = (recording: Audio.Recording) => {
+    const index = texts.length;
+    texts.push(undefined);
+    const uri = recording.getURI();
+    pending.push(
+      (async () => {
+        if (!uri) return '';
+        try {
+          if (cancelled) return '';
+          const base64 = await FileSystem.readAsStringAsync(uri, {
+            encoding: FileSystem.EncodingType.Base64,
+          });
+          return await transcribeAudio(base64, SEGMENT_MIME_TYPE);
+        } finally {
+          FileSystem.deleteAsync(uri, { idempotent: true }).catch(() => {});
+        }
+      })().then(
+        (text) => {
+          texts[index] = text;
+          publish();
+        },
+        (error) => {
+          console.warn('Segment transcription failed:', error);
+          failures++;
+          texts[index] = '';
+          publish();
+        },
+      ),
+    );
+  };
+
+  const begin = async () => {
+    const { recording } = await Audio.Recording.createAsync(SPEECH_RECORDING, onStatus, STATUS_INTERVAL_MS);
+    current = recording;
+  };
+
+  // Close the current segment, hand it to transcription, start the next.
+  const rotate = () => {
+    if (rotating || stopped || !current) return;
+    rotating = true;
+    const finished = current;
+    current = null;
+    rotation = (async () => {
+      try {
+        await finished.stopAndUnloadAsync();
+        transcribeSegment(finished);
+      } catch (error) {
+        console.warn('Voice segment could not be closed:', error);
+      }
+      try {
+        if (!stopped) await begin();
+      } catch (error) {
+        console.warn('Voice segment could not be started:', error);
+      } finally {
+        rotating = false;
+      }
+    })();
+  };
+
+  function onStatus(status: Audio.RecordingStatus) {
+    if (!status.isRecording || rotating) return;
+    const elapsed = status.durationMillis;
+    const pausing = status.metering !== undefined && status.metering < PAUSE_DB;
+    if (elapsed >= MAX_SEGMENT_MS || (elapsed >= MIN_SEGMENT_MS && pausing)) rotate();
+  }
+
+  await Audio.setAudioModeAsync({ allowsRecordingIOS: true, playsInSilentModeIOS: true });
+  await begin();
+
+  const finish = async () => {
+    stopped = true;
+    await rotation;
+    const last = current;
+    current = null;
+    if (last) {
+      await last.stopAndUnloadAsync().catch(() => {});
+      transcribeSegment(last);
+    }
+    await Audio.setAudioModeAsync({ allowsRecordingIOS: false }).catch(() => {});
+  };
+
+  return {
+    stop: async () => {
+      await finish();
+      await Promise.all(pending);
+      if (failures > 0 && failures === texts.length) throw new Error('Failed to transcribe audio. Please try again.');
+      return texts.filter(Boolean).join(' ');
+    },
+    cancel: () => {
+      cancelled = true;
+      finish();
+    },
+  };
+}
@@ -0,0 +1,207 @@
+/**
+ * Store Persistence — CulinaMind AI
+ * Zustand middleware that saves selected state keys to the app's document
+ * directory and restores them on next launch.
+ *
+ *  - Hydration is lazy: nothing is read at app start. A store loads its
+ *    files the first time it is read or subscribed to, so cold start does
+ *    not grow with the amount of saved data.
+ *  - Writes are batched: mutations mark keys dirty and a debounced flush
+ *    (with a max wait, so a steady stream of changes still lands) writes
+ *    only what changed. Pending writes are flushed when the app leaves
+ *    the foreground.
+ *  - Mutations made before a store has hydrated are replayed, in order,
+ *    on top of what was saved: adding to the cart during cold start
+ *    appends to the saved cart, and clearing it clears the saved one.
+ *    Actions should therefore update through `set((state) => ...)`
+ *    rather than from values read earlier.
+ *  - Large keys (chat logs, history maps) are listed as `blobs` and each
+ *    goes to its own file, so a cart toggle never rewrites the chat log.
+ *    Images themselves live in services/imageCache; state only holds URIs.
+ */
+
+import * as FileSystem from 'expo-file-system';
+import { AppState } from 'react-native';
+import type { StateCreator } from 'zustand';
+
+const STORE_DIR = `${FileSystem.documentDirectory}stores/`;
+const WRITE_DELAY_MS = 400;
+const MAX_WRITE_DELAY_MS = 2000;
+
+export interface PersistOptions<T> {
+  /** File name stem; must be unique per store. */
+  name: string;
+  /** Bump when the persisted shape changes; older files are discarded. */
+  version: number;
+  /** Small keys, saved together in `<name>.json`. */
+  keys: (keyof T)[];
+  /** Large keys, each saved to its own `<name>.<key>.json`. */
+  blobs?: (keyof T)[];
+  /** Rebuild derived (unsaved) keys from restored state. */
+  derive?: (state: T) => Partial<T>;
+}
+
+interface PersistedFile {
+  version: number;
+  data: unknown;
+}
+
+interface Persister {
+  flush: () => Promise<void>;
+}
+
+const persisters: Persister[] = [];
+let appStateListening = false;
+
+/** Write every store's pending changes now. */
+export async function flushPersistedStores(): Promise<void> {
+  await Promise.all(persisters.map((p) => p.flush()));
+}
+
+function listenForBackground(): void {
+  if (appStateListening) return;
+  appStateListening = true;
+  AppState.addEventListener('change', (status) => {
+    if (status !== 'active') flushPersistedStores();
+  });
+}
+
+async function readFile(path: string, version: number): Promise<unknown> {
+  const info = await FileSystem.getInfoAsync(path);
+  if (!info.exists) return undefined;
+  const parsed = JSON.parse(await FileSystem.readAsStringAsync(path)) as PersistedFile;
+  return parsed.version === version ? parsed.data : undefined;
+}
+
+function writeFile(path: string, version: number, data: unknown): Promise<void> {
+  const file: PersistedFile = { version, data };
+  return FileSystem.writeAsStringAsync(path, JSON.stringify(file));
+}
+
+export function persisted<T extends object>(
+  options: PersistOptions<T>,
+  init: StateCreator<T>,
+): StateCreator<T> {
+  const { name, version, keys } = options;
+  const blobs = options.blobs ?? [];
+  const mainPath = `${STORE_DIR}${name}.json`;
+  const blobPath = (key: keyof T) => `${STORE_DIR}${name}.${String(key)}.json`;
+
+  return (set, get, api) => {
+    let hydration: Promise<void> | null = null;
+    let hydrated = false;
+    // Updates made before hydration, replayed over the saved state.
+    const early: Parameters<typeof set>[] = [];
+    const recordingSet: typeof set = (...args: Parameters<typeof set>) => {
+      if (!hydrated) early.push(args);
+      return set(...args);
+    };
+    api.setState = recordingSet;
+    const initial = init(recordingSet, get, api);
+
+    let mainDirty = false;
+    const dirtyBlobs = new Set<keyof T>();
+    let timer: ReturnType<typeof setTimeout> | null = null;
+    let firstDirtyAt = 0;
+    let writing: Promise<void> = Promise.resolve();
+
+    const flush = (): Promise<void> => {
+      if (timer) clearTimeout(timer);
+      timer = null;
+      if (!mainDirty && dirtyBlobs.size === 0) return writing;
+
+      const state = get();
+      const writes: Promise<void>[] = [];
+      if (mainDirty) {
+        const data: Partial<T> = {};
+        for (const key of keys) data[key] = state[key];
+        writes.push(writeFile(mainPath, version, data));
+      }
+      dirtyBlobs.forEach((key) => writes.push(writeFile(blobPath(key), version, state[key])));
+      mainDirty = false;
+      dirtyBlobs.clear();
+
+      // Chain so an older write can never land after a newer one.
+      writing = writing
+        .then(() => FileSystem.makeDirectoryAsync(STORE_DIR, { intermediates: true }))
+        .then(() => Promise.all(writes))
+        .then(() => undefined)
+        .catch((error) => console.warn(`Failed to persist ${name} store:`, error));
+      return writing;
+    };
+
+    const schedule = () => {
+      const now = Date.now();
+      if (!timer) firstDirtyAt = now;
+      else clearTimeout(timer);
+      const wait = Math.min(WRITE_DELAY_MS, Math.max(0, firstDirtyAt + MAX_WRITE_DELAY_MS - now));
+      timer = setTimeout(flush, wait);
+    };
+
+    const markChanged = (state: T, prev: T) => {
+      for (const key of keys) if (state[key] !== prev[key]) mainDirty = true;
+      for (const key of blobs) if (state[key] !== prev[key]) dirtyBlobs.add(key);
+      if (mainDirty || dirtyBlobs.size > 0) schedule();
+    };
+
+    const hydrate = () => {
+      if (hydration) return;
+      hydration = (async () => {
+        const restored: Partial<T> = {};
+        try {
+          const [main, ...blobData] = await Promise.all([
+            readFile(mainPath, version),
+            ...blobs.map((key) => readFile(blobPath(key), version)),
+          ]);
+          if (main) Object.assign(restored, main);
+          blobs.forEach((key, i) => {
+            if (blobData[i] !== undefined) restored[key] = blobData[i] as T[keyof T];
+          });
+        } catch (error) {
+          console.warn(`Saved ${name} store unreadable, starting fresh:`, error);
+        }
+
+        // Start from what was on disk (over the initial state, keeping
+        // transient keys as they are now), then replay the updates made
+        // while the files were loading.
+        let state: T = { ...get() };
+        for (const key of [...keys, ...blobs]) state[key] = key in restored ? restored[key]! : initial[key];
+        if (options.derive) state = { ...state, ...options.derive(state) };
+        const saved = state;
+        for (const [partial, replace] of early) {
+          const next = typeof partial === 'function' ? partial(state) : partial;
+          state = replace ? (next as T) : { ...state, ...next };
+        }
+        early.length = 0;
+        if (Object.keys(restored).length > 0 || state !== saved) set(state);
+        hydrated = true;
+
+        // Persist what the replayed updates changed.
+        for (const key of [...keys, ...blobs]) {
+          if (state[key] !== saved[key]) {
+            if (blobs.includes(key)) dirtyBlobs.add(key);
+            else mainDirty = true;
+          }
+        }
+        if (mainDirty || dirtyBlobs.size > 0) schedule();
+      })();
+    };
+
+    const { subscribe, getState } = api;
+    subscribe((state, prev) => {
+      if (hydrated) markChanged(state, prev);
+    });
+    api.subscribe = (listener) => {
+      hydrate();
+      return subscribe(listener);
+    };
+    api.getState = () => {
+      hydrate();
+      return getState();
+    };
+
+    persisters.push({ flush });
+    listenForBackground();
+    return initial;
+  };
+}
@@ -1,4 +1,7 @@
 import { create } from 'zustand';
+import { mergeIngredients, type MergedIngredient } from '../utils/ingredientMerge';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 export interface CartItem {
   id: string;
@@ -17,96 +20,253 @@ export interface CartRecipeGroup {
   recipeName: string;
   items: CartItem[];
   totalEstimatedCost: number;
+  checkedCount: number;
 }
 
-interface CartState {
-  items: CartItem[];
+/** One line of the combined list: the same ingredient across every recipe. */
+export interface CartMergedLine extends MergedIngredient<CartItem> {
+  isChecked: boolean;                               // every merged item checked
+  estimatedPrice: number;
+  recipeNames: string[];
+}
+
+/**
+ * The cart is stored already grouped, with running totals, so screens read
+ * aggregates instead of recomputing them from a flat list on every render.
+ * Mutations update only the recipe group and category list they touch;
+ * every other group keeps its identity. A toggle therefore costs
+ * O(group + category), not O(cart): it copies the two item arrays that
+ * hold the item so memoized rows and selectors see the change by identity.
+ */
+interface CartAggregates {
+  recipeOrder: string[];                            // first added first
+  groupsByRecipe: Record<string, CartRecipeGroup>;
+  itemsByCategory: Record<string, CartItem[]>;
+  recipeByItemId: Record<string, string>;           // item id → recipe id
+  itemCount: number;
+  checkedCount: number;
+  totalCost: number;
+}
+
+interface CartState extends CartAggregates {
   addItemsForRecipe: (recipeId: string, recipeName: string, items: Omit<CartItem, 'recipeId' | 'recipeName' | 'isChecked'>[]) => void;
   removeItem: (id: string) => void;
   toggleItem: (id: string) => void;
   removeRecipeItems: (recipeId: string) => void;
   clearCart: () => void;
   clearChecked: () => void;
-  getGroupedByRecipe: () => CartRecipeGroup[];
-  getGroupedByCategory: () => Record<string, CartItem[]>;
-  getTotalCost: () => number;
-  getItemCount: () => number;
-  getCheckedCount: () => number;
 }
 
-export const useCartStore = create<CartState>((set, get) => ({
-  items: [],
-
-  addItemsForRecipe: (recipeId, recipeName, newItems) =>
-    set((state) => {
-      // Remove existing items for this recipe to avoid duplicates
-      const filtered = state.items.filter((i) => i.recipeId !== recipeId);
-      const itemsToAdd: CartItem[] = newItems.map((item) => ({
-        ...item,
-        recipeId,
-        recipeName,
-        isChecked: false,
-      }));
-      return { items: [...filtered, ...itemsToAdd] };
-    }),
+const categoryOf = (item: CartItem) => item.category || 'Other';
 
-  removeItem: (id) =>
-    set((state) => ({
-      items: state.items.filter((i) => i.id !== id),
-    })),
-
-  toggleItem: (id) =>
-    set((state) => ({
-      items: state.items.map((i) =>
-        i.id === id ? { ...i, isChecked: !i.isChecked } : i
-      ),
-    })),
-
-  removeRecipeItems: (recipeId) =>
-    set((state) => ({
-      items: state.items.filter((i) => i.recipeId !== recipeId),
-    })),
-
-  clearCart: () => set({ items: [] }),
-
-  clearChecked: () =>
-    set((state) => ({
-      items: state.items.filter((i) => !i.isChecked),
-    })),
-
-  getGroupedByRecipe: () => {
-    const items = get().items;
-    const groups: Record<string, CartRecipeGroup> = {};
-    for (const item of items) {
-      if (!groups[item.recipeId]) {
-        groups[item.recipeId] = {
-          recipeId: item.recipeId,
-          recipeName: item.recipeName,
-          items: [],
-          totalEstimatedCost: 0,
-        };
-      }
-      groups[item.recipeId].items.push(item);
-      groups[item.recipeId].totalEstimatedCost += item.estimatedPrice;
+/** Build aggregates from scratch; used for bulk changes and after hydration. */
+function aggregate(items: CartItem[]): CartAggregates {
+  const agg: CartAggregates = {
+    recipeOrder: [],
+    groupsByRecipe: {},
+    itemsByCategory: {},
+    recipeByItemId: {},
+    itemCount: 0,
+    checkedCount: 0,
+    totalCost: 0,
+  };
+  for (const item of items) {
+    let group = agg.groupsByRecipe[item.recipeId];
+    if (!group) {
+      group = { recipeId: item.recipeId, recipeName: item.recipeName, items: [], totalEstimatedCost: 0, checkedCount: 0 };
+      agg.groupsByRecipe[item.recipeId] = group;
+      agg.recipeOrder.push(item.recipeId);
     }
-    return Object.values(groups);
-  },
-
-  getGroupedByCategory: () => {
-    const items = get().items;
-    const groups: Record<string, CartItem[]> = {};
-    for (const item of items) {
-      const cat = item.category || 'Other';
-      if (!groups[cat]) groups[cat] = [];
-      groups[cat].push(item);
-    }
-    return groups;
-  },
+    group.items.push(item);
+    group.totalEstimatedCost += item.estimatedPrice;
+    if (item.isChecked) group.checkedCount++;
+    (agg.itemsByCategory[categoryOf(item)] ??= []).push(item);
+    agg.recipeByItemId[item.id] = item.recipeId;
+    agg.itemCount++;
+    if (item.isChecked) agg.checkedCount++;
+    agg.totalCost += item.estimatedPrice;
+  }
+  return agg;
+}
+
+/** `byCategory` with `removed` dropped from each category they appear in. */
+function withoutInCategories(
+  byCategory: Record<string, CartItem[]>,
+  removed: CartItem[],
+): Record<string, CartItem[]> {
+  const next = { ...byCategory };
+  const gone = new Set(removed);
+  for (const cat of new Set(removed.map(categoryOf))) {
+    const remaining = next[cat].filter((i) => !gone.has(i));
+    if (remaining.length > 0) next[cat] = remaining;
+    else delete next[cat];
+  }
+  return next;
+}
+
+function removeGroup(state: CartAggregates, recipeId: string): CartAggregates {
+  const group = state.groupsByRecipe[recipeId];
+  if (!group) return state;
+  const { [recipeId]: _removed, ...groupsByRecipe } = state.groupsByRecipe;
+  const recipeByItemId = { ...state.recipeByItemId };
+  for (const item of group.items) {
+    if (recipeByItemId[item.id] === recipeId) delete recipeByItemId[item.id];
+  }
+  return {
+    recipeOrder: state.recipeOrder.filter((id) => id !== recipeId),
+    groupsByRecipe,
+    itemsByCategory: withoutInCategories(state.itemsByCategory, group.items),
+    recipeByItemId,
+    itemCount: state.itemCount - group.items.length,
+    checkedCount: state.checkedCount - group.checkedCount,
+    totalCost: state.totalCost - group.totalEstimatedCost,
+  };
+}
+
+const EMPTY_CART = aggregate([]);
 
-  getTotalCost: () =>
-    get().items.reduce((sum, i) => sum + i.estimatedPrice, 0),
+export const useCartStore = create<CartState>(
+  traced('cart', persisted(
+    {
+      name: 'cart',
+      version: 2,
+      keys: ['recipeOrder'],
+      blobs: ['groupsByRecipe'],
+      derive: (s) => aggregate(s.recipeOrder.flatMap((id) => s.groupsByRecipe[id]?.items ?? [])),
+    },
+    (set) => ({
+      ...EMPTY_CART,
 
-  getItemCount: () => get().items.length,
+      addItemsForRecipe: (recipeId, recipeName, newItems) =>
+        set((state) => {
+          // Replace any existing items for this recipe to avoid duplicates
+          const base = removeGroup(state, recipeId);
+          const added = aggregate(
+            newItems.map((item) => ({ ...item, recipeId, recipeName, isChecked: false })),
+          );
+          const itemsByCategory = { ...base.itemsByCategory };
+          for (const [cat, items] of Object.entries(added.itemsByCategory)) {
+            itemsByCategory[cat] = [...(itemsByCategory[cat] ?? []), ...items];
+          }
+          return {
+            recipeOrder: [...base.recipeOrder, ...added.recipeOrder],
+            groupsByRecipe: { ...base.groupsByRecipe, ...added.groupsByRecipe },
+            itemsByCategory,
+            recipeByItemId: { ...base.recipeByItemId, ...added.recipeByItemId },
+            itemCount: base.itemCount + added.itemCount,
+            checkedCount: base.checkedCount,
+            totalCost: base.totalCost + added.totalCost,
+          };
+        }),
 
-  getCheckedCount: () => get().items.filter((i) => i.isChecked).length,
-}));
+      removeItem: (id) =>
+        set((state) => {
+          const recipeId = state.recipeByItemId[id];
+          const group = state.groupsByRecipe[recipeId];
+          const item = group?.items.find((i) => i.id === id);
+          if (!item) return state;
+          if (group.items.length === 1) return removeGroup(state, recipeId);
+
+          const { [id]: _removed, ...recipeByItemId } = state.recipeByItemId;
+          return {
+            groupsByRecipe: {
+              ...state.groupsByRecipe,
+              [recipeId]: {
+                ...group,
+                items: group.items.filter((i) => i !== item),
+                totalEstimatedCost: group.totalEstimatedCost - item.estimatedPrice,
+                checkedCount: group.checkedCount - (item.isChecked ? 1 : 0),
+              },
+            },
+            itemsByCategory: withoutInCategories(state.itemsByCategory, [item]),
+            recipeByItemId,
+            itemCount: state.itemCount - 1,
+            checkedCount: state.checkedCount - (item.isChecked ? 1 : 0),
+            totalCost: state.totalCost - item.estimatedPrice,
+          };
+        }),
+
+      // Copies the item's group and category arrays; totals move by ±1.
+      toggleItem: (id) =>
+        set((state) => {
+          const recipeId = state.recipeByItemId[id];
+          const group = state.groupsByRecipe[recipeId];
+          const index = group ? group.items.findIndex((i) => i.id === id) : -1;
+          if (index === -1) return state;
+
+          const item = group.items[index];
+          const toggled = { ...item, isChecked: !item.isChecked };
+          const delta = toggled.isChecked ? 1 : -1;
+          const items = group.items.slice();
+          items[index] = toggled;
+          const cat = categoryOf(item);
+          return {
+            groupsByRecipe: {
+              ...state.groupsByRecipe,
+              [recipeId]: { ...group, items, checkedCount: group.checkedCount + delta },
+            },
+            itemsByCategory: {
+              ...state.itemsByCategory,
+              [cat]: state.itemsByCategory[cat].map((i) => (i === item ? toggled : i)),
+            },
+            checkedCount: state.checkedCount + delta,
+          };
+        }),
+
+      removeRecipeItems: (recipeId) => set((state) => removeGroup(state, recipeId)),
+
+      clearCart: () => set(EMPTY_CART),
+
+      clearChecked: () =>
+        set((state) =>
+          aggregate(
+            state.recipeOrder.flatMap((id) => state.groupsByRecipe[id].items.filter((i) => !i.isChecked)),
+          ),
+        ),
+    }),
+  )),
+);
+
+// ─── Selectors ────────────────────────────────────────────────────────
+
+let lastOrder: string[] | null = null;
+let lastGroups: Record<string, CartRecipeGroup> | null = null;
+let lastGrouped: CartRecipeGroup[] = [];
+
+/** Recipe groups in the order they were added; stable until the cart changes. */
+export const selectGroupedByRecipe = (s: CartState): CartRecipeGroup[] => {
+  if (s.recipeOrder !== lastOrder || s.groupsByRecipe !== lastGroups) {
+    lastOrder = s.recipeOrder;
+    lastGroups = s.groupsByRecipe;
+    lastGrouped = s.recipeOrder.map((id) => s.groupsByRecipe[id]);
+  }
+  return lastGrouped;
+};
+
+export const selectGroupedByCategory = (s: CartState): Record<string, CartItem[]> => s.itemsByCategory;
+
+let mergedFor: CartRecipeGroup[] | null = null;
+let lastMerged: CartMergedLine[] = [];
+
+/**
+ * Ingredients combined across all recipes ("2 cups" + "500 ml" of milk is
+ * one line). One pass over the cart, recomputed only when it changes.
+ */
+export const selectMergedCart = (s: CartState): CartMergedLine[] => {
+  const groups = selectGroupedByRecipe(s);
+  if (groups !== mergedFor) {
+    mergedFor = groups;
+    lastMerged = mergeIngredients(groups.flatMap((g) => g.items)).map((line) => {
+      let isChecked = true;
+      let estimatedPrice = 0;
+      const recipeNames: string[] = [];
+      for (const item of line.items) {
+        if (!item.isChecked) isChecked = false;
+        estimatedPrice += item.estimatedPrice;
+        if (!recipeNames.includes(item.recipeName)) recipeNames.push(item.recipeName);
+      }
+      return { ...line, isChecked, estimatedPrice, recipeNames };
+    });
+  }
+  return lastMerged;
+};
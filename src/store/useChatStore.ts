@@ -1,4 +1,6 @@
 import { create } from 'zustand';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 // ─── Types ────────────────────────────────────────────────────────────
 
@@ -24,6 +26,10 @@ interface ChatState {
   clearMessages: () => void;
 }
 
+// Only the on-screen transcript is capped here; what gets sent to the model
+// is bounded separately by the chat context window in services/chatContext.
+const MAX_MESSAGES = 200;
+
 const WELCOME_MESSAGE: ChatMessage = {
   id: 'welcome',
   role: 'bot',
@@ -31,28 +37,30 @@ const WELCOME_MESSAGE: ChatMessage = {
   timestamp: Date.now(),
 };
 
-export const useChatStore = create<ChatState>((set) => ({
-  messages: [WELCOME_MESSAGE],
-  isTyping: false,
-  isOpen: false,
-
-  addMessage: (role, text) =>
-    set((state) => ({
-      messages: [
-        ...state.messages,
-        {
-          id: `msg-${Date.now()}-${Math.random().toString(36).slice(2, 6)}`,
-          role,
-          text,
-          timestamp: Date.now(),
-        },
-      ],
-    })),
-
-  setTyping: (typing) => set({ isTyping: typing }),
-  open: () => set({ isOpen: true }),
-  close: () => set({ isOpen: false }),
-  toggle: () => set((state) => ({ isOpen: !state.isOpen })),
-
-  clearMessages: () => set({ messages: [WELCOME_MESSAGE] }),
-}));
+export const useChatStore = create<ChatState>(
+  traced('chat', persisted({ name: 'chat', version: 1, keys: [], blobs: ['messages'] }, (set) => ({
+    messages: [WELCOME_MESSAGE],
+    isTyping: false,
+    isOpen: false,
+
+    addMessage: (role, text) =>
+      set((state) => ({
+        messages: [
+          ...state.messages,
+          {
+            id: `msg-${Date.now()}-${Math.random().toString(36).slice(2, 6)}`,
+            role,
+            text,
+            timestamp: Date.now(),
+          },
+        ].slice(-MAX_MESSAGES),
+      })),
+
+    setTyping: (typing) => set({ isTyping: typing }),
+    open: () => set({ isOpen: true }),
+    close: () => set({ isOpen: false }),
+    toggle: () => set((state) => ({ isOpen: !state.isOpen })),
+
+    clearMessages: () => set({ messages: [WELCOME_MESSAGE] }),
+  }))),
+);
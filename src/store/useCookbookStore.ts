@@ -1,5 +1,6 @@
 import { create } from 'zustand';
 import { Cookbook, RecipeMatch } from '../types/cookbook';
+import { traced } from './traced';
 
 interface CookbookState {
   cookbooks: Cookbook[];
@@ -42,7 +43,7 @@ const sampleCookbooks: Cookbook[] = [
   },
 ];
 
-export const useCookbookStore = create<CookbookState>((set) => ({
+export const useCookbookStore = create<CookbookState>(traced('cookbook', (set) => ({
   cookbooks: sampleCookbooks,
   recipeMatches: [],
   isSearching: false,
@@ -63,4 +64,4 @@ export const useCookbookStore = create<CookbookState>((set) => ({
   setIsSearching: (val) => set({ isSearching: val }),
   setSearchError: (err) => set({ searchError: err }),
   clearMatches: () => set({ recipeMatches: [], searchError: null }),
-}));
+})));
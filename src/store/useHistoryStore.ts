@@ -1,4 +1,7 @@
 import { create } from 'zustand';
+import { unpinImage } from '../services/imageCache';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 // ─── Types ────────────────────────────────────────────────────────────
 
@@ -11,7 +14,7 @@ export interface HistoryRecipe {
   difficulty: 'Easy' | 'Medium' | 'Hard';
   servings: number;
   matchScore: number;
-  imageBase64?: string;       // generated image (data uri)
+  imageUri?: string;          // generated image (file uri from the image cache)
   imageLoading?: boolean;
 }
 
@@ -21,6 +24,7 @@ export interface SearchHistoryEntry {
   cuisine: string;
   timestamp: number;           // Date.now()
   recipes: HistoryRecipe[];
+  recipeIndex: Record<string, number>; // recipe id → position in `recipes`
 }
 
 export interface CookedEntry {
@@ -28,104 +32,230 @@ export interface CookedEntry {
   recipeId: string;
   recipeTitle: string;
   cuisine: string;
-  imageBase64?: string;
+  imageFile?: string;          // pinned image (resolve with pinnedImageUri)
+  imageUri?: string;           // entries saved before images were pinned
   cookedAt: number;            // Date.now()
 }
 
+const MAX_SEARCH_ENTRIES = 50;
+const DEFAULT_MAX_COOKED_ITEMS = 200;
+
 // ─── Store ────────────────────────────────────────────────────────────
 
+/**
+ * History is kept normalized: ordered id lists plus id → entry maps, so an
+ * update replaces only the entry it touches (every other entry object keeps
+ * its identity and memoized rows skip re-rendering), and `isCooked` is a
+ * single map lookup instead of a scan.
+ */
 interface HistoryState {
-  searchHistory: SearchHistoryEntry[];
-  cookedItems: CookedEntry[];
+  searchIds: string[];                                // newest first
+  searchesById: Record<string, SearchHistoryEntry>;
+  cookedIds: string[];                                // newest first
+  cookedById: Record<string, CookedEntry>;
+  cookedCountByRecipe: Record<string, number>;        // recipe id → times cooked
+  maxCookedItems: number;
 
   // Actions
-  addSearchEntry: (entry: Omit<SearchHistoryEntry, 'id' | 'timestamp'>) => void;
+  addSearchEntry: (entry: { query: string; cuisine: string; recipes: HistoryRecipe[] }) => void;
   removeSearchEntry: (id: string) => void;
   clearSearchHistory: () => void;
 
-  updateRecipeImage: (searchId: string, recipeId: string, imageBase64: string) => void;
+  updateRecipeImage: (searchId: string, recipeId: string, imageUri: string) => void;
   setRecipeImageLoading: (searchId: string, recipeId: string, loading: boolean) => void;
 
   markAsCooked: (recipe: {
     recipeId: string;
     recipeTitle: string;
     cuisine: string;
-    imageBase64?: string;
-  }) => void;
+    imageFile?: string;
+  }) => string;
+  updateCookedImage: (id: string, imageFile: string) => void;
   removeCooked: (id: string) => void;
   clearCookedItems: () => void;
+  setMaxCookedItems: (max: number) => void;
 
   isCooked: (recipeId: string) => boolean;
 }
 
-export const useHistoryStore = create<HistoryState>((set, get) => ({
-  searchHistory: [],
-  cookedItems: [],
-
-  addSearchEntry: (entry) =>
-    set((state) => ({
-      searchHistory: [
-        {
-          ...entry,
-          id: `search-${Date.now()}`,
-          timestamp: Date.now(),
-        },
-        ...state.searchHistory,
-      ].slice(0, 50), // keep max 50 entries
-    })),
-
-  removeSearchEntry: (id) =>
-    set((state) => ({
-      searchHistory: state.searchHistory.filter((s) => s.id !== id),
-    })),
-
-  clearSearchHistory: () => set({ searchHistory: [] }),
-
-  updateRecipeImage: (searchId, recipeId, imageBase64) =>
-    set((state) => ({
-      searchHistory: state.searchHistory.map((s) => {
-        if (s.id !== searchId) return s;
-        return {
-          ...s,
-          recipes: s.recipes.map((r) =>
-            r.id === recipeId ? { ...r, imageBase64, imageLoading: false } : r,
-          ),
-        };
-      }),
-    })),
-
-  setRecipeImageLoading: (searchId, recipeId, loading) =>
-    set((state) => ({
-      searchHistory: state.searchHistory.map((s) => {
-        if (s.id !== searchId) return s;
-        return {
-          ...s,
-          recipes: s.recipes.map((r) =>
-            r.id === recipeId ? { ...r, imageLoading: loading } : r,
+const newId = (prefix: string) => `${prefix}-${Date.now()}-${Math.random().toString(36).slice(2, 6)}`;
+
+/** Drop cooked entries beyond `max` (oldest first) and keep the counts in step. */
+function trimCooked(
+  ids: string[],
+  byId: Record<string, CookedEntry>,
+  counts: Record<string, number>,
+  max: number,
+) {
+  if (ids.length <= max) return { cookedIds: ids, cookedById: byId, cookedCountByRecipe: counts };
+  const cookedById = { ...byId };
+  const cookedCountByRecipe = { ...counts };
+  for (const id of ids.slice(max)) {
+    const recipeId = cookedById[id].recipeId;
+    if (--cookedCountByRecipe[recipeId] <= 0) delete cookedCountByRecipe[recipeId];
+    delete cookedById[id];
+  }
+  return { cookedIds: ids.slice(0, max), cookedById, cookedCountByRecipe };
+}
+
+/**
+ * Delete pinned images that `prev` referenced and `next` no longer does.
+ * Called by the actions that drop cooked entries.
+ */
+function releaseImages(prev: HistoryState, next: HistoryState): void {
+  if (prev.cookedById === next.cookedById) return;
+  const inUse = new Set<string>();
+  for (const id of next.cookedIds) {
+    const file = next.cookedById[id]?.imageFile;
+    if (file) inUse.add(file);
+  }
+  for (const id of prev.cookedIds) {
+    const file = prev.cookedById[id]?.imageFile;
+    if (file && !inUse.has(file)) {
+      inUse.add(file);
+      unpinImage(file);
+    }
+  }
+}
+
+/** Copy-on-write update of one recipe inside one search entry. */
+function patchRecipe(
+  state: HistoryState,
+  searchId: string,
+  recipeId: string,
+  patch: Partial<HistoryRecipe>,
+): Partial<HistoryState> | HistoryState {
+  const entry = state.searchesById[searchId];
+  const index = entry?.recipeIndex[recipeId];
+  if (index === undefined) return state;
+  const recipes = entry.recipes.slice();
+  recipes[index] = { ...recipes[index], ...patch };
+  return { searchesById: { ...state.searchesById, [searchId]: { ...entry, recipes } } };
+}
+
+export const useHistoryStore = create<HistoryState>(
+  traced('history', persisted(
+    {
+      name: 'history',
+      version: 1,
+      keys: ['searchIds', 'cookedIds', 'cookedCountByRecipe', 'maxCookedItems'],
+      blobs: ['searchesById', 'cookedById'],
+    },
+    (set, get) => ({
+      searchIds: [],
+      searchesById: {},
+      cookedIds: [],
+      cookedById: {},
+      cookedCountByRecipe: {},
+      maxCookedItems: DEFAULT_MAX_COOKED_ITEMS,
+
+      addSearchEntry: (entry) =>
+        set((state) => {
+          const id = newId('search');
+          const recipeIndex: Record<string, number> = {};
+          entry.recipes.forEach((r, i) => (recipeIndex[r.id] = i));
+
+          const searchesById = { ...state.searchesById, [id]: { ...entry, id, timestamp: Date.now(), recipeIndex } };
+          const searchIds = [id, ...state.searchIds];
+          for (const dropped of searchIds.splice(MAX_SEARCH_ENTRIES)) delete searchesById[dropped];
+          return { searchIds, searchesById };
+        }),
+
+      removeSearchEntry: (id) =>
+        set((state) => {
+          if (!state.searchesById[id]) return state;
+          const { [id]: _removed, ...searchesById } = state.searchesById;
+          return { searchIds: state.searchIds.filter((s) => s !== id), searchesById };
+        }),
+
+      clearSearchHistory: () => set({ searchIds: [], searchesById: {} }),
+
+      updateRecipeImage: (searchId, recipeId, imageUri) =>
+        set((state) => patchRecipe(state, searchId, recipeId, { imageUri, imageLoading: false })),
+
+      setRecipeImageLoading: (searchId, recipeId, loading) =>
+        set((state) => patchRecipe(state, searchId, recipeId, { imageLoading: loading })),
+
+      markAsCooked: (recipe) => {
+        const id = newId('cooked');
+        const prev = get();
+        set((state) =>
+          trimCooked(
+            [id, ...state.cookedIds],
+            { ...state.cookedById, [id]: { id, ...recipe, cookedAt: Date.now() } },
+            {
+              ...state.cookedCountByRecipe,
+              [recipe.recipeId]: (state.cookedCountByRecipe[recipe.recipeId] ?? 0) + 1,
+            },
+            state.maxCookedItems,
           ),
-        };
-      }),
-    })),
-
-  markAsCooked: (recipe) =>
-    set((state) => ({
-      cookedItems: [
-        {
-          id: `cooked-${Date.now()}`,
-          ...recipe,
-          cookedAt: Date.now(),
-        },
-        ...state.cookedItems,
-      ],
-    })),
-
-  removeCooked: (id) =>
-    set((state) => ({
-      cookedItems: state.cookedItems.filter((c) => c.id !== id),
-    })),
-
-  clearCookedItems: () => set({ cookedItems: [] }),
-
-  isCooked: (recipeId) =>
-    get().cookedItems.some((c) => c.recipeId === recipeId),
-}));
+        );
+        releaseImages(prev, get());
+        return id;
+      },
+
+      updateCookedImage: (id, imageFile) =>
+        set((state) => {
+          const entry = state.cookedById[id];
+          if (!entry) return state;
+          return { cookedById: { ...state.cookedById, [id]: { ...entry, imageFile } } };
+        }),
+
+      removeCooked: (id) => {
+        const prev = get();
+        set((state) => {
+          const entry = state.cookedById[id];
+          if (!entry) return state;
+          const { [id]: _removed, ...cookedById } = state.cookedById;
+          const cookedCountByRecipe = { ...state.cookedCountByRecipe };
+          if (--cookedCountByRecipe[entry.recipeId] <= 0) delete cookedCountByRecipe[entry.recipeId];
+          return { cookedIds: state.cookedIds.filter((c) => c !== id), cookedById, cookedCountByRecipe };
+        });
+        releaseImages(prev, get());
+      },
+
+      clearCookedItems: () => {
+        const prev = get();
+        set({ cookedIds: [], cookedById: {}, cookedCountByRecipe: {} });
+        releaseImages(prev, get());
+      },
+
+      setMaxCookedItems: (max) => {
+        const prev = get();
+        set((state) => ({
+          maxCookedItems: max,
+          ...trimCooked(state.cookedIds, state.cookedById, state.cookedCountByRecipe, max),
+        }));
+        releaseImages(prev, get());
+      },
+
+      isCooked: (recipeId) => recipeId in get().cookedCountByRecipe,
+    }),
+  )),
+);
+
+// ─── Selectors ────────────────────────────────────────────────────────
+
+/**
+ * Ordered lists for rendering. Memoized on the id list and map, so they
+ * return the same array until history actually changes.
+ */
+function memoList<T>(
+  pick: (s: HistoryState) => [string[], Record<string, T>],
+): (s: HistoryState) => T[] {
+  let lastIds: string[] | null = null;
+  let lastById: Record<string, T> | null = null;
+  let lastList: T[] = [];
+  return (s) => {
+    const [ids, byId] = pick(s);
+    if (ids !== lastIds || byId !== lastById) {
+      lastIds = ids;
+      lastById = byId;
+      lastList = ids.map((id) => byId[id]);
+    }
+    return lastList;
+  };
+}
+
+export const selectSearchHistory = memoList<SearchHistoryEntry>((s) => [s.searchIds, s.searchesById]);
+export const selectCookedItems = memoList<CookedEntry>((s) => [s.cookedIds, s.cookedById]);
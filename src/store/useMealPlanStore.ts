@@ -1,8 +1,13 @@
 import { create } from 'zustand';
 import { DayPlan, Meal, DietType } from '../types/meal';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 interface MealPlanState {
+  /** The current Monday–Sunday week, built from `mealsByDate`. */
   weekPlan: DayPlan[];
+  /** Planned meals by ISO date; this is what is saved. */
+  mealsByDate: Record<string, Meal[]>;
   selectedDiet: DietType;
   setSelectedDiet: (diet: DietType) => void;
   addMeal: (day: string, meal: Meal) => void;
@@ -29,77 +34,52 @@ const generateWeekPlan = (): DayPlan[] => {
   });
 };
 
-// Mock meals
-const mockMeals: Meal[] = [
-  {
-    id: '1',
-    name: 'Avocado Toast',
-    mealType: 'Breakfast',
-    ingredients: ['Bread', 'Avocado', 'Eggs', 'Salt'],
-    instructions: ['Toast bread', 'Mash avocado', 'Top with egg'],
-    prepTime: 5,
-    cookTime: 10,
-    servings: 1,
-    calories: 350,
-    dietaryTags: ['Vegetarian'],
-  },
-  {
-    id: '2',
-    name: 'Grilled Chicken Salad',
-    mealType: 'Lunch',
-    ingredients: ['Chicken', 'Lettuce', 'Tomato', 'Olive Oil'],
-    instructions: ['Grill chicken', 'Chop vegetables', 'Toss together'],
-    prepTime: 10,
-    cookTime: 15,
-    servings: 2,
-    calories: 420,
-    dietaryTags: ['Keto', 'Low-Carb'],
-  },
-  {
-    id: '3',
-    name: 'Pasta Primavera',
-    mealType: 'Dinner',
-    ingredients: ['Pasta', 'Bell Peppers', 'Zucchini', 'Garlic'],
-    instructions: ['Cook pasta', 'Sauté vegetables', 'Combine'],
-    prepTime: 10,
-    cookTime: 20,
-    servings: 4,
-    calories: 520,
-    dietaryTags: ['Vegetarian'],
-  },
-];
+type WeekState = Pick<MealPlanState, 'weekPlan' | 'mealsByDate'>;
 
-export const useMealPlanStore = create<MealPlanState>((set) => {
-  const weekPlan = generateWeekPlan();
-  // Pre-fill some days with mock meals
-  weekPlan[0].meals = [mockMeals[0], mockMeals[1]];
-  weekPlan[1].meals = [mockMeals[2]];
-  weekPlan[3].meals = [mockMeals[0], mockMeals[2]];
+/**
+ * This week's plan with saved meals placed on their dates. Days before the
+ * week are dropped, so a plan saved last week does not linger.
+ */
+function buildWeek(mealsByDate: Record<string, Meal[]>): WeekState {
+  const weekPlan = generateWeekPlan().map((d) => ({ ...d, meals: mealsByDate[d.date] ?? [] }));
+  const current: Record<string, Meal[]> = {};
+  for (const [date, meals] of Object.entries(mealsByDate)) {
+    if (date >= weekPlan[0].date) current[date] = meals;
+  }
+  return { weekPlan, mealsByDate: current };
+}
 
+/** Replace one weekday's meals, in both the week view and the saved map. */
+function updateDay(state: WeekState, day: string, update: (meals: Meal[]) => Meal[]): Partial<WeekState> {
+  const target = state.weekPlan.find((d) => d.day === day);
+  if (!target) return {};
+  const meals = update(target.meals);
+  const mealsByDate = { ...state.mealsByDate };
+  if (meals.length > 0) mealsByDate[target.date] = meals;
+  else delete mealsByDate[target.date];
   return {
-    weekPlan,
-    selectedDiet: 'All',
-    setSelectedDiet: (diet) => set({ selectedDiet: diet }),
-    addMeal: (day, meal) =>
-      set((state) => ({
-        weekPlan: state.weekPlan.map((d) =>
-          d.day === day ? { ...d, meals: [...d.meals, meal] } : d
-        ),
-      })),
-    removeMeal: (day, mealId) =>
-      set((state) => ({
-        weekPlan: state.weekPlan.map((d) =>
-          d.day === day
-            ? { ...d, meals: d.meals.filter((m) => m.id !== mealId) }
-            : d
-        ),
-      })),
-    clearDay: (day) =>
-      set((state) => ({
-        weekPlan: state.weekPlan.map((d) =>
-          d.day === day ? { ...d, meals: [] } : d
-        ),
-      })),
-    clearAll: () => set({ weekPlan: generateWeekPlan() }),
+    mealsByDate,
+    weekPlan: state.weekPlan.map((d) => (d === target ? { ...d, meals } : d)),
   };
-});
+}
+
+export const useMealPlanStore = create<MealPlanState>(
+  traced('mealPlan', persisted(
+    {
+      name: 'mealPlan',
+      version: 2,
+      keys: ['mealsByDate', 'selectedDiet'],
+      derive: (s) => buildWeek(s.mealsByDate),
+    },
+    (set) => ({
+      ...buildWeek({}),
+      selectedDiet: 'All',
+      setSelectedDiet: (diet) => set({ selectedDiet: diet }),
+      addMeal: (day, meal) => set((state) => updateDay(state, day, (meals) => [...meals, meal])),
+      removeMeal: (day, mealId) =>
+        set((state) => updateDay(state, day, (meals) => meals.filter((m) => m.id !== mealId))),
+      clearDay: (day) => set((state) => updateDay(state, day, () => [])),
+      clearAll: () => set(buildWeek({})),
+    }),
+  )),
+);
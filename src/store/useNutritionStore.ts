@@ -1,4 +1,15 @@
 import { create } from 'zustand';
+import {
+  applyToRollup,
+  emptyRollup,
+  insertDate,
+  removeDate,
+  sumRange,
+  type DayRollup,
+  type RangeTotals,
+} from '../utils/nutritionRollups';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 export interface DailyNutrition {
   date: string; // YYYY-MM-DD
@@ -24,7 +35,9 @@ export interface WeeklyAggregation {
 }
 
 interface NutritionState {
-  entries: DailyNutrition[];
+  entriesByDate: Record<string, DailyNutrition[]>;
+  rollupsByDate: Record<string, DayRollup>;
+  dates: string[];                       // ascending; days with at least one entry
   weeklyGoal: {
     calories: number;
     protein: number; // g per day
@@ -34,110 +47,125 @@ interface NutritionState {
   addEntry: (entry: DailyNutrition) => void;
   removeEntry: (date: string, recipeName: string) => void;
   clearEntries: () => void;
-  getWeeklyAggregation: () => WeeklyAggregation;
-  getDailyTotals: () => { date: string; calories: number; protein: number; carbs: number; fat: number }[];
 }
 
-const today = new Date();
-const mockEntries: DailyNutrition[] = Array.from({ length: 7 }, (_, i) => {
-  const d = new Date(today);
-  d.setDate(d.getDate() - (6 - i));
-  const dateStr = d.toISOString().split('T')[0];
-  return [
-    {
-      date: dateStr,
-      recipeName: ['Grilled Chicken Salad', 'Oatmeal Bowl', 'Pasta Primavera', 'Salmon Teriyaki', 'Greek Bowl', 'Stir Fry', 'Avocado Toast'][i],
-      calories: [520, 380, 610, 480, 440, 550, 350][i],
-      protein: [42, 14, 18, 38, 22, 32, 12][i],
-      carbs: [28, 52, 72, 34, 48, 42, 38][i],
-      fat: [22, 10, 20, 18, 16, 24, 14][i],
-      fiber: [6, 8, 4, 2, 5, 7, 4][i],
-      sodium: [680, 220, 820, 540, 380, 900, 310][i],
-    },
+type NutritionLog = Pick<NutritionState, 'entriesByDate' | 'rollupsByDate' | 'dates'>;
+
+function buildLog(entriesByDate: Record<string, DailyNutrition[]>): NutritionLog {
+  const rollupsByDate: Record<string, DayRollup> = {};
+  for (const [date, entries] of Object.entries(entriesByDate)) {
+    rollupsByDate[date] = entries.reduce((day, e) => applyToRollup(day, e, 1), emptyRollup(date));
+  }
+  return { entriesByDate, rollupsByDate, dates: Object.keys(entriesByDate).sort() };
+}
+
+export const useNutritionStore = create<NutritionState>(
+  traced('nutrition', persisted(
     {
-      date: dateStr,
-      recipeName: 'Snack / Side',
-      calories: [280, 190, 320, 210, 250, 180, 300][i],
-      protein: [8, 6, 10, 12, 8, 5, 9][i],
-      carbs: [32, 24, 38, 18, 30, 26, 34][i],
-      fat: [12, 8, 14, 10, 10, 8, 14][i],
-      fiber: [2, 3, 1, 2, 3, 2, 2][i],
-      sodium: [180, 120, 240, 160, 200, 140, 220][i],
+      name: 'nutrition',
+      version: 2,
+      keys: ['weeklyGoal'],
+      blobs: ['entriesByDate'],
+      derive: (s) => buildLog(s.entriesByDate),
     },
-  ];
-}).flat();
+    (set) => ({
+      ...buildLog({}),
+      weeklyGoal: {
+        calories: 2200,
+        protein: 120,
+        sodium: 2300,
+      },
 
-export const useNutritionStore = create<NutritionState>((set, get) => ({
-  entries: mockEntries,
-  weeklyGoal: {
-    calories: 2200,
-    protein: 120,
-    sodium: 2300,
-  },
-
-  addEntry: (entry) =>
-    set((state) => ({
-      entries: [...state.entries, entry],
-    })),
-
-  removeEntry: (date, recipeName) =>
-    set((state) => ({
-      entries: state.entries.filter(
-        (e) => !(e.date === date && e.recipeName === recipeName)
-      ),
-    })),
-
-  clearEntries: () => set({ entries: [] }),
-
-  getWeeklyAggregation: () => {
-    const entries = get().entries;
-    const goal = get().weeklyGoal;
-    const totalCalories = entries.reduce((s, e) => s + e.calories, 0);
-    const totalProtein = entries.reduce((s, e) => s + e.protein, 0);
-    const totalCarbs = entries.reduce((s, e) => s + e.carbs, 0);
-    const totalFat = entries.reduce((s, e) => s + e.fat, 0);
-    const totalFiber = entries.reduce((s, e) => s + e.fiber, 0);
-    const totalSodium = entries.reduce((s, e) => s + e.sodium, 0);
-    const days = new Set(entries.map((e) => e.date)).size || 1;
-    const avgDailyCalories = Math.round(totalCalories / days);
-    const avgDailyProtein = totalProtein / days;
-    const proteinGoalPercent = Math.min(
-      100,
-      Math.round((avgDailyProtein / goal.protein) * 100)
-    );
-    const dailyTotals = get().getDailyTotals();
-    const sodiumAlerts = dailyTotals.filter((d) => {
-      const daySodium = entries
-        .filter((e) => e.date === d.date)
-        .reduce((s, e) => s + e.sodium, 0);
-      return daySodium > goal.sodium;
-    }).length;
-
-    return {
-      totalCalories,
-      avgDailyCalories,
-      proteinGoalPercent,
-      sodiumAlerts,
-      totalProtein,
-      totalCarbs,
-      totalFat,
-      totalFiber,
-      totalSodium,
-    };
-  },
-
-  getDailyTotals: () => {
-    const entries = get().entries;
-    const byDate: Record<string, { calories: number; protein: number; carbs: number; fat: number }> = {};
-    for (const e of entries) {
-      if (!byDate[e.date]) byDate[e.date] = { calories: 0, protein: 0, carbs: 0, fat: 0 };
-      byDate[e.date].calories += e.calories;
-      byDate[e.date].protein += e.protein;
-      byDate[e.date].carbs += e.carbs;
-      byDate[e.date].fat += e.fat;
-    }
-    return Object.entries(byDate)
-      .map(([date, vals]) => ({ date, ...vals }))
-      .sort((a, b) => a.date.localeCompare(b.date));
-  },
-}));
+      addEntry: (entry) =>
+        set((state) => ({
+          entriesByDate: {
+            ...state.entriesByDate,
+            [entry.date]: [...(state.entriesByDate[entry.date] ?? []), entry],
+          },
+          rollupsByDate: {
+            ...state.rollupsByDate,
+            [entry.date]: applyToRollup(state.rollupsByDate[entry.date] ?? emptyRollup(entry.date), entry, 1),
+          },
+          dates: insertDate(state.dates, entry.date),
+        })),
+
+      removeEntry: (date, recipeName) =>
+        set((state) => {
+          const dayEntries = state.entriesByDate[date];
+          const removed = dayEntries?.filter((e) => e.recipeName === recipeName) ?? [];
+          if (removed.length === 0) return state;
+
+          const remaining = dayEntries.filter((e) => e.recipeName !== recipeName);
+          const { [date]: _entries, ...entriesByDate } = state.entriesByDate;
+          const { [date]: rollup, ...rollupsByDate } = state.rollupsByDate;
+          if (remaining.length === 0) {
+            return { entriesByDate, rollupsByDate, dates: removeDate(state.dates, date) };
+          }
+          return {
+            entriesByDate: { ...entriesByDate, [date]: remaining },
+            rollupsByDate: {
+              ...rollupsByDate,
+              [date]: removed.reduce((day, e) => applyToRollup(day, e, -1), rollup),
+            },
+          };
+        }),
+
+      clearEntries: () => set({ entriesByDate: {}, rollupsByDate: {}, dates: [] }),
+    }),
+  )),
+);
+
+// ─── Selectors ────────────────────────────────────────────────────────
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const isoDay = (time: number) => new Date(time).toISOString().split('T')[0];
+
+/** Totals over [start, end] (YYYY-MM-DD, inclusive); costs one step per logged day. */
+export const selectRange = (s: NutritionState, start: string, end: string): RangeTotals =>
+  sumRange(s.dates, s.rollupsByDate, start, end);
+
+let dailyFor: NutritionState['rollupsByDate'] | null = null;
+let dailyTotals: DayRollup[] = [];
+
+/** One rollup per logged day, oldest first. */
+export const selectDailyTotals = (s: NutritionState): DayRollup[] => {
+  if (s.rollupsByDate !== dailyFor) {
+    dailyFor = s.rollupsByDate;
+    dailyTotals = s.dates.map((d) => s.rollupsByDate[d]);
+  }
+  return dailyTotals;
+};
+
+let weeklyKey: [NutritionState['rollupsByDate'], NutritionState['weeklyGoal'], string] | null = null;
+let weekly: WeeklyAggregation;
+
+/** Rolling 7-day window ending today, built from at most 7 day rollups. */
+export const selectWeeklyAggregation = (s: NutritionState): WeeklyAggregation => {
+  const now = Date.now();
+  const today = isoDay(now);
+  if (weeklyKey && weeklyKey[0] === s.rollupsByDate && weeklyKey[1] === s.weeklyGoal && weeklyKey[2] === today) {
+    return weekly;
+  }
+  weeklyKey = [s.rollupsByDate, s.weeklyGoal, today];
+
+  const goal = s.weeklyGoal;
+  const totals = sumRange(s.dates, s.rollupsByDate, isoDay(now - 6 * DAY_MS), today);
+  let sodiumAlerts = 0;
+  for (let i = 0; i < 7; i++) {
+    const day = s.rollupsByDate[isoDay(now - i * DAY_MS)];
+    if (day && day.sodium > goal.sodium) sodiumAlerts++;
+  }
+  const days = totals.days || 1;
+  weekly = {
+    totalCalories: totals.calories,
+    avgDailyCalories: Math.round(totals.calories / days),
+    proteinGoalPercent: Math.min(100, Math.round((totals.protein / days / goal.protein) * 100)),
+    sodiumAlerts,
+    totalProtein: totals.protein,
+    totalCarbs: totals.carbs,
+    totalFat: totals.fat,
+    totalFiber: totals.fiber,
+    totalSodium: totals.sodium,
+  };
+  return weekly;
+};
@@ -1,7 +1,15 @@
 import { create } from 'zustand';
 import { Ingredient } from '../types/ingredient';
-
-type PantryFilter = 'All' | 'Expiring' | 'Surplus';
+import {
+  buildExpiryBuckets,
+  buildSearchIndex,
+  filterPantry,
+  type ExpiryBuckets,
+  type PantryFilter,
+  type PantrySearchIndex,
+} from '../utils/pantryIndex';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 interface PantryState {
   ingredients: Ingredient[];
@@ -13,115 +21,82 @@ interface PantryState {
   removeIngredient: (id: string) => void;
   updateIngredient: (id: string, updates: Partial<Ingredient>) => void;
   clearPantry: () => void;
-  getFilteredIngredients: () => Ingredient[];
 }
 
-// Placeholder mock data
-const mockIngredients: Ingredient[] = [
-  {
-    id: '1',
-    name: 'Tomatoes',
-    quantity: 6,
-    unit: 'pieces',
-    expiryDate: '2026-02-16',
-    category: 'Vegetables',
-    isSurplus: false,
-    addedAt: '2026-02-10',
-  },
-  {
-    id: '2',
-    name: 'Milk',
-    quantity: 1,
-    unit: 'liters',
-    expiryDate: '2026-02-14',
-    category: 'Dairy',
-    isSurplus: false,
-    addedAt: '2026-02-11',
-  },
-  {
-    id: '3',
-    name: 'Chicken Breast',
-    quantity: 500,
-    unit: 'g',
-    expiryDate: '2026-02-15',
-    category: 'Meat',
-    isSurplus: false,
-    addedAt: '2026-02-12',
-  },
-  {
-    id: '4',
-    name: 'Brown Rice',
-    quantity: 2,
-    unit: 'kg',
-    expiryDate: '2026-06-01',
-    category: 'Grains',
-    isSurplus: true,
-    addedAt: '2026-01-20',
-  },
-  {
-    id: '5',
-    name: 'Spinach',
-    quantity: 1,
-    unit: 'bunch',
-    expiryDate: '2026-02-14',
-    category: 'Vegetables',
-    isSurplus: false,
-    addedAt: '2026-02-12',
-  },
-  {
-    id: '6',
-    name: 'Greek Yogurt',
-    quantity: 3,
-    unit: 'cups',
-    expiryDate: '2026-02-20',
-    category: 'Dairy',
-    isSurplus: true,
-    addedAt: '2026-02-08',
-  },
-];
+export const usePantryStore = create<PantryState>(
+  traced('pantry', persisted({ name: 'pantry', version: 1, keys: ['ingredients'] }, (set) => ({
+    ingredients: [],
+    filter: 'All',
+    searchQuery: '',
+    setFilter: (filter) => set({ filter }),
+    setSearchQuery: (query) => set({ searchQuery: query }),
+    addIngredient: (ingredient) =>
+      set((state) => ({ ingredients: [...state.ingredients, ingredient] })),
+    removeIngredient: (id) =>
+      set((state) => ({
+        ingredients: state.ingredients.filter((i) => i.id !== id),
+      })),
+    updateIngredient: (id, updates) =>
+      set((state) => ({
+        ingredients: state.ingredients.map((i) =>
+          i.id === id ? { ...i, ...updates } : i
+        ),
+      })),
+    clearPantry: () => set({ ingredients: [] }),
+  }))),
+);
+
+// ─── Selectors ────────────────────────────────────────────────────────
+
+// The search index is rebuilt only when the ingredient list changes; expiry
+// buckets also when the (UTC) day rolls over.
+let indexFor: Ingredient[] | null = null;
+let index: PantrySearchIndex = buildSearchIndex([]);
+let bucketsFor: Ingredient[] | null = null;
+let buckets: ExpiryBuckets = buildExpiryBuckets([], Date.now());
+let dayEndsAt = 0;
+
+export const selectPantryIndex = (s: PantryState): PantrySearchIndex => {
+  if (s.ingredients !== indexFor) {
+    indexFor = s.ingredients;
+    index = buildSearchIndex(s.ingredients);
+  }
+  return index;
+};
+
+export const selectExpiryBuckets = (s: PantryState): ExpiryBuckets => {
+  const now = Date.now();
+  if (s.ingredients !== bucketsFor || now >= dayEndsAt) {
+    bucketsFor = s.ingredients;
+    buckets = buildExpiryBuckets(s.ingredients, now);
+    dayEndsAt = Date.parse(buckets.day) + 24 * 60 * 60 * 1000;
+  }
+  return buckets;
+};
 
-export const usePantryStore = create<PantryState>((set, get) => ({
-  ingredients: mockIngredients,
-  filter: 'All',
-  searchQuery: '',
-  setFilter: (filter) => set({ filter }),
-  setSearchQuery: (query) => set({ searchQuery: query }),
-  addIngredient: (ingredient) =>
-    set((state) => ({ ingredients: [...state.ingredients, ingredient] })),
-  removeIngredient: (id) =>
-    set((state) => ({
-      ingredients: state.ingredients.filter((i) => i.id !== id),
-    })),
-  updateIngredient: (id, updates) =>
-    set((state) => ({
-      ingredients: state.ingredients.map((i) =>
-        i.id === id ? { ...i, ...updates } : i
-      ),
-    })),
-  clearPantry: () => set({ ingredients: [] }),
-  getFilteredIngredients: () => {
-    const { ingredients, filter, searchQuery } = get();
-    let filtered = ingredients;
+/** Pantry ingredient names, ready to pass to the Gemini recipe calls. */
+export const selectPantryNames = (s: PantryState): string[] => selectPantryIndex(s).names;
 
-    if (searchQuery) {
-      filtered = filtered.filter((i) =>
-        i.name.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
+export const selectExpiringCount = (s: PantryState): number => {
+  const b = selectExpiryBuckets(s);
+  return b.expired.length + b.soon.length;
+};
 
-    switch (filter) {
-      case 'Expiring':
-        const threeDaysFromNow = new Date();
-        threeDaysFromNow.setDate(threeDaysFromNow.getDate() + 3);
-        filtered = filtered.filter(
-          (i) => new Date(i.expiryDate) <= threeDaysFromNow
-        );
-        break;
-      case 'Surplus':
-        filtered = filtered.filter((i) => i.isSurplus);
-        break;
-    }
+let lastFiltered: { index: PantrySearchIndex; buckets: ExpiryBuckets; filter: PantryFilter; query: string } | null = null;
+let filtered: Ingredient[] = [];
 
-    return filtered;
-  },
-}));
+export const selectFilteredIngredients = (s: PantryState): Ingredient[] => {
+  const idx = selectPantryIndex(s);
+  const b = selectExpiryBuckets(s);
+  if (
+    !lastFiltered ||
+    lastFiltered.index !== idx ||
+    lastFiltered.buckets !== b ||
+    lastFiltered.filter !== s.filter ||
+    lastFiltered.query !== s.searchQuery
+  ) {
+    lastFiltered = { index: idx, buckets: b, filter: s.filter, query: s.searchQuery };
+    filtered = filterPantry(idx, b, s.filter, s.searchQuery);
+  }
+  return filtered;
+};
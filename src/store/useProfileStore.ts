@@ -1,4 +1,5 @@
 import { create } from 'zustand';
+import { traced } from './traced';
 
 export type DietPreference =
   | 'No Preference'
@@ -48,7 +49,7 @@ const defaultProfile: UserProfile = {
   allergies: ['Peanuts'],
 };
 
-export const useProfileStore = create<ProfileState>((set) => ({
+export const useProfileStore = create<ProfileState>(traced('profile', (set) => ({
   profile: defaultProfile,
 
   updateProfile: (updates) =>
@@ -75,4 +76,4 @@ export const useProfileStore = create<ProfileState>((set) => ({
     })),
 
   resetProfile: () => set({ profile: defaultProfile }),
-}));
+})));
@@ -1,5 +1,6 @@
 import { create } from 'zustand';
 import { ExtractedRecipe, GroceryItem } from '../types/recipe';
+import { traced } from './traced';
 
 interface RecipeState {
   // Video/URL extraction state
@@ -26,7 +27,7 @@ interface RecipeState {
   getUncheckedItems: () => GroceryItem[];
 }
 
-export const useRecipeStore = create<RecipeState>((set, get) => ({
+export const useRecipeStore = create<RecipeState>(traced('recipe', (set, get) => ({
   savedUrls: [],
   extractedRecipes: [],
   currentGroceryList: [],
@@ -68,4 +69,4 @@ export const useRecipeStore = create<RecipeState>((set, get) => ({
 
   getCheckedCount: () => get().currentGroceryList.filter((i) => i.isChecked).length,
   getUncheckedItems: () => get().currentGroceryList.filter((i) => !i.isChecked),
-}));
+})));
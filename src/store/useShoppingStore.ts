@@ -1,5 +1,6 @@
 import { create } from 'zustand';
 import { ShoppingItem, ShoppingCategory } from '../types/shoppingItem';
+import { traced } from './traced';
 
 interface ShoppingState {
   items: ShoppingItem[];
@@ -23,7 +24,7 @@ const mockItems: ShoppingItem[] = [
   { id: '8', name: 'Greek Yogurt', quantity: 500, unit: 'g', category: 'Dairy', isChecked: false, estimatedPrice: 3.99 },
 ];
 
-export const useShoppingStore = create<ShoppingState>((set, get) => ({
+export const useShoppingStore = create<ShoppingState>(traced('shopping', (set, get) => ({
   items: mockItems,
   addItem: (item) => set((state) => ({ items: [...state.items, item] })),
   removeItem: (id) =>
@@ -54,4 +55,4 @@ export const useShoppingStore = create<ShoppingState>((set, get) => ({
       .filter((i) => !i.isChecked)
       .reduce((sum, i) => sum + (i.estimatedPrice || 0), 0);
   },
-}));
+})));
@@ -1,5 +1,7 @@
 import { create } from 'zustand';
 import type { CustomerInfo, PurchasesOffering } from 'react-native-purchases';
+import { persisted } from './persist';
+import { traced } from './traced';
 
 // ─── Types ────────────────────────────────────────────────────────────
 
@@ -26,20 +28,30 @@ interface SubscriptionState {
 
 // ─── Store ────────────────────────────────────────────────────────────
 
-export const useSubscriptionStore = create<SubscriptionState>((set) => ({
-  isPro: false,
-  isLoading: true,
-  customerInfo: null,
-  currentOffering: null,
-
-  setIsPro: (isPro) => set({ isPro }),
-  setLoading: (isLoading) => set({ isLoading }),
-  setCustomerInfo: (customerInfo) => set({ customerInfo }),
-  setCurrentOffering: (currentOffering) => set({ currentOffering }),
-
-  updateFromCustomerInfo: (info) => {
-    const isPro =
-      typeof info.entitlements.active['AIF Pro'] !== 'undefined';
-    set({ customerInfo: info, isPro, isLoading: false });
-  },
-}));
+/**
+ * `isPro` is persisted, so the last known entitlement is served at launch
+ * while App.tsx revalidates with RevenueCat in the background. `isLoading`
+ * stays true until that revalidation lands.
+ */
+export const useSubscriptionStore = create<SubscriptionState>(
+  traced('subscription', persisted(
+    { name: 'subscription', version: 1, keys: ['isPro'] },
+    (set) => ({
+      isPro: false,
+      isLoading: true,
+      customerInfo: null,
+      currentOffering: null,
+
+      setIsPro: (isPro) => set({ isPro }),
+      setLoading: (isLoading) => set({ isLoading }),
+      setCustomerInfo: (customerInfo) => set({ customerInfo }),
+      setCurrentOffering: (currentOffering) => set({ currentOffering }),
+
+      updateFromCustomerInfo: (info) => {
+        const isPro =
+          typeof info.entitlements.active['AIF Pro'] !== 'undefined';
+        set({ customerInfo: info, isPro, isLoading: false });
+      },
+    }),
+  )),
+);
@@ -1,4 +1,5 @@
 import { create } from 'zustand';
+import { traced } from './traced';
 
 interface ThemeState {
   isDarkMode: boolean;
@@ -6,8 +7,8 @@ interface ThemeState {
   setDarkMode: (value: boolean) => void;
 }
 
-export const useThemeStore = create<ThemeState>((set) => ({
+export const useThemeStore = create<ThemeState>(traced('theme', (set) => ({
   isDarkMode: true,
   toggleTheme: () => set((state) => ({ isDarkMode: !state.isDarkMode })),
   setDarkMode: (value) => set({ isDarkMode: value }),
-}));
+})));
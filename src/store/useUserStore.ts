@@ -1,5 +1,6 @@
 import { create } from 'zustand';
 import { User, UserPreferences, EcoImpactStats } from '../types/user';
+import { traced } from './traced';
 
 interface UserState {
   user: User;
@@ -30,7 +31,7 @@ const defaultUser: User = {
   joinedAt: '2025-06-01',
 };
 
-export const useUserStore = create<UserState>((set) => ({
+export const useUserStore = create<UserState>(traced('user', (set) => ({
   user: defaultUser,
   isOnboarded: false,
   setOnboarded: (value) => set({ isOnboarded: value }),
@@ -46,4 +47,4 @@ export const useUserStore = create<UserState>((set) => ({
       user: { ...state.user, ...updates },
     })),
   logout: () => set({ user: defaultUser, isOnboarded: false }),
-}));
+})));
@@ -0,0 +1,290 @@
+/**
+ * Ingredient merge engine. Combines ingredient lists from several recipes
+ * into one shopping list on-device: names are normalized so "Yellow
+ * Onions, diced" and "yellow onion" land on the same line, quantities are
+ * parsed and converted within a dimension ("2 cups" + "500 ml" → one
+ * volume), and everything is merged in a single pass over the input.
+ *
+ * Quantities that cannot be converted into each other (volume vs weight,
+ * or "to taste") are kept side by side: "2 cups + 100 g".
+ *
+ * Parsed names and quantities are memoized by their text, so merging the
+ * same list again (e.g. after an item is checked off) does no re-parsing.
+ */
+
+export interface MergeInput {
+  name: string;
+  quantity: string;
+  category?: string;
+}
+
+export interface MergedIngredient<T extends MergeInput = MergeInput> {
+  key: string;                           // normalized name
+  name: string;                          // display name (first seen)
+  quantity: string;
+  category?: string;
+  items: T[];                            // inputs merged into this line
+}
+
+type Dimension = 'volume' | 'mass';
+
+interface Unit {
+  dimension: Dimension;
+  factor: number;                        // to ml or g
+  metric: boolean;
+}
+
+const UNITS: Record<string, Unit> = {};
+const defineUnit = (names: string[], dimension: Dimension, factor: number, metric: boolean) =>
+  names.forEach((n) => (UNITS[n] = { dimension, factor, metric }));
+
+defineUnit(['ml', 'milliliter', 'millilitre', 'cc'], 'volume', 1, true);
+defineUnit(['cl', 'centiliter', 'centilitre'], 'volume', 10, true);
+defineUnit(['dl', 'deciliter', 'decilitre'], 'volume', 100, true);
+defineUnit(['l', 'liter', 'litre'], 'volume', 1000, true);
+defineUnit(['tsp', 'teaspoon'], 'volume', 4.92892, false);
+defineUnit(['tbsp', 'tablespoon', 'tbs', 'tbl'], 'volume', 14.7868, false);
+defineUnit(['fl oz', 'fluid ounce'], 'volume', 29.5735, false);
+defineUnit(['cup', 'c'], 'volume', 236.588, false);
+defineUnit(['pint', 'pt'], 'volume', 473.176, false);
+defineUnit(['quart', 'qt'], 'volume', 946.353, false);
+defineUnit(['gallon', 'gal'], 'volume', 3785.41, false);
+defineUnit(['mg', 'milligram', 'milligramme'], 'mass', 0.001, true);
+defineUnit(['g', 'gram', 'gramme', 'gr'], 'mass', 1, true);
+defineUnit(['kg', 'kilogram', 'kilogramme', 'kilo'], 'mass', 1000, true);
+defineUnit(['oz', 'ounce'], 'mass', 28.3495, false);
+defineUnit(['lb', 'pound'], 'mass', 453.592, false);
+
+const VULGAR_FRACTIONS: Record<string, number> = {
+  '¼': 0.25, '½': 0.5, '¾': 0.75, '⅓': 1 / 3, '⅔': 2 / 3, '⅛': 0.125, '⅜': 0.375, '⅝': 0.625, '⅞': 0.875,
+};
+
+/** Words that describe preparation or size, not the thing to buy. */
+const DESCRIPTORS = new Set([
+  'fresh', 'freshly', 'large', 'medium', 'small', 'chopped', 'diced', 'minced', 'sliced', 'grated',
+  'shredded', 'peeled', 'crushed', 'finely', 'roughly', 'thinly', 'ripe', 'cubed', 'halved', 'packed',
+  'extra', 'jumbo', 'softened', 'melted', 'beaten', 'drained', 'rinsed', 'trimmed',
+]);
+
+/** Words ending in "s" that are not plurals. */
+const NOT_PLURAL = new Set(['hummus', 'couscous', 'asparagus', 'molasses', 'swiss', 'citrus', 'grits', 'bass']);
+const IRREGULAR: Record<string, string> = { leaves: 'leaf', loaves: 'loaf', halves: 'half', knives: 'knife' };
+
+function singular(word: string): string {
+  if (word.length <= 3 || NOT_PLURAL.has(word)) return word;
+  if (word in IRREGULAR) return IRREGULAR[word];
+  if (word.endsWith('ies')) return word.slice(0, -3) + 'y';
+  if (word.endsWith('oes') || /(ch|sh|x|ss)es$/.test(word)) return word.slice(0, -2);
+  if (word.endsWith('s') && !word.endsWith('ss') && !word.endsWith('us')) return word.slice(0, -1);
+  return word;
+}
+
+const displayName = (name: string) =>
+  name.replace(/\([^)]*\)/g, ' ').split(',')[0].replace(/\s+/g, ' ').trim() || name.trim();
+
+const MEMO_MAX_ENTRIES = 2000;
+
+/** Memoize a string parser; the table is dropped whenever it grows past its cap. */
+function memoized<R>(parse: (text: string) => R): (text: string) => R {
+  const memo = new Map<string, R>();
+  return (text) => {
+    const hit = memo.get(text);
+    if (hit !== undefined || memo.has(text)) return hit as R;
+    if (memo.size >= MEMO_MAX_ENTRIES) memo.clear();
+    const value = parse(text);
+    memo.set(text, value);
+    return value;
+  };
+}
+
+const normalizedName = memoized(normalizeIngredientName);
+const parsedQuantity = memoized(parseQuantity);
+
+/** Grouping key for an ingredient name. */
+export function normalizeIngredientName(name: string): string {
+  const words = name
+    .toLowerCase()
+    .replace(/\([^)]*\)/g, ' ')          // "(optional)", "(about 2)"
+    .split(',')[0]                       // "onion, diced"
+    .replace(/[^a-z\s-]/g, ' ')
+    .split(/[\s-]+/)                     // "extra-large" is two descriptors
+    .filter((w) => w && !DESCRIPTORS.has(w));
+  if (words.length === 0) return name.trim().toLowerCase();
+  words[words.length - 1] = singular(words[words.length - 1]);
+  return words.join(' ');
+}
+
+export interface ParsedQuantity {
+  amount: number;
+  /** Canonical unit name: a key of the unit table, a count noun, or '' for a bare number. */
+  unit: string;
+}
+
+const FRACTION = /^(\d+)\s*\/\s*(\d+)/;
+
+function parseNumber(text: string): { value: number; rest: string } | null {
+  let rest = text;
+  let value = 0;
+  let matched = false;
+
+  // A plain fraction ("12/16") first, so its numerator is never split
+  // into a whole number and a smaller fraction; then "1 1/2" style.
+  let fraction = FRACTION.exec(rest);
+  if (!fraction) {
+    const whole = /^\d+(?:\.\d+)?/.exec(rest);
+    if (whole) {
+      value += parseFloat(whole[0]);
+      rest = rest.slice(whole[0].length).trimStart();
+      matched = true;
+      fraction = FRACTION.exec(rest);
+    }
+  }
+  if (fraction && Number(fraction[2]) !== 0) {
+    value += Number(fraction[1]) / Number(fraction[2]);
+    rest = rest.slice(fraction[0].length).trimStart();
+    matched = true;
+  }
+  if (rest[0] in VULGAR_FRACTIONS) {
+    value += VULGAR_FRACTIONS[rest[0]];
+    rest = rest.slice(1).trimStart();
+    matched = true;
+  }
+  return matched ? { value, rest } : null;
+}
+
+/**
+ * Parse "2 cups", "1 1/2 tbsp", "½ lb", "500ml", "2-3 cloves", "2 large
+ * eggs". Ranges use the upper bound (it is a shopping list), and a package
+ * size in parentheses is the unit: "2 (14 oz) cans" is 28 oz. Returns null
+ * for quantities with no number ("to taste", "a pinch").
+ */
+export function parseQuantity(text: string): ParsedQuantity | null {
+  let parsed = parseNumber(text.trim());
+  if (!parsed) return null;
+  const range = /^(?:-|–|to)\s*/i.exec(parsed.rest);
+  if (range) {
+    const upper = parseNumber(parsed.rest.slice(range[0].length));
+    if (upper) parsed = upper;
+  }
+
+  // Cook's shorthand: "T" is a tablespoon, "t" a teaspoon. Every other
+  // unit is matched case-insensitively.
+  const letter = /^(?:of\s+)?([Tt])\b/.exec(parsed.rest);
+  if (letter) return { amount: parsed.value, unit: letter[1] === 'T' ? 'tbsp' : 'tsp' };
+
+  let rest = parsed.rest.toLowerCase().replace(/^of\s+/, '');
+  const note = /^\(([^)]*)\)\s*/.exec(rest);
+  if (note) {
+    const size = parseQuantity(note[1].replace(/(\d)-(?=[a-z])/g, '$1 '));
+    if (size && size.unit in UNITS) return { amount: parsed.value * size.amount, unit: size.unit };
+    rest = rest.slice(note[0].length);   // "2 (about) cloves"
+  }
+  if (/^fl\.?\s*oz\b/.test(rest)) return { amount: parsed.value, unit: 'fl oz' };
+  // Size and preparation words say nothing about the unit: "2 large eggs".
+  let word = /^[a-z]+/.exec(rest)?.[0] ?? '';
+  while (DESCRIPTORS.has(word)) {
+    rest = rest.slice(word.length).replace(/^[\s,-]+/, '');
+    word = /^[a-z]+/.exec(rest)?.[0] ?? '';
+  }
+  if (!word) return { amount: parsed.value, unit: '' };
+  for (const candidate of [word, singular(word), word.replace(/s$/, '')]) {
+    if (candidate in UNITS) return { amount: parsed.value, unit: candidate };
+  }
+  // Anything else is a count noun: "cloves", "cans", "bunch".
+  return { amount: parsed.value, unit: singular(word) };
+}
+
+const trimNumber = (n: number) => String(Number(n.toFixed(2)));
+
+/** Quarters read better than decimals for cups and spoons. */
+function kitchenNumber(n: number): string {
+  const quarters = Math.round(n * 4);
+  if (quarters === 0) return trimNumber(n);
+  const whole = Math.floor(quarters / 4);
+  const frac = ['', '1/4', '1/2', '3/4'][quarters % 4];
+  return whole === 0 ? frac : frac ? `${whole} ${frac}` : String(whole);
+}
+
+const plural = (unit: string, amount: number) =>
+  amount <= 1 || unit.endsWith('s') ? unit : /(ch|sh|x)$/.test(unit) ? `${unit}es` : `${unit}s`;
+
+function formatMeasure(base: number, dimension: Dimension, metric: boolean): string {
+  if (dimension === 'volume') {
+    if (metric) return base >= 1000 ? `${trimNumber(base / 1000)} l` : `${Math.round(base)} ml`;
+    if (base >= UNITS.cup.factor / 4) {
+      const cups = base / UNITS.cup.factor;
+      return `${kitchenNumber(cups)} ${plural('cup', cups)}`;
+    }
+    if (base >= UNITS.tbsp.factor) return `${kitchenNumber(base / UNITS.tbsp.factor)} tbsp`;
+    return `${kitchenNumber(base / UNITS.tsp.factor)} tsp`;
+  }
+  if (metric) return base >= 1000 ? `${trimNumber(base / 1000)} kg` : `${Math.round(base)} g`;
+  if (base >= UNITS.lb.factor) {
+    const lb = base / UNITS.lb.factor;
+    return `${trimNumber(lb)} lb`;
+  }
+  return `${trimNumber(base / UNITS.oz.factor)} oz`;
+}
+
+interface Measure {
+  amount: number;                        // ml, g, or count
+  dimension?: Dimension;
+  metric: boolean;                       // system of the first quantity seen
+}
+
+interface Accumulator<T extends MergeInput> {
+  merged: MergedIngredient<T>;
+  measures: Map<string, Measure>;        // 'volume' | 'mass' | count unit
+  unparsed: string[];
+}
+
+function formatQuantity(acc: Accumulator<MergeInput>): string {
+  const parts: string[] = [];
+  acc.measures.forEach((m, unit) => {
+    if (m.dimension) parts.push(formatMeasure(m.amount, m.dimension, m.metric));
+    else parts.push(unit ? `${trimNumber(m.amount)} ${plural(unit, m.amount)}` : trimNumber(m.amount));
+  });
+  return [...parts, ...acc.unparsed].join(' + ');
+}
+
+/**
+ * Merge ingredient lists into one list, in order of first appearance.
+ * Each input is visited once.
+ */
+export function mergeIngredients<T extends MergeInput>(items: Iterable<T>): MergedIngredient<T>[] {
+  const byKey = new Map<string, Accumulator<T>>();
+
+  for (const item of items) {
+    const key = normalizedName(item.name);
+    let acc = byKey.get(key);
+    if (!acc) {
+      acc = {
+        merged: { key, name: displayName(item.name), quantity: '', category: item.category, items: [] },
+        measures: new Map(),
+        unparsed: [],
+      };
+      byKey.set(key, acc);
+    }
+    acc.merged.items.push(item);
+
+    const quantity = item.quantity.trim();
+    const parsed = quantity ? parsedQuantity(quantity) : null;
+    if (!parsed) {
+      if (quantity && !acc.unparsed.includes(quantity.toLowerCase())) acc.unparsed.push(quantity.toLowerCase());
+      continue;
+    }
+    const unit = UNITS[parsed.unit];
+    // "3 eggs" of eggs is a plain count, like "3".
+    const count = parsed.unit === key || key.endsWith(` ${parsed.unit}`) ? '' : parsed.unit;
+    const slot = unit ? unit.dimension : count;
+    const measure = acc.measures.get(slot);
+    const amount = unit ? parsed.amount * unit.factor : parsed.amount;
+    if (measure) measure.amount += amount;
+    else acc.measures.set(slot, { amount, dimension: unit?.dimension, metric: unit?.metric ?? false });
+  }
+
+  return Array.from(byKey.values(), (acc) => {
+    acc.merged.quantity = formatQuantity(acc as Accumulator<MergeInput>);
+    return acc.merged;
+  });
+}
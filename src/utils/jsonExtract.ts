@@ -0,0 +1,129 @@
+/**
+ * Pull a JSON payload out of model output that may be bare JSON, wrapped in
+ * a ```json fence, or surrounded by prose, and validate it against a schema.
+ *
+ * The text is scanned once to find the first `{`/`[` and its matching
+ * close (tracking string and escape state), and only that slice is handed
+ * to JSON.parse. If a candidate is not JSON, or is JSON of the wrong shape
+ * (prose such as "[note]" or "[1]"), scanning resumes after it, so a pass
+ * is linear in the text. An opener that is never closed ("see step [1
+ * below") is skipped, up to a fixed number per pass. Only when a whole
+ * pass finds nothing are the spans that failed to parse searched inside
+ * (prose like "[recipe: {…}]"), to a fixed depth.
+ */
+
+import { Schema } from './schema';
+
+/** Levels of failed spans searched inside before giving up. */
+const MAX_FALLBACK_DEPTH = 2;
+/** Unclosed openers skipped per pass; each one costs a scan to the end. */
+const MAX_UNCLOSED = 8;
+
+const NOT_JSON = Symbol('not JSON');
+
+interface ScanState {
+  // If nothing fits, report the mismatch for the largest candidate.
+  schemaError: unknown;
+  schemaErrorSize: number;
+}
+
+/** Index of the bracket that closes the one at `start`, before `to`, or -1. */
+function matchingClose(text: string, start: number, to: number): number {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+  for (let i = start; i < to; i++) {
+    const ch = text.charCodeAt(i);
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === 92 /* \ */) escaped = true;
+      else if (ch === 34 /* " */) inString = false;
+    } else if (ch === 34) {
+      inString = true;
+    } else if (ch === 123 /* { */ || ch === 91 /* [ */) {
+      depth++;
+    } else if (ch === 125 /* } */ || ch === 93 /* ] */) {
+      if (--depth === 0) return i;
+    }
+  }
+  return -1;
+}
+
+function nextOpen(text: string, from: number, to: number): number {
+  for (let i = from; i < to; i++) {
+    const ch = text.charCodeAt(i);
+    if (ch === 123 || ch === 91) return i;
+  }
+  return -1;
+}
+
+/** An object must open with a key or close at once; "{x}" is prose. */
+function cannotBeObject(text: string, start: number): boolean {
+  if (text.charCodeAt(start) !== 123) return false;
+  for (let i = start + 1; i < text.length; i++) {
+    const ch = text.charCodeAt(i);
+    if (ch !== 32 && ch !== 9 && ch !== 10 && ch !== 13) return ch !== 34 && ch !== 125;
+  }
+  return true;
+}
+
+/** First candidate in text[from, to) that parses and fits the schema. */
+function scan<T>(
+  text: string,
+  from: number,
+  to: number,
+  schema: Schema<T>,
+  state: ScanState,
+  depth: number,
+): { value: T } | null {
+  const failed: number[] = [];
+  let unclosed = 0;
+  let start = nextOpen(text, from, to);
+  while (start !== -1) {
+    const end = matchingClose(text, start, to);
+    if (end === -1) {
+      // A stray bracket in the prose; the payload may still follow it.
+      if (++unclosed > MAX_UNCLOSED) break;
+      start = nextOpen(text, start + 1, to);
+      continue;
+    }
+    let value: unknown = NOT_JSON;
+    if (!cannotBeObject(text, start)) {
+      try {
+        value = JSON.parse(start === 0 && end === text.length - 1 ? text : text.slice(start, end + 1));
+      } catch {
+        // Not JSON; handled below.
+      }
+    }
+    if (value === NOT_JSON) {
+      failed.push(start, end);
+      start = nextOpen(text, end + 1, to);
+      continue;
+    }
+    try {
+      return { value: schema(value, '$') };
+    } catch (error) {
+      // Valid JSON of the wrong shape, e.g. a "[1]" footnote in the prose.
+      if (end - start > state.schemaErrorSize) {
+        state.schemaError = error;
+        state.schemaErrorSize = end - start;
+      }
+      start = nextOpen(text, end + 1, to);
+    }
+  }
+  if (depth < MAX_FALLBACK_DEPTH) {
+    for (let i = 0; i < failed.length; i += 2) {
+      const found = scan(text, failed[i] + 1, failed[i + 1], schema, state, depth + 1);
+      if (found) return found;
+    }
+  }
+  return null;
+}
+
+export function extractJSON<T>(text: string, schema: Schema<T>): T {
+  const state: ScanState = { schemaError: undefined, schemaErrorSize: -1 };
+  const found = scan(text, 0, text.length, schema, state, 0);
+  if (found) return found.value;
+  if (state.schemaError) throw state.schemaError;
+  throw new Error('Could not parse JSON from AI response');
+}
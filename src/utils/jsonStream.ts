@@ -0,0 +1,68 @@
+/**
+ * Incremental parser for a streamed top-level JSON array of objects.
+ *
+ * Feed it text as it arrives; each call returns the array elements whose
+ * closing brace arrived in that chunk, already parsed. Text before the
+ * opening `[` (e.g. a ```json fence) and after the closing `]` is ignored.
+ * Only brace depth and string/escape state are tracked, so every element
+ * is handed to `JSON.parse` exactly once.
+ */
+export class JSONArrayStreamParser<T = unknown> {
+  private started = false;
+  private done = false;
+  private depth = 0;
+  private inString = false;
+  private escaped = false;
+  private element: string[] = [];
+
+  feed(chunk: string): T[] {
+    const out: T[] = [];
+    let start = -1; // start of the current element within this chunk
+
+    for (let i = 0; i < chunk.length && !this.done; i++) {
+      const ch = chunk[i];
+
+      if (!this.started) {
+        if (ch === '[') this.started = true;
+        continue;
+      }
+
+      if (this.inString) {
+        if (this.escaped) this.escaped = false;
+        else if (ch === '\\') this.escaped = true;
+        else if (ch === '"') this.inString = false;
+        continue;
+      }
+
+      if (ch === '"') {
+        this.inString = true;
+      } else if (ch === '{' || ch === '[') {
+        if (this.depth === 0) start = i;
+        this.depth++;
+      } else if (ch === '}' || ch === ']') {
+        if (this.depth === 0) {
+          // Closing bracket of the top-level array.
+          this.done = true;
+          break;
+        }
+        this.depth--;
+        if (this.depth === 0) {
+          this.element.push(chunk.slice(start === -1 ? 0 : start, i + 1));
+          out.push(JSON.parse(this.element.join('')) as T);
+          this.element = [];
+          start = -1;
+        }
+      }
+    }
+
+    if (this.depth > 0) {
+      this.element.push(chunk.slice(start === -1 ? 0 : start));
+    }
+    return out;
+  }
+
+  /** True once the closing `]` of the top-level array has been seen. */
+  get complete(): boolean {
+    return this.done;
+  }
+}
@@ -0,0 +1,86 @@
+/**
+ * Per-day nutrition rollups. Each logged date keeps running totals, and the
+ * dates themselves are kept sorted, so a week or month query binary-searches
+ * its bounds and sums one rollup per day instead of rescanning every meal.
+ */
+
+export interface NutrientTotals {
+  calories: number;
+  protein: number; // g
+  carbs: number; // g
+  fat: number; // g
+  fiber: number; // g
+  sodium: number; // mg
+}
+
+export interface DayRollup extends NutrientTotals {
+  date: string; // YYYY-MM-DD
+  meals: number;
+}
+
+export interface RangeTotals extends NutrientTotals {
+  days: number;   // days in range with at least one meal
+  meals: number;
+}
+
+const NUTRIENTS: (keyof NutrientTotals)[] = ['calories', 'protein', 'carbs', 'fat', 'fiber', 'sodium'];
+
+export const emptyRollup = (date: string): DayRollup => ({
+  date,
+  meals: 0,
+  calories: 0,
+  protein: 0,
+  carbs: 0,
+  fat: 0,
+  fiber: 0,
+  sodium: 0,
+});
+
+/** `rollup` with `entry` added (`sign` 1) or removed (`sign` -1). */
+export function applyToRollup(rollup: DayRollup, entry: NutrientTotals, sign: 1 | -1): DayRollup {
+  const next = { ...rollup, meals: rollup.meals + sign };
+  for (const key of NUTRIENTS) next[key] += sign * entry[key];
+  return next;
+}
+
+/** First index in sorted `dates` whose value is >= `date`. */
+export function lowerBound(dates: string[], date: string): number {
+  let lo = 0;
+  let hi = dates.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (dates[mid] < date) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+/** Copy of sorted `dates` with `date` inserted, or `dates` itself if present. */
+export function insertDate(dates: string[], date: string): string[] {
+  const at = lowerBound(dates, date);
+  if (dates[at] === date) return dates;
+  return [...dates.slice(0, at), date, ...dates.slice(at)];
+}
+
+export function removeDate(dates: string[], date: string): string[] {
+  const at = lowerBound(dates, date);
+  if (dates[at] !== date) return dates;
+  return [...dates.slice(0, at), ...dates.slice(at + 1)];
+}
+
+/** Totals over [start, end] (inclusive YYYY-MM-DD bounds). */
+export function sumRange(
+  dates: string[],
+  rollups: Record<string, DayRollup>,
+  start: string,
+  end: string,
+): RangeTotals {
+  const totals: RangeTotals = { days: 0, meals: 0, calories: 0, protein: 0, carbs: 0, fat: 0, fiber: 0, sodium: 0 };
+  for (let i = lowerBound(dates, start); i < dates.length && dates[i] <= end; i++) {
+    const day = rollups[dates[i]];
+    totals.days++;
+    totals.meals += day.meals;
+    for (const key of NUTRIENTS) totals[key] += day[key];
+  }
+  return totals;
+}
@@ -0,0 +1,136 @@
+/**
+ * Pantry search index. Names are normalized once and every word's
+ * prefixes map to the (ascending) positions of the ingredients containing
+ * it, so search-as-you-type is a few map lookups and a sorted-list
+ * intersection instead of lower-casing the whole pantry per keystroke.
+ *
+ * Expiry is bucketed separately against a day key, so it only needs
+ * recomputing when the pantry changes or the date rolls over.
+ */
+
+import { Ingredient } from '../types/ingredient';
+
+/** Longer query words are looked up by this prefix, then verified. */
+const MAX_PREFIX = 10;
+export const EXPIRING_WITHIN_DAYS = 3;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+export interface PantrySearchIndex {
+  ingredients: Ingredient[];
+  names: string[];                       // display names, pantry order
+  normalized: string[];                  // lower-cased, whitespace collapsed
+  prefixes: Map<string, number[]>;       // word prefix → positions
+  surplus: number[];
+}
+
+export interface ExpiryBuckets {
+  day: string;                           // YYYY-MM-DD the buckets are for
+  expired: number[];                     // past their expiry date
+  soon: number[];                        // within EXPIRING_WITHIN_DAYS
+  fresh: number[];
+}
+
+export const normalizeName = (text: string) => text.trim().toLowerCase().replace(/\s+/g, ' ');
+
+const words = (normalized: string) => normalized.split(/[\s\-_,.()/&]+/).filter(Boolean);
+
+/** YYYY-MM-DD, in the same (UTC) form the app writes expiry dates in. */
+export const isoDay = (time: number) => new Date(time).toISOString().slice(0, 10);
+
+export function buildSearchIndex(ingredients: Ingredient[]): PantrySearchIndex {
+  const names = new Array<string>(ingredients.length);
+  const normalized = new Array<string>(ingredients.length);
+  const prefixes = new Map<string, number[]>();
+  const surplus: number[] = [];
+
+  ingredients.forEach((ingredient, pos) => {
+    names[pos] = ingredient.name;
+    normalized[pos] = normalizeName(ingredient.name);
+    if (ingredient.isSurplus) surplus.push(pos);
+
+    const seen = new Set<string>();
+    for (const word of words(normalized[pos])) {
+      for (let len = 1; len <= Math.min(word.length, MAX_PREFIX); len++) {
+        const prefix = word.slice(0, len);
+        if (seen.has(prefix)) continue;
+        seen.add(prefix);
+        const list = prefixes.get(prefix);
+        if (list) list.push(pos);
+        else prefixes.set(prefix, [pos]);
+      }
+    }
+  });
+
+  return { ingredients, names, normalized, prefixes, surplus };
+}
+
+export function buildExpiryBuckets(ingredients: Ingredient[], now: number): ExpiryBuckets {
+  const day = isoDay(now);
+  const cutoff = isoDay(now + EXPIRING_WITHIN_DAYS * DAY_MS);
+  const buckets: ExpiryBuckets = { day, expired: [], soon: [], fresh: [] };
+  ingredients.forEach((ingredient, pos) => {
+    // ISO dates order correctly as strings; no Date per ingredient.
+    const expiry = ingredient.expiryDate.slice(0, 10);
+    if (expiry < day) buckets.expired.push(pos);
+    else if (expiry <= cutoff) buckets.soon.push(pos);
+    else buckets.fresh.push(pos);
+  });
+  return buckets;
+}
+
+function intersect(a: number[], b: number[]): number[] {
+  const out: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      out.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) i++;
+    else j++;
+  }
+  return out;
+}
+
+function merge(a: number[], b: number[]): number[] {
+  const out: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length || j < b.length) {
+    if (j >= b.length || (i < a.length && a[i] < b[j])) out.push(a[i++]);
+    else out.push(b[j++]);
+  }
+  return out;
+}
+
+/**
+ * Positions matching every word of `query` as a word prefix, in pantry
+ * order, optionally restricted to `within`.
+ */
+export function searchPositions(index: PantrySearchIndex, query: string, within?: number[]): number[] {
+  const queryWords = words(normalizeName(query));
+  if (queryWords.length === 0) return within ?? index.ingredients.map((_, pos) => pos);
+
+  const lists = queryWords.map((word) => {
+    const list = index.prefixes.get(word.slice(0, MAX_PREFIX)) ?? [];
+    return word.length > MAX_PREFIX ? list.filter((pos) => index.normalized[pos].includes(word)) : list;
+  });
+  if (within) lists.push(within);
+  lists.sort((a, b) => a.length - b.length);
+  return lists.reduce(intersect);
+}
+
+export type PantryFilter = 'All' | 'Expiring' | 'Surplus';
+
+export function filterPantry(
+  index: PantrySearchIndex,
+  buckets: ExpiryBuckets,
+  filter: PantryFilter,
+  query: string,
+): Ingredient[] {
+  const within =
+    filter === 'Expiring' ? merge(buckets.expired, buckets.soon) : filter === 'Surplus' ? index.surplus : undefined;
+  if (!query.trim() && !within) return index.ingredients;
+  return searchPositions(index, query, within).map((pos) => index.ingredients[pos]);
+}
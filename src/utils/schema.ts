@@ -0,0 +1,80 @@
+/**
+ * Minimal runtime schemas for model output. A schema is a function that
+ * checks an `unknown` value and returns it typed (and lightly normalized),
+ * or throws a SchemaError naming the offending path, e.g.
+ * `$[2].nutritionEstimate.calories: expected number, got "n/a"`.
+ *
+ * Objects keep only the declared keys, so stray fields from the model never
+ * leak into app state.
+ */
+
+export class SchemaError extends Error {
+  constructor(path: string, expected: string, value: unknown) {
+    const got = value === undefined ? 'undefined' : JSON.stringify(value)?.slice(0, 40);
+    super(`${path}: expected ${expected}, got ${got}`);
+    this.name = 'SchemaError';
+  }
+}
+
+export type Schema<T> = (value: unknown, path: string) => T;
+
+export type Infer<S> = S extends Schema<infer T> ? T : never;
+
+export const str: Schema<string> = (value, path) => {
+  if (typeof value === 'string') return value;
+  if (typeof value === 'number') return String(value);
+  throw new SchemaError(path, 'string', value);
+};
+
+/** Numbers, also accepting numeric strings ("25", "25g") since models emit both. */
+export const num: Schema<number> = (value, path) => {
+  if (typeof value === 'number' && Number.isFinite(value)) return value;
+  if (typeof value === 'string') {
+    const parsed = parseFloat(value);
+    if (Number.isFinite(parsed)) return parsed;
+  }
+  throw new SchemaError(path, 'number', value);
+};
+
+export const oneOf =
+  <T extends string>(values: readonly T[], fallback?: T): Schema<T> =>
+  (value, path) => {
+    if (values.includes(value as T)) return value as T;
+    if (fallback !== undefined) return fallback;
+    throw new SchemaError(path, values.join(' | '), value);
+  };
+
+/** `undefined` when missing or null. */
+export const optional =
+  <T>(schema: Schema<T>): Schema<T | undefined> =>
+  (value, path) =>
+    value === undefined || value === null ? undefined : schema(value, path);
+
+/** `fallback` when missing or null. */
+export const withDefault =
+  <T>(schema: Schema<T>, fallback: T): Schema<T> =>
+  (value, path) =>
+    value === undefined || value === null ? fallback : schema(value, path);
+
+export const arrayOf =
+  <T>(item: Schema<T>): Schema<T[]> =>
+  (value, path) => {
+    if (!Array.isArray(value)) throw new SchemaError(path, 'array', value);
+    const out: T[] = new Array(value.length);
+    for (let i = 0; i < value.length; i++) out[i] = item(value[i], `${path}[${i}]`);
+    return out;
+  };
+
+export const object =
+  <S extends Record<string, Schema<unknown>>>(shape: S): Schema<{ [K in keyof S]: Infer<S[K]> }> =>
+  (value, path) => {
+    if (typeof value !== 'object' || value === null || Array.isArray(value)) {
+      throw new SchemaError(path, 'object', value);
+    }
+    const input = value as Record<string, unknown>;
+    const out: Record<string, unknown> = {};
+    for (const key of Object.keys(shape)) {
+      out[key] = shape[key](input[key], `${path}.${key}`);
+    }
+    return out as { [K in keyof S]: Infer<S[K]> };
+  };
@@ -0,0 +1,32 @@
+/**
+ * Startup phase marks. App.tsx imports this first, so times are measured
+ * from (roughly) when the JS bundle started evaluating. Each phase is
+ * recorded once; later marks with the same name are ignored.
+ */
+
+export interface StartupMark {
+  phase: string;
+  /** Milliseconds since bundle start. */
+  at: number;
+}
+
+const origin = performance.now();
+const marks: StartupMark[] = [];
+const seen = new Set<string>();
+
+export function markStartup(phase: string): void {
+  if (seen.has(phase)) return;
+  seen.add(phase);
+  marks.push({ phase, at: Math.round(performance.now() - origin) });
+}
+
+export function getStartupMarks(): StartupMark[] {
+  return marks.slice();
+}
+
+/** One line per phase with its time and the gap since the previous mark. */
+export function formatStartupMarks(): string {
+  return marks
+    .map((m, i) => `${m.phase.padEnd(28)} ${String(m.at).padStart(6)}ms  (+${m.at - (i > 0 ? marks[i - 1].at : 0)})`)
+    .join('\n');
+}
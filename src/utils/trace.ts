@@ -0,0 +1,141 @@
+/**
+ * Hot-path tracing. Gemini calls, store mutations and screen renders are
+ * recorded into a fixed-size ring buffer in memory (the oldest events are
+ * overwritten) and can be exported as JSON from a real session. Tracing is
+ * off by default; while it is off every entry point returns after a single
+ * boolean check, and spans are one shared no-op object.
+ */
+
+import { getStartupMarks } from './startupTiming';
+
+export type TraceKind = 'gemini' | 'store';
+
+export interface TraceEvent {
+  kind: TraceKind;
+  name: string;
+  /** Milliseconds since tracing was enabled. */
+  at: number;
+  ms: number;
+  /** Gemini calls: time spent in each phase, in order. */
+  phases?: Record<string, number>;
+  detail?: Record<string, unknown>;
+}
+
+export interface Span {
+  /** Close the current phase (everything since the previous mark) as `name`. */
+  phase: (name: string) => void;
+  /** Record the span; later calls are ignored. */
+  end: (detail?: Record<string, unknown>) => void;
+}
+
+interface TraceSummary {
+  count: number;
+  totalMs: number;
+  maxMs: number;
+}
+
+const DEFAULT_CAPACITY = 2000;
+
+let enabled = false;
+let origin = 0;
+let buffer: (TraceEvent | undefined)[] = new Array(DEFAULT_CAPACITY);
+let next = 0;
+let dropped = 0;
+const renderCounts = new Map<string, number>();
+
+const round = (ms: number) => Math.round(ms * 100) / 100;
+
+const NOOP_SPAN: Span = { phase: () => {}, end: () => {} };
+
+export function isTracing(): boolean {
+  return enabled;
+}
+
+/** Turn tracing on or off. Enabling starts a fresh buffer. */
+export function setTracingEnabled(on: boolean, capacity: number = DEFAULT_CAPACITY): void {
+  if (on && !enabled) {
+    buffer = new Array(capacity);
+    next = 0;
+    dropped = 0;
+    renderCounts.clear();
+    origin = performance.now();
+  }
+  enabled = on;
+}
+
+export function recordTrace(event: Omit<TraceEvent, 'at'> & { at?: number }): void {
+  if (!enabled) return;
+  const slot = next % buffer.length;
+  if (buffer[slot]) dropped++;
+  buffer[slot] = { ...event, at: round(event.at ?? performance.now() - origin), ms: round(event.ms) };
+  next++;
+}
+
+/** Start timing a multi-phase operation. */
+export function startSpan(kind: TraceKind, name: string): Span {
+  if (!enabled) return NOOP_SPAN;
+  const started = performance.now();
+  let last = started;
+  let ended = false;
+  const phases: Record<string, number> = {};
+  return {
+    phase: (phase) => {
+      const now = performance.now();
+      phases[phase] = round((phases[phase] ?? 0) + now - last);
+      last = now;
+    },
+    end: (detail) => {
+      if (ended) return;
+      ended = true;
+      const ms = performance.now() - started;
+      recordTrace({ kind, name, at: started - origin, ms, phases: Object.keys(phases).length > 0 ? phases : undefined, detail });
+    },
+  };
+}
+
+/** Count a render of `name`. Call from the component body. */
+export function traceRender(name: string): void {
+  if (!enabled) return;
+  renderCounts.set(name, (renderCounts.get(name) ?? 0) + 1);
+}
+
+/** Buffered events, oldest first. */
+export function getTraceEvents(): TraceEvent[] {
+  const size = Math.min(next, buffer.length);
+  const out: TraceEvent[] = [];
+  for (let i = next - size; i < next; i++) out.push(buffer[i % buffer.length]!);
+  return out;
+}
+
+/**
+ * The buffer as JSON, with per-name totals (`gemini:extractRecipeFromUrl`,
+ * `store:cart`), render counts and the startup phase marks. Summaries
+ * cover buffered events only.
+ */
+export function exportTrace(): string {
+  const events = getTraceEvents();
+  const summary: Record<string, TraceSummary> = {};
+  for (const e of events) {
+    const s = (summary[`${e.kind}:${e.name}`] ??= { count: 0, totalMs: 0, maxMs: 0 });
+    s.count++;
+    s.totalMs = round(s.totalMs + e.ms);
+    if (e.ms > s.maxMs) s.maxMs = e.ms;
+  }
+  return JSON.stringify({
+    exportedAt: new Date().toISOString(),
+    enabled,
+    capacity: buffer.length,
+    dropped,
+    renders: Object.fromEntries(renderCounts),
+    startup: getStartupMarks(),
+    summary,
+    events,
+  });
+}
+
+export function clearTrace(): void {
+  buffer = new Array(buffer.length);
+  next = 0;
+  dropped = 0;
+  renderCounts.clear();
+}